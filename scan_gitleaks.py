@@ -7,7 +7,10 @@ using Gitleaks. It generates detailed reports showing the actual secret values f
 """
 
 import argparse
+import asyncio
+import base64
 import concurrent.futures
+import dataclasses
 import datetime
 import json
 import logging
@@ -16,38 +19,155 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
 import requests
 from src.github.rate_limit import make_rate_limited_session, request_with_rate_limit
+from src.github.http_cache import ConditionalRequestCache
 from dotenv import load_dotenv
 
+try:
+    import ijson  # optional: stream-parse large gitleaks reports
+except Exception:
+    ijson = None
+
+try:
+    import orjson  # optional: faster whole-document JSON decoding
+except Exception:
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv(override=True)
 
+# External binaries resolved once at import instead of searching PATH per repository
+GITLEAKS_BIN = shutil.which('gitleaks')
+GIT_BIN = shutil.which('git') or 'git'
+
+# Reports smaller than this are parsed in one go (also handles non-list payloads)
+STREAM_PARSE_MIN_BYTES = 4096
+
+# Files larger than this are skipped by gitleaks (rarely scannable, expensive to regex)
+MAX_TARGET_MEGABYTES = 50
+
+# Paths never checked out (nor their blobs fetched) unless --full-clone is given:
+# vendored dependencies, build output and minified/source-map artifacts
+SPARSE_EXCLUDES = ['!node_modules/', '!vendor/', '!dist/', '!build/', '!*.min.js', '!*.map']
+
+# Upper bound on concurrent repository listing page requests
+MAX_PAGE_FETCH_WORKERS = 8
+
+# Concurrent git clone/fetch subprocesses (network-bound)
+CLONE_CONCURRENCY = 20
+
+# Markdown block for one finding; fields missing from a finding render as N/A
+FINDING_TMPL = (
+    "### Secret {idx}\n"
+    "- **File:** `{File}`\n"
+    "- **Line:** {StartLine}\n"
+    "- **Rule ID:** {RuleID}\n"
+    "- **Description:** {RuleDescription}\n"
+    "- **Secret:** `{Secret}`\n"
+    "- **Match:** `{Match}`\n"
+    "- **Commit:** {Commit}\n"
+    "- **Author:** {Author} ({Email})\n"
+    "- **Date:** {Date}\n"
+    "\n---\n\n"
+)
+_FINDING_DEFAULTS: Dict[str, str] = dict.fromkeys(
+    ('File', 'StartLine', 'RuleID', 'Secret', 'Match', 'Commit', 'Author', 'Email', 'Date'), 'N/A'
+)
+
+# Local ref under which a fork's parent HEAD is fetched
+PARENT_REF = "refs/auditgh/parent"
+
+# Per-repo record of the last scanned commit, relative to REPORT_DIR
+LAST_SHA_FILE = ".last_sha.json"
+
+def _keep_https(clone_url: str, ssh_url: Optional[str] = None) -> str:
+    """With a token, clone over plain HTTPS; credentials travel in the git environment."""
+    return clone_url
+
+def _git_auth_env(token: str) -> Dict[str, str]:
+    """Environment additions for git subprocesses that authenticate via an HTTP header.
+
+    Keeps the token out of argv and out of the cached clones' .git/config, so a
+    rotated or expired token never breaks later fetches; lazy blob fetches from
+    partial clones (including gitleaks' own git calls) pick up the same header.
+    """
+    env = {"GIT_TERMINAL_PROMPT": "0"}
+    if token:
+        basic = base64.b64encode(f"x-access-token:{token}".encode()).decode()
+        env.update({
+            "GIT_CONFIG_COUNT": "1",
+            "GIT_CONFIG_KEY_0": "http.extraHeader",
+            "GIT_CONFIG_VALUE_0": f"Authorization: Basic {basic}",
+        })
+    return env
+
+def _prefer_ssh(clone_url: str, ssh_url: Optional[str] = None) -> str:
+    """Without a token, clone over SSH when the API provides an SSH URL."""
+    return ssh_url or clone_url
+
+@dataclass(frozen=True)
 class GitleaksConfig:
-    """Configuration for the Gitleaks scanner."""
-    
-    def __init__(self):
+    """Configuration for the Gitleaks scanner.
+
+    Immutable so it can be shared with (and pickled to) scan worker processes; use
+    ``dataclasses.replace`` to apply overrides.
+    """
+    GITHUB_TOKEN: str
+    ORG_NAME: str
+    GITHUB_API: str = "https://api.github.com"
+    REPORT_DIR: Path = Path(os.path.abspath("secrets_reports"))
+    # Persistent clone cache reused (and fetched into) across runs
+    CLONE_DIR: Path = Path("~/.cache/auditgh/repos").expanduser().absolute()
+    # Number of repositories scanned concurrently; used to size each gitleaks run
+    SCAN_WORKERS: int = 1
+    # Full checkout instead of a partial clone with sparse excludes
+    FULL_CLONE: bool = False
+    # Keep gitleaks' JSON report on disk instead of streaming it from stdout
+    KEEP_JSON: bool = False
+    HEADERS: Dict[str, str] = field(init=False, repr=False, compare=False)
+    # Maps (clone_url, ssh_url) to the URL to clone, with the token check resolved once
+    clone_url_rewriter: Callable[..., str] = field(init=False, repr=False, compare=False)
+    # Extra environment for git subprocesses (token as an HTTP header, never in URLs)
+    GIT_ENV: Dict[str, str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'HEADERS', {
+            "Authorization": f"token {self.GITHUB_TOKEN}",
+            "Accept": "application/vnd.github.v3+json"
+        })
+        rewriter = _keep_https if self.GITHUB_TOKEN else _prefer_ssh
+        object.__setattr__(self, 'clone_url_rewriter', rewriter)
+        object.__setattr__(self, 'GIT_ENV', _git_auth_env(self.GITHUB_TOKEN))
+    
+    @classmethod
+    def from_env(cls) -> "GitleaksConfig":
+        """Build the configuration from environment variables (and .env)."""
         # Load required environment variables
-        self.GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
-        self.ORG_NAME = os.getenv("GITHUB_ORG")
+        github_token = os.getenv("GITHUB_TOKEN")
+        org_name = os.getenv("GITHUB_ORG")
         
         # Validate required environment variables
-        if not self.GITHUB_TOKEN:
+        if not github_token:
             raise ValueError("GITHUB_TOKEN environment variable is required")
-        if not self.ORG_NAME:
+        if not org_name:
             raise ValueError("GITHUB_ORG environment variable is required")
-            
+        
         # Set other configuration with defaults
-        self.GITHUB_API = os.getenv("GITHUB_API", "https://api.github.com")
-        self.REPORT_DIR = os.path.abspath(os.getenv("REPORT_DIR", "secrets_reports"))
-        self.CLONE_DIR = None
-        self.HEADERS = {
-            "Authorization": f"token {self.GITHUB_TOKEN}",
-            "Accept": "application/vnd.github.v3+json"
-        }
+        return cls(
+            GITHUB_TOKEN=github_token,
+            ORG_NAME=org_name,
+            GITHUB_API=os.getenv("GITHUB_API", "https://api.github.com"),
+            REPORT_DIR=Path(os.path.abspath(os.getenv("REPORT_DIR", "secrets_reports"))),
+            CLONE_DIR=Path(os.path.abspath(os.path.expanduser(
+                os.getenv("CLONE_DIR", "~/.cache/auditgh/repos")))),
+        )
 
 # Global config instance
 config = None
@@ -74,9 +194,15 @@ def setup_logging(verbosity: int = 1):
     )
 
 def make_session() -> requests.Session:
-    """Create a session with rate-limit aware retries and auth headers."""
+    """Create a session with rate-limit aware retries, auth headers and an ETag cache."""
     token = config.GITHUB_TOKEN if config else None
-    return make_rate_limited_session(token, user_agent="auditgh-gitleaks")
+    cache = None
+    if config:
+        cache = ConditionalRequestCache(
+            str(config.REPORT_DIR / '.gh_cache.sqlite'),
+            logger=logging.getLogger('gitleaks.cache'),
+        )
+    return make_rate_limited_session(token, user_agent="auditgh-gitleaks", cache=cache)
 
 def _filter_page_repos(page_repos: List[Dict[str, Any]], include_forks: bool, include_archived: bool) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
@@ -86,44 +212,85 @@ def _filter_page_repos(page_repos: List[Dict[str, Any]], include_forks: bool, in
         out.append(repo)
     return out
 
+def _last_page(resp: requests.Response) -> int:
+    """Return the page number of the ``rel="last"`` Link header (1 if absent)."""
+    last_url = resp.links.get('last', {}).get('url')
+    if not last_url:
+        return 1
+    try:
+        return int(parse_qs(urlparse(last_url).query).get('page', ['1'])[0])
+    except ValueError:
+        return 1
+
 def get_all_repos(session: requests.Session, include_forks: bool = False,
                   include_archived: bool = False) -> List[Dict[str, Any]]:
     """Fetch all repositories from an org, with fallback to user if org not found.
 
     Tries /orgs/{name}/repos first. If the first page returns 404, retries with /users/{name}/repos.
+    The first page reveals the page count (Link rel="last"); the remaining pages are then
+    fetched concurrently, bounded by the remaining rate-limit budget.
     """
-    repos: List[Dict[str, Any]] = []
-    page = 1
     per_page = 100
+    log = logging.getLogger('gitleaks.api')
+    
+    def fetch_page(url: str, page: int) -> requests.Response:
+        params = {"type": "all", "per_page": per_page, "page": page}
+        return request_with_rate_limit(session, 'GET', url, params=params, timeout=30, logger=log)
+    
+    repos: List[Dict[str, Any]] = []
+    try:
+        url = f"{config.GITHUB_API}/orgs/{config.ORG_NAME}/repos"
+        resp = fetch_page(url, 1)
+        if resp.status_code == 404:
+            logging.info(f"Organization '{config.ORG_NAME}' not found or inaccessible. Retrying as a user account...")
+            url = f"{config.GITHUB_API}/users/{config.ORG_NAME}/repos"
+            resp = fetch_page(url, 1)
+        resp.raise_for_status()
+        repos.extend(_filter_page_repos(resp.json() or [], include_forks, include_archived))
+        
+        last_page = _last_page(resp)
+        if last_page > 1:
+            try:
+                remaining = int(resp.headers.get('X-RateLimit-Remaining', '0'))
+            except ValueError:
+                remaining = 0
+            max_workers = max(1, min(MAX_PAGE_FETCH_WORKERS, remaining // 10))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # map() yields in page order, keeping the listing order stable
+                for page_resp in executor.map(lambda page: fetch_page(url, page), range(2, last_page + 1)):
+                    page_resp.raise_for_status()
+                    repos.extend(_filter_page_repos(page_resp.json() or [], include_forks, include_archived))
+    except requests.exceptions.RequestException as e:
+        logging.error(f"Error fetching repositories: {e}")
+    
+    return repos
 
-    is_user_fallback = False
+def attach_fork_parents(session: requests.Session, repos: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Fill in ``repo['parent']`` for forks (the list endpoint omits it).
 
-    while True:
-        base = "users" if is_user_fallback else "orgs"
-        url = f"{config.GITHUB_API}/{base}/{config.ORG_NAME}/repos"
-        params = {"type": "all", "per_page": per_page, "page": page}
+    Returns the fork groups as ``parent_full_name -> [fork_full_name, ...]``.
+    """
+    forks = [repo for repo in repos if repo.get('fork') and not repo.get('parent')]
+    log = logging.getLogger('gitleaks.api')
+    
+    def fetch_parent(repo: Dict[str, Any]):
+        url = f"{config.GITHUB_API}/repos/{repo['full_name']}"
         try:
-            resp = request_with_rate_limit(session, 'GET', url, params=params, timeout=30, logger=logging.getLogger('gitleaks.api'))
-            if not is_user_fallback and page == 1 and resp.status_code == 404:
-                logging.info(f"Organization '{config.ORG_NAME}' not found or inaccessible. Retrying as a user account...")
-                # switch to user mode and restart pagination
-                is_user_fallback = True
-                page = 1
-                repos.clear()
-                continue
+            resp = request_with_rate_limit(session, 'GET', url, timeout=30, logger=log)
             resp.raise_for_status()
-            page_repos = resp.json() or []
-            if not page_repos:
-                break
-            repos.extend(_filter_page_repos(page_repos, include_forks, include_archived))
-            if len(page_repos) < per_page:
-                break
-            page += 1
+            repo['parent'] = (resp.json() or {}).get('parent')
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching repositories: {e}")
-            break
-
-    return repos
+            logging.error(f"Error fetching parent of fork {repo['full_name']}: {e}")
+    
+    if forks:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_PAGE_FETCH_WORKERS) as executor:
+            list(executor.map(fetch_parent, forks))
+    
+    fork_groups: Dict[str, List[str]] = defaultdict(list)
+    for repo in repos:
+        if repo.get('fork') and repo.get('parent'):
+            fork_groups[repo['parent']['full_name']].append(repo['full_name'])
+    return dict(fork_groups)
 
 def get_single_repo(session: requests.Session, repo_identifier: str) -> Optional[Dict[str, Any]]:
     """Fetch a single repository by name or owner/name."""
@@ -143,143 +310,366 @@ def get_single_repo(session: requests.Session, repo_identifier: str) -> Optional
         logging.error(f"Error fetching repository {repo_identifier}: {e}")
         return None
 
-def clone_repo(repo: Dict[str, Any]) -> Optional[str]:
-    """Clone a repository from GitHub."""
-    if not config.CLONE_DIR:
-        config.CLONE_DIR = tempfile.mkdtemp(prefix="repo_scan_")
-    
+async def _run_git_async(cmd: List[str]) -> Tuple[int, str]:
+    """Run a git command without blocking the event loop; returns (returncode, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, **config.GIT_ENV}
+    )
+    _, stderr = await proc.communicate()
+    return proc.returncode, stderr.decode(errors='replace')
+
+async def clone_repo_async(repo: Dict[str, Any]) -> Optional[str]:
+    """Clone (or update the cached clone of) a repository from GitHub."""
     repo_name = repo['name']
-    clone_url = repo['clone_url']
+    clone_url = config.clone_url_rewriter(repo['clone_url'], repo.get('ssh_url'))
     
-    if not config.GITHUB_TOKEN and 'ssh_url' in repo:
-        clone_url = repo['ssh_url']
-    elif config.GITHUB_TOKEN and clone_url.startswith('https://'):
-        if '@' not in clone_url:
-            clone_url = clone_url.replace('https://', f'https://x-access-token:{config.GITHUB_TOKEN}@')
+    # Keyed by owner/name so same-named repos of different owners never share a clone
+    repo_path = str(config.CLONE_DIR / repo['full_name'])
     
-    repo_path = os.path.join(config.CLONE_DIR, repo_name)
+    parent = repo.get('parent') if repo.get('fork') else None
+    if parent:
+        # Forks are scanned in git mode against their parent: a blobless,
+        # checkout-less full-history clone only downloads the blobs of commits
+        # gitleaks actually walks (the fork's own ones)
+        if os.path.exists(repo_path):
+            logging.info(f"Updating existing fork: {repo_name}")
+            cmds = [
+                # Older caches were cloned from a token-bearing URL: reset it to the plain one
+                [GIT_BIN, '-C', repo_path, 'remote', 'set-url', 'origin', clone_url],
+                [GIT_BIN, '-C', repo_path, 'fetch', '--prune', 'origin'],
+                [GIT_BIN, '-C', repo_path, 'reset', '--soft', 'origin/HEAD'],
+            ]
+        else:
+            logging.info(f"Cloning fork (history only): {repo_name}")
+            cmds = [[GIT_BIN, 'clone', '--filter=blob:none', '--no-checkout', clone_url, repo_path]]
+    elif os.path.exists(repo_path):
+        logging.info(f"Updating existing repository: {repo_name}")
+        cmds = [
+            [GIT_BIN, '-C', repo_path, 'remote', 'set-url', 'origin', clone_url],
+            [GIT_BIN, '-C', repo_path, 'fetch', '--prune', 'origin'],
+            [GIT_BIN, '-C', repo_path, 'reset', '--hard', 'origin/HEAD'],
+        ]
+    elif config.FULL_CLONE:
+        logging.info(f"Cloning repository: {repo_name}")
+        cmds = [[GIT_BIN, 'clone', '--depth', '1', clone_url, repo_path]]
+    else:
+        # Partial clone: blobs are only downloaded for paths the sparse
+        # checkout keeps, so vendored/built files never leave the server
+        logging.info(f"Cloning repository (sparse): {repo_name}")
+        cmds = [
+            [GIT_BIN, 'clone', '--filter=blob:none', '--depth', '1', '--no-checkout', clone_url, repo_path],
+            [GIT_BIN, '-C', repo_path, 'sparse-checkout', 'set', '--no-cone', '/*', *SPARSE_EXCLUDES],
+            [GIT_BIN, '-C', repo_path, 'checkout', 'HEAD'],
+        ]
     
+    for cmd in cmds:
+        returncode, stderr = await _run_git_async(cmd)
+        if returncode != 0:
+            logging.error(f"Error cloning/updating repository {repo_name}: {stderr}")
+            return None
+    
+    if parent:
+        parent_url = config.clone_url_rewriter(parent['clone_url'], parent.get('ssh_url'))
+        returncode, stderr = await _run_git_async(
+            [GIT_BIN, '-C', repo_path, 'fetch', '--filter=blob:none', '--no-tags', parent_url,
+             f'+HEAD:{PARENT_REF}']
+        )
+        if returncode != 0:
+            # Without the parent, fall back to a plain tree scan of the fork
+            logging.warning(f"Could not fetch parent {parent['full_name']} of {repo_name}: {stderr}")
+            await _run_git_async([GIT_BIN, '-C', repo_path, 'update-ref', '-d', PARENT_REF])
+            returncode, stderr = await _run_git_async([GIT_BIN, '-C', repo_path, 'checkout', '-f', 'HEAD'])
+            if returncode != 0:
+                logging.error(f"Error checking out fork {repo_name}: {stderr}")
+                return None
+    return repo_path
+
+def load_last_shas(report_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Load the ``full_name -> {"sha", "findings", "scanned_at"}`` map of previously scanned commits."""
     try:
-        if os.path.exists(repo_path):
-            logging.info(f"Updating existing repository: {repo_name}")
-            subprocess.run(
-                ['git', '-C', repo_path, 'fetch', '--all'],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            subprocess.run(
-                ['git', '-C', repo_path, 'reset', '--hard', 'origin/HEAD'],
-                check=True,
-                capture_output=True,
-                text=True
-            )
+        with open(report_dir / LAST_SHA_FILE, 'r') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_last_shas(report_dir: Path, last_shas: Dict[str, Dict[str, Any]]):
+    """Persist the last scanned commit per repository."""
+    path = report_dir / LAST_SHA_FILE
+    tmp_path = path.with_name(f"{LAST_SHA_FILE}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(last_shas, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.error(f"Error writing {path}: {e}")
+
+def split_unchanged_repos(repos: List[Dict[str, Any]], previous_scans: Dict[str, Dict[str, Any]]
+                          ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split repos into (to_scan, unchanged) using GitHub's ``pushed_at`` vs. the last scan time.
+
+    Both timestamps are ISO-8601 UTC strings, so they compare correctly as strings.
+    """
+    to_scan: List[Dict[str, Any]] = []
+    unchanged: List[Dict[str, Any]] = []
+    for repo in repos:
+        scanned_at = previous_scans.get(repo['full_name'], {}).get('scanned_at', '')
+        if scanned_at and (repo.get('pushed_at') or '9999') <= scanned_at:
+            unchanged.append(repo)
         else:
-            logging.info(f"Cloning repository: {repo_name}")
-            subprocess.run(
-                ['git', 'clone', '--depth', '1', clone_url, repo_path],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-        return repo_path
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Error cloning/updating repository {repo_name}: {e.stderr}")
-        return None
+            to_scan.append(repo)
+    return to_scan, unchanged
+
+def _git_rev_parse(repo_path: str, rev: str = 'HEAD') -> Optional[str]:
+    """Return the commit SHA of ``rev`` in repo_path (HEAD by default), or None."""
+    result = subprocess.run(
+        [GIT_BIN, '-C', repo_path, 'rev-parse', '--verify', '--quiet', f'{rev}^{{commit}}'],
+        capture_output=True,
+        text=True
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+def _has_commit(repo_path: str, sha: str) -> bool:
+    """Check whether a commit is present in the local clone (shallow clones may lack it)."""
+    result = subprocess.run(
+        [GIT_BIN, '-C', repo_path, 'cat-file', '-e', f'{sha}^{{commit}}'],
+        capture_output=True,
+        text=True
+    )
+    return result.returncode == 0
+
+def _decode_findings(raw: bytes) -> List[Dict[str, Any]]:
+    """Decode a whole gitleaks report (orjson when installed); tolerates a single object."""
+    if not raw.strip():
+        return []
+    findings = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    if not isinstance(findings, list):
+        findings = [findings] if findings else []
+    return findings
+
+def _iter_findings(output_json: Path):
+    """Yield gitleaks findings one at a time from a report file.
+
+    Large reports are stream-parsed with ijson (when installed) so the whole findings
+    array is never materialized; otherwise the report is decoded in one go.
+    """
+    if ijson is not None and output_json.stat().st_size >= STREAM_PARSE_MIN_BYTES:
+        with open(output_json, 'rb') as json_file:
+            yield from ijson.items(json_file, 'item')
+        return
+    
+    with open(output_json, 'rb') as json_file:
+        yield from _decode_findings(json_file.read())
 
-def run_gitleaks_scan(repo_path: str, repo_name: str, report_dir: str) -> Dict[str, Any]:
-    """Run gitleaks scan on the repository."""
-    os.makedirs(report_dir, exist_ok=True)
-    output_json = os.path.join(report_dir, f"{repo_name}_gitleaks.json")
-    output_md = os.path.join(report_dir, f"{repo_name}_gitleaks.md")
+def _iter_findings_stream(stream):
+    """Yield gitleaks findings from a binary stream (gitleaks' stdout) as they arrive."""
+    if ijson is not None:
+        yield from ijson.items(stream, 'item')
+        return
+    yield from _decode_findings(stream.read())
+
+def _render_findings(findings, append, start: int = 1) -> int:
+    """Append one Markdown block per finding via ``append``, numbered from ``start``;
+    returns how many were rendered."""
+    count = 0
+    for count, finding in enumerate(findings, 1):
+        idx = start + count - 1
+        rule = finding.get('Rule')
+        # One flat dict per finding: the merge runs in C and every template field then
+        # resolves with a single hash lookup instead of walking a chain of mappings.
+        append(FINDING_TMPL.format_map({
+            **_FINDING_DEFAULTS,
+            **finding,
+            'idx': idx,
+            'RuleDescription': (rule.get('Description') if isinstance(rule, dict) else None)
+                               or finding.get('Description', 'N/A'),
+        }))
+    return count
+
+def run_gitleaks_scan(repo_path: str, repo_name: str, report_dir: Path,
+                      prev_sha: Optional[str] = None, scope: Optional[str] = None,
+                      carried_findings: int = 0) -> Dict[str, Any]:
+    """Run gitleaks scan on the repository.
+
+    Without ``prev_sha`` the checked-out tree is scanned (``--no-git``). With it, gitleaks
+    walks git history restricted to ``prev_sha..HEAD`` so only new commits are scanned;
+    ``scope`` optionally describes that range in the report.
+
+    ``carried_findings`` is the count recorded by the previous scan of an incremental
+    one: those findings stay in the report (and the kept JSON) ahead of the new ones,
+    and the returned ``findings_count`` is the running total.
+
+    Unless the JSON report is to be kept (or on Windows), gitleaks writes it to stdout and
+    findings are parsed while the scan is still running, with no intermediate file.
+    """
+    report_dir.mkdir(parents=True, exist_ok=True)
+    output_json = report_dir / f"{repo_name}_gitleaks.json"
+    output_md = report_dir / f"{repo_name}_gitleaks.md"
     
-    if not shutil.which('gitleaks'):
+    if GITLEAKS_BIN is None:
         error_msg = "Gitleaks is not installed. Please install it first: brew install gitleaks"
         logging.error(error_msg)
-        with open(output_md, 'w') as f:
-            f.write(f"# Error\n\n{error_msg}")
+        output_md.write_text(f"# Error\n\n{error_msg}")
         return {
             "error": error_msg,
             "success": False,
-            "report_file": output_md
+            "report_file": str(output_md)
         }
     
+    stream_report = os.name != 'nt' and not (config and config.KEEP_JSON)
+    
+    # Findings of earlier scans, read before this scan overwrites their reports
+    carried_blocks = ""
+    carried_json: List[Dict[str, Any]] = []
+    if carried_findings:
+        try:
+            previous_md = output_md.read_text()
+            start = previous_md.find("### Secret ")
+            carried_blocks = previous_md[start:] if start >= 0 else ""
+        except OSError:
+            pass
+        if not stream_report:
+            try:
+                carried_json = _decode_findings(output_json.read_bytes())
+            except (OSError, ValueError):
+                pass
+    
     try:
         cmd = [
-            'gitleaks',
+            GITLEAKS_BIN,
             'detect',
             '--source', repo_path,
             '--report-format', 'json',
-            '--report-path', output_json,
-            '--verbose',
-            '--no-git'
+            '--max-target-megabytes', str(MAX_TARGET_MEGABYTES)
         ]
+        if stream_report:
+            cmd += ['--report-path', '/dev/stdout']
+        else:
+            # --verbose prints findings to stdout, so only use it when stdout is not the report
+            cmd += ['--report-path', str(output_json), '--verbose']
+        if prev_sha:
+            cmd += ['--log-opts', f'{prev_sha}..HEAD']
+        else:
+            cmd.append('--no-git')
         
-        logging.info(f"Running gitleaks on {repo_name}")
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=repo_path
+        # Share the cores between concurrently scanned repos so one large repo can
+        # still use idle cores without every gitleaks process claiming all of them
+        inner_threads = max(1, (os.cpu_count() or 1) // max(1, config.SCAN_WORKERS if config else 1))
+        env = dict(os.environ, GOMAXPROCS=str(inner_threads))
+        if config:
+            # gitleaks' git log over a partial clone fetches missing blobs from origin
+            env.update(config.GIT_ENV)
+        
+        # The report is assembled in memory and written with a single call
+        findings_count = 0
+        parse_error = None
+        buf: List[str] = []
+        append = buf.append
+        append(
+            f"# Gitleaks Secret Scan Report\n\n"
+            f"**Repository:** {repo_name}\n"
+            f"**Scanned on:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"**Command:** `{' '.join(cmd)}`\n"
         )
+        if prev_sha:
+            append(f"**Scope:** {scope or f'incremental, commits `{prev_sha}..HEAD`'}\n")
+        if carried_findings:
+            append(f"**Carried forward:** {carried_findings} finding(s) from earlier scans\n")
+        append("\n")
+        # Placeholder for the count header, filled in once findings are consumed
+        header_idx = len(buf)
+        append("")
+        append(carried_blocks)
         
-        with open(output_md, 'w') as f:
-            f.write(f"# Gitleaks Secret Scan Report\n\n")
-            f.write(f"**Repository:** {repo_name}\n")
-            f.write(f"**Scanned on:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Command:** `{' '.join(cmd)}`\n\n")
-            
-            if result.returncode == 1:
+        logging.info(f"Running gitleaks on {repo_name}")
+        if stream_report:
+            stdout = ""
+            # stderr goes to a file so a chatty gitleaks cannot block on a full pipe
+            with tempfile.TemporaryFile() as stderr_file:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    cwd=repo_path,
+                    env=env
+                )
                 try:
-                    with open(output_json, 'r') as json_file:
-                        findings = json.load(json_file)
-                    
-                    if not isinstance(findings, list):
-                        findings = [findings] if findings else []
-                    
-                    f.write(f"## Found {len(findings)} potential secrets\n\n")
-                    
-                    for idx, finding in enumerate(findings, 1):
-                        f.write(f"### Secret {idx}\n")
-                        f.write(f"- **File:** `{finding.get('File', 'N/A')}`\n")
-                        f.write(f"- **Line:** {finding.get('StartLine', 'N/A')}\n")
-                        f.write(f"- **Rule ID:** {finding.get('RuleID', 'N/A')}\n")
-                        f.write(f"- **Description:** {finding.get('Rule', {}).get('Description', 'N/A')}\n")
-                        f.write(f"- **Secret:** `{finding.get('Secret', 'N/A')}`\n")
-                        f.write(f"- **Match:** `{finding.get('Match', 'N/A')}`\n")
-                        
-                        if 'Commit' in finding:
-                            f.write(f"- **Commit:** {finding['Commit']}\n")
-                        if 'Author' in finding:
-                            f.write(f"- **Author:** {finding['Author']} ({finding.get('Email', 'N/A')})\n")
-                        if 'Date' in finding:
-                            f.write(f"- **Date:** {finding['Date']}\n")
-                        
-                        f.write("\n---\n\n")
-                    
-                    logging.info(f"Found {len(findings)} potential secrets in {repo_name}")
-                    
+                    findings_count = _render_findings(_iter_findings_stream(proc.stdout), append,
+                                                      start=carried_findings + 1)
                 except Exception as e:
-                    error_msg = f"Error processing findings: {str(e)}"
-                    f.write(f"## Error\n\n{error_msg}\n\n{result.stderr}")
-                    logging.error(error_msg)
-            
-            elif result.returncode == 0:
-                f.write("## No secrets found\n")
-                logging.info(f"No secrets found in {repo_name}")
-            
-            else:
-                error_msg = f"Gitleaks failed with return code {result.returncode}:\n{result.stderr}"
-                f.write(f"## Error\n\n{error_msg}")
-                logging.error(f"Gitleaks scan failed for {repo_name}: {error_msg}")
+                    parse_error = f"Error processing findings: {str(e)}"
+                finally:
+                    # Drain whatever was not consumed so gitleaks can exit
+                    with open(os.devnull, 'wb') as devnull:
+                        shutil.copyfileobj(proc.stdout, devnull)
+                    proc.stdout.close()
+                    returncode = proc.wait()
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode(errors='replace')
+        else:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                cwd=repo_path,
+                env=env
+            )
+            returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
+            if returncode == 1:
+                try:
+                    findings_count = _render_findings(_iter_findings(output_json), append,
+                                                      start=carried_findings + 1)
+                except Exception as e:
+                    parse_error = f"Error processing findings: {str(e)}"
+        
+        if returncode == 1 and parse_error is None:
+            logging.info(f"Found {findings_count} potential secrets in {repo_name}")
+            findings_count += carried_findings
+            buf[header_idx] = f"## Found {findings_count} potential secrets\n\n"
+        
+        elif returncode == 1:
+            del buf[header_idx:]
+            append(f"## Error\n\n{parse_error}\n\n{stderr}")
+            logging.error(parse_error)
+        
+        elif returncode == 0 and carried_findings:
+            findings_count = carried_findings
+            parse_error = None
+            buf[header_idx] = f"## Found {findings_count} potential secrets\n\nNo new secrets in this scan.\n\n"
+            logging.info(f"No new secrets found in {repo_name}")
+        
+        elif returncode == 0:
+            del buf[header_idx:]
+            findings_count = 0
+            parse_error = None
+            append("## No secrets found\n")
+            logging.info(f"No secrets found in {repo_name}")
+        
+        else:
+            del buf[header_idx:]
+            findings_count = 0
+            parse_error = None
+            error_msg = f"Gitleaks failed with return code {returncode}:\n{stderr}"
+            append(f"## Error\n\n{error_msg}")
+            logging.error(f"Gitleaks scan failed for {repo_name}: {error_msg}")
+        
+        output_md.write_text(''.join(buf))
+        if carried_json and returncode in (0, 1) and parse_error is None:
+            new_findings = _decode_findings(output_json.read_bytes()) if output_json.exists() else []
+            output_json.write_text(json.dumps(carried_json + new_findings, indent=2))
         
         return {
-            "success": result.returncode in [0, 1],
-            "returncode": result.returncode,
-            "output_file": output_json,
-            "report_file": output_md,
-            "stdout": result.stdout,
-            "stderr": result.stderr
+            "success": returncode in [0, 1] and parse_error is None,
+            "error": parse_error,
+            "returncode": returncode,
+            "findings_count": findings_count,
+            "output_file": None if stream_report else str(output_json),
+            "report_file": str(output_md),
+            "stdout": stdout,
+            "stderr": stderr
         }
     
     except Exception as e:
@@ -288,65 +678,158 @@ def run_gitleaks_scan(repo_path: str, repo_name: str, report_dir: str) -> Dict[s
         return {
             "error": error_msg,
             "success": False,
-            "report_file": output_md
+            "report_file": str(output_md)
         }
 
-def process_repo(repo: Dict[str, Any], report_dir: str):
-    """Process a single repository: clone and scan for secrets."""
+def _init_worker(worker_config: GitleaksConfig, verbosity: int = 1):
+    """Initialize a scan worker process with the parent's configuration.
+
+    The module-level ``config`` is not inherited on spawn-start platforms, so it
+    is handed over explicitly (including any command-line overrides).
+    """
+    global config
+    config = worker_config
+    if not logging.getLogger().handlers:
+        setup_logging(verbosity)
+
+def scan_worker(repo: Dict[str, Any], repo_path: str, report_dir: Path,
+                last_scan: Optional[Dict[str, Any]] = None) -> Tuple[int, Optional[str]]:
+    """Scan phase (CPU-bound): run gitleaks over an already cloned repository.
+
+    ``last_scan`` is the repository's entry from ``.last_sha.json``; when its commit is
+    still present in the clone only newer commits are scanned, and an unchanged HEAD
+    is not rescanned at all. Forks without such state are scanned against the parent
+    commit fetched by ``clone_repo_async``. The clone is left in place for the caller.
+
+    Returns ``(findings_count, head_sha)``.
+    """
     repo_name = repo['name']
     repo_full_name = repo['full_name']
     
-    logging.info(f"Processing repository: {repo_full_name}")
-    
-    repo_report_dir = os.path.join(report_dir, repo_name)
-    os.makedirs(repo_report_dir, exist_ok=True)
-    
-    repo_path = clone_repo(repo)
-    if not repo_path:
-        logging.error(f"Failed to clone repository: {repo_full_name}")
-        return
+    repo_report_dir = report_dir / repo_name
+    repo_report_dir.mkdir(parents=True, exist_ok=True)
     
+    findings_count = 0
+    head_sha = None
     try:
-        gitleaks_result = run_gitleaks_scan(repo_path, repo_name, repo_report_dir)
+        head_sha = _git_rev_parse(repo_path)
+        prev_sha = (last_scan or {}).get('sha')
+        if prev_sha and prev_sha == head_sha:
+            logging.info(f"No new commits in {repo_full_name} since last scan ({head_sha[:12]}); keeping previous report")
+            return int(last_scan.get('findings') or 0), head_sha
+        if prev_sha and not _has_commit(repo_path, prev_sha):
+            prev_sha = None
+        
+        scope = None
+        # An incremental scan only sees new commits: earlier findings are carried
+        # forward, and the count starts over only with a full scan
+        carried = int((last_scan or {}).get('findings') or 0) if prev_sha else 0
+        if not prev_sha and repo.get('fork'):
+            # Forks only get the commits they do not share with their parent
+            prev_sha = _git_rev_parse(repo_path, PARENT_REF)
+            if prev_sha:
+                scope = f"commits unique to the fork (`{prev_sha}..HEAD` vs. {repo['parent']['full_name']})"
+        
+        gitleaks_result = run_gitleaks_scan(repo_path, repo_name, repo_report_dir, prev_sha=prev_sha, scope=scope,
+                                            carried_findings=carried)
         
         if gitleaks_result.get('success', False):
-            if gitleaks_result['returncode'] == 1:
-                logging.warning(f"Found secrets in {repo_full_name}")
+            findings_count = gitleaks_result['findings_count']
+            if findings_count > 0:
+                logging.warning(f"Found {findings_count} secrets in {repo_full_name}")
             else:
                 logging.info(f"No secrets found in {repo_full_name}")
         else:
+            head_sha = None
             logging.error(f"Failed to scan {repo_full_name}: {gitleaks_result.get('error', 'Unknown error')}")
     
     except Exception as e:
+        head_sha = None
         logging.error(f"Error processing repository {repo_full_name}: {str(e)}")
     
-    finally:
+    return findings_count, head_sha
+
+async def maintain_clone_async(repo_path: str, repo_full_name: str):
+    """Maintenance phase (disk-bound): let git repack/prune a cached clone if needed.
+
+    Clones are kept in CLONE_DIR so later runs only fetch deltas; ``git gc --auto``
+    is a no-op unless enough loose objects have accumulated.
+    """
+    returncode, stderr = await _run_git_async([GIT_BIN, '-C', repo_path, 'gc', '--auto', '--quiet'])
+    if returncode != 0:
+        logging.error(f"Error running git gc for {repo_full_name}: {stderr}")
+
+async def orchestrate(repos: List[Dict[str, Any]], scan_executor: concurrent.futures.Executor,
+                      previous_scans: Dict[str, Dict[str, Any]],
+                      scanned_at: str) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """Drive clone -> scan -> maintenance for every repository on one event loop.
+
+    git runs as asyncio subprocesses (bounded by CLONE_CONCURRENCY) so waiting on the
+    network costs no threads, while gitleaks runs in ``scan_executor`` processes. At most
+    2x scan workers clones wait for a scan at once, which backpressures cloning.
+    Successful scans are recorded with ``scanned_at`` (the run's start time).
+
+    Returns ``(secret_repos, last_shas)``.
+    """
+    loop = asyncio.get_running_loop()
+    clone_slots = asyncio.Semaphore(CLONE_CONCURRENCY)
+    clones_in_flight = asyncio.Semaphore(2 * config.SCAN_WORKERS)
+    secret_repos: List[str] = []
+    last_shas = dict(previous_scans)
+    
+    async def handle(repo: Dict[str, Any]):
+        repo_full_name = repo['full_name']
         try:
-            if os.path.exists(repo_path):
-                shutil.rmtree(repo_path)
+            async with clones_in_flight:
+                async with clone_slots:
+                    logging.info(f"Processing repository: {repo_full_name}")
+                    repo_path = await clone_repo_async(repo)
+                if not repo_path:
+                    logging.error(f"Failed to clone repository: {repo_full_name}")
+                    return
+                findings_count, head_sha = await loop.run_in_executor(
+                    scan_executor, scan_worker, repo, repo_path, config.REPORT_DIR,
+                    previous_scans.get(repo_full_name)
+                )
+            if findings_count > 0:
+                secret_repos.append(repo['name'])
+            if head_sha:
+                last_shas[repo_full_name] = {"sha": head_sha, "findings": findings_count,
+                                             "scanned_at": scanned_at}
+            await maintain_clone_async(repo_path, repo_full_name)
         except Exception as e:
-            logging.error(f"Error cleaning up repository {repo_full_name}: {str(e)}")
+            logging.error(f"Error processing repository {repo['name']}: {str(e)}")
+    
+    await asyncio.gather(*(handle(repo) for repo in repos))
+    return secret_repos, last_shas
 
-def generate_summary_report(report_dir: str, repo_count: int, secret_repos: List[str]):
+def generate_summary_report(report_dir: Path, repo_count: int, secret_repos: List[str],
+                            include_json_links: bool = True):
     """Generate a summary report of all gitleaks scans."""
-    summary_file = os.path.join(report_dir, "secrets_scan_summary.md")
-    
-    with open(summary_file, 'w') as f:
-        f.write("# Gitleaks Secret Scan Summary\n\n")
-        f.write(f"**Scan Date:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write(f"## Scan Results\n")
-        f.write(f"- **Total Repositories Scanned:** {repo_count}\n")
-        f.write(f"- **Repositories with Secrets Found:** {len(secret_repos)}\n\n")
-        
-        if secret_repos:
-            f.write("## Repositories with Secrets Found\n\n")
-            for repo in secret_repos:
-                f.write(f"- [{repo}]({repo}/README.md)  ")
-                f.write(f"[View Report]({repo}/{repo}_gitleaks.md)  ")
-                f.write(f"[JSON Results]({repo}/{repo}_gitleaks.json)\n")
-        else:
-            f.write("## No Secrets Found\n\n")
-            f.write("No secrets were found in any of the scanned repositories.\n")
+    summary_file = report_dir / "secrets_scan_summary.md"
+    
+    buf: List[str] = [
+        "# Gitleaks Secret Scan Summary\n\n"
+        f"**Scan Date:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        "## Scan Results\n"
+        f"- **Total Repositories Scanned:** {repo_count}\n"
+        f"- **Repositories with Secrets Found:** {len(secret_repos)}\n\n"
+    ]
+    append = buf.append
+    
+    if secret_repos:
+        append("## Repositories with Secrets Found\n\n")
+        for repo in secret_repos:
+            append(
+                f"- [{repo}]({repo}/README.md)  "
+                f"[View Report]({repo}/{repo}_gitleaks.md)"
+                + (f"  [JSON Results]({repo}/{repo}_gitleaks.json)\n" if include_json_links else "\n")
+            )
+    else:
+        append("## No Secrets Found\n\n")
+        append("No secrets were found in any of the scanned repositories.\n")
+    
+    summary_file.write_text(''.join(buf))
     
     logging.info(f"Summary report generated: {summary_file}")
 
@@ -355,12 +838,12 @@ def main():
     # Try to initialize config first to validate required environment variables
     try:
         global config
-        config = GitleaksConfig()
+        config = GitleaksConfig.from_env()
     except ValueError as e:
         print(f"Error: {str(e)}")
         print("Please ensure you have a .env file with the required variables or set them in your environment.")
         print("Required variables: GITHUB_TOKEN, GITHUB_ORG")
-        print("Optional variables: GITHUB_API, REPORT_DIR")
+        print("Optional variables: GITHUB_API, REPORT_DIR, CLONE_DIR")
         sys.exit(1)
     
     parser = argparse.ArgumentParser(description='Scan GitHub repositories for secrets using Gitleaks')
@@ -376,6 +859,18 @@ def main():
                       help='Include forked repositories')
     parser.add_argument('--include-archived', action='store_true',
                       help='Include archived repositories')
+    parser.add_argument('--clone-dir', type=str, default=None,
+                      help=f'Persistent clone cache directory (default: {config.CLONE_DIR})')
+    parser.add_argument('--clean-cache', action='store_true',
+                      help='Delete the clone cache after the scan completes')
+    parser.add_argument('--full-clone', action='store_true',
+                      help='Check out every file instead of skipping vendored/build paths')
+    parser.add_argument('--full', action='store_true',
+                      help='Scan every repository, even those not pushed to since their last scan')
+    parser.add_argument('--keep-json', action='store_true',
+                      help='Keep the raw gitleaks JSON report next to the Markdown report')
+    parser.add_argument('--jobs', type=int, default=None,
+                      help='Number of parallel scan processes (default: number of CPUs)')
     parser.add_argument('-v', '--verbose', action='count', default=1,
                       help='Increase verbosity (can be specified multiple times)')
     parser.add_argument('-q', '--quiet', action='store_true',
@@ -389,20 +884,29 @@ def main():
     setup_logging(args.verbose)
     
     # Update config from command line arguments (overrides .env)
+    overrides: Dict[str, Any] = {
+        "FULL_CLONE": args.full_clone,
+        "KEEP_JSON": args.keep_json,
+        "SCAN_WORKERS": max(1, args.jobs or os.cpu_count() or 1),
+    }
     if args.token:
-        config.GITHUB_TOKEN = args.token
-        config.HEADERS["Authorization"] = f"token {config.GITHUB_TOKEN}"
+        overrides["GITHUB_TOKEN"] = args.token
     
     if args.org and args.org != config.ORG_NAME:
-        config.ORG_NAME = args.org
-        logging.info(f"Using organization from command line: {config.ORG_NAME}")
+        overrides["ORG_NAME"] = args.org
+        logging.info(f"Using organization from command line: {args.org}")
+    
+    if os.path.abspath(args.output_dir) != str(config.REPORT_DIR):
+        overrides["REPORT_DIR"] = Path(os.path.abspath(args.output_dir))
+        logging.info(f"Using output directory: {overrides['REPORT_DIR']}")
     
-    if args.output_dir != config.REPORT_DIR:
-        config.REPORT_DIR = os.path.abspath(args.output_dir)
-        logging.info(f"Using output directory: {config.REPORT_DIR}")
+    if args.clone_dir:
+        overrides["CLONE_DIR"] = Path(os.path.abspath(os.path.expanduser(args.clone_dir)))
+    
+    config = dataclasses.replace(config, **overrides)
     
     # Create report directory
-    os.makedirs(config.REPORT_DIR, exist_ok=True)
+    config.REPORT_DIR.mkdir(parents=True, exist_ok=True)
     
     # Set up requests session
     session = make_session()
@@ -429,39 +933,60 @@ def main():
             sys.exit(1)
         
         logging.info(f"Found {len(repos)} repositories to scan")
+        
+        if args.include_forks:
+            fork_groups = attach_fork_parents(session, repos)
+            if fork_groups:
+                logging.info(f"{sum(len(f) for f in fork_groups.values())} forks of {len(fork_groups)} "
+                             f"parents will only be scanned for commits not in their parent")
+    
+    # Scan parents (and other non-forks) first; forks are scanned incrementally
+    repos.sort(key=lambda repo: bool(repo.get('fork')))
+    repo_count = len(repos)
+    
+    # Skip repositories nobody pushed to since their last successful scan; the
+    # run's start time is recorded so pushes made during the scan are not missed
+    previous_scans = load_last_shas(config.REPORT_DIR)
+    scanned_at = datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    unchanged: List[Dict[str, Any]] = []
+    if not args.full:
+        repos, unchanged = split_unchanged_repos(repos, previous_scans)
+        if unchanged:
+            logging.info(f"Skipping {len(unchanged)} repositories with no pushes since their last scan")
+    
+    cache = getattr(session, 'cache', None)
+    if cache is not None:
+        logging.getLogger('gitleaks.cache').info(
+            f"GitHub API cache: {cache.hits} hits, {cache.misses} misses ({cache.hit_rate():.0%} hit rate)"
+        )
     
-    # Process repositories in parallel
-    secret_repos = []
+    config.CLONE_DIR.mkdir(parents=True, exist_ok=True)
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_repo = {
-            executor.submit(process_repo, repo, config.REPORT_DIR): repo 
-            for repo in repos
-        }
-        
-        for future in concurrent.futures.as_completed(future_to_repo):
-            repo = future_to_repo[future]
-            try:
-                future.result()
-                # Check if the repository had secrets
-                report_file = os.path.join(config.REPORT_DIR, repo['name'], f"{repo['name']}_gitleaks.md")
-                if os.path.exists(report_file):
-                    with open(report_file, 'r') as f:
-                        content = f.read()
-                        if "No secrets found" not in content:
-                            secret_repos.append(repo['name'])
-            except Exception as e:
-                logging.error(f"Error processing repository {repo['name']}: {str(e)}")
+    # Clones/fetches run as asyncio subprocesses while scans run in a process
+    # pool (CPU-bound gitleaks output handling is not serialized on the GIL)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=config.SCAN_WORKERS,
+        initializer=_init_worker,
+        initargs=(config, args.verbose),
+    ) as scan_executor:
+        secret_repos, last_shas = asyncio.run(orchestrate(repos, scan_executor, previous_scans, scanned_at))
+    
+    # Skipped repositories keep their previous result (and report)
+    secret_repos.extend(repo['name'] for repo in unchanged
+                        if previous_scans[repo['full_name']].get('findings', 0) > 0)
+    
+    save_last_shas(config.REPORT_DIR, last_shas)
     
     # Generate summary report
-    generate_summary_report(config.REPORT_DIR, len(repos), secret_repos)
+    generate_summary_report(config.REPORT_DIR, repo_count, secret_repos,
+                            include_json_links=config.KEEP_JSON or os.name == 'nt')
     
-    # Clean up temporary directory if it was created
-    if hasattr(config, 'CLONE_DIR') and config.CLONE_DIR and os.path.exists(config.CLONE_DIR):
+    # The clone cache is kept for the next run unless explicitly discarded
+    if args.clean_cache and config.CLONE_DIR.exists():
         try:
             shutil.rmtree(config.CLONE_DIR)
         except Exception as e:
-            logging.error(f"Error cleaning up temporary directory: {str(e)}")
+            logging.error(f"Error removing clone cache: {str(e)}")
     
     logging.info("Scan completed!")
 
@@ -25,6 +25,7 @@ import re
 
 import requests
 from src.github.rate_limit import make_rate_limited_session, request_with_rate_limit
+from src.scanners.tools import which as _which
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -57,6 +58,7 @@ class OSSConfig:
 
 config: Optional[OSSConfig] = None
 
+
 def setup_logging(verbosity: int = 1):
     level = logging.INFO
     if verbosity > 1:
@@ -330,7 +332,7 @@ def run_vulnerability_scan(tool: str, repo_path: str, dep_files: List[str]) -> D
 
     # Verify tool availability when applicable (skip check for semgrep; custom handling for pip-audit)
     if tool not in ('semgrep', 'pip-audit'):
-        if not shutil.which(tool):
+        if not _which(tool):
             error_msg = f"{tool} is not installed or not in PATH."
             logging.error(error_msg)
             return {"success": False, "error": error_msg}
@@ -344,7 +346,7 @@ def run_vulnerability_scan(tool: str, repo_path: str, dep_files: List[str]) -> D
                 return {"success": False, "error": "No requirements*.txt files for pip-audit"}
             # Build command with fallback to module execution if CLI not found
             base_cmd: List[str]
-            if shutil.which('pip-audit'):
+            if _which('pip-audit'):
                 base_cmd = ['pip-audit']
             else:
                 base_cmd = [sys.executable, '-m', 'pip_audit']
@@ -386,7 +388,7 @@ def run_vulnerability_scan(tool: str, repo_path: str, dep_files: List[str]) -> D
                 outputs.append(result.stdout)
             return {"success": True, "output": "\n".join(outputs), "errors": ""}
         elif tool == 'npm-audit':
-            if not shutil.which('npm'):
+            if not _which('npm'):
                 return {"success": False, "error": "npm not installed; cannot run npm audit"}
             manifests = [f for f in dep_files if os.path.basename(f) == 'package.json']
             if not manifests:
@@ -418,7 +420,7 @@ def ensure_js_lockfiles(manifests: List[str]) -> List[str]:
     Returns a list of generated lockfile paths.
     """
     lockfiles: List[str] = []
-    if not shutil.which('npm'):
+    if not _which('npm'):
         return lockfiles
     for mf in manifests:
         pkg_dir = os.path.dirname(mf)
@@ -441,7 +443,7 @@ def run_syft_sbom(repo_path: str, sbom_path: str, sbom_format: str = 'cyclonedx-
 
     Returns {success: bool, path: str, output: str, error: str}
     """
-    if not shutil.which('syft'):
+    if not _which('syft'):
         return {"success": False, "error": "syft not installed"}
     try:
         # Syft prints SBOM to stdout; capture and write to file
@@ -457,7 +459,7 @@ def run_syft_sbom(repo_path: str, sbom_path: str, sbom_format: str = 'cyclonedx-
         return {"success": False, "error": str(e)}
 
 def run_grype_scan_sbom(sbom_path: str) -> Dict[str, Any]:
-    if not shutil.which('grype'):
+    if not _which('grype'):
         return {"success": False, "error": "grype not installed"}
     try:
         logging.debug(f"Running grype on SBOM {sbom_path}")
@@ -468,7 +470,7 @@ def run_grype_scan_sbom(sbom_path: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 def run_grype_scan_fs(repo_path: str) -> Dict[str, Any]:
-    if not shutil.which('grype'):
+    if not _which('grype'):
         return {"success": False, "error": "grype not installed"}
     try:
         logging.debug(f"Running grype filesystem scan on {repo_path}")
@@ -596,7 +598,7 @@ def detect_struts2_known_cves_from_poms(pom_files: List[str]) -> List[Dict[str,
 
 def scan_java_struts_with_semgrep(repo_path: str) -> Dict[str, Any]:
     """Run Semgrep with Struts2 rules to detect potential RCE patterns in Java code."""
-    if not shutil.which('semgrep'):
+    if not _which('semgrep'):
         return {"success": False, "error": "semgrep not installed"}
     rules_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), 'semgrep-rules'))
     rules = [
@@ -801,7 +803,7 @@ def process_repo(session: requests.Session, repo: Dict[str, Any], report_dir: st
                 logging.error(f"pip-audit failed: {pa.get('error')}")
         # Python lockfiles via OSV (Pipfile.lock, poetry.lock)
         py_lock_files = [f for f in dep_files.get('python', []) if f.endswith(('Pipfile.lock', 'poetry.lock'))]
-        if py_lock_files and shutil.which('osv-scanner'):
+        if py_lock_files and _which('osv-scanner'):
             osv_py = run_vulnerability_scan('osv-scanner', repo_path, py_lock_files)
             if osv_py['success']:
                 vulns_list.extend(parse_vulnerability_output('osv-scanner', osv_py['output']))
@@ -810,7 +812,7 @@ def process_repo(session: requests.Session, repo: Dict[str, Any], report_dir: st
 
         # JavaScript: OSV on lockfiles, else npm audit on package.json manifests
         js_lockfiles = dep_files.get('javascript', [])
-        if js_lockfiles and shutil.which('osv-scanner'):
+        if js_lockfiles and _which('osv-scanner'):
             osv_js = run_vulnerability_scan('osv-scanner', repo_path, js_lockfiles)
             if osv_js['success']:
                 vulns_list.extend(parse_vulnerability_output('osv-scanner', osv_js['output']))
@@ -821,7 +823,7 @@ def process_repo(session: requests.Session, repo: Dict[str, Any], report_dir: st
             if js_manifests:
                 # Try to generate lockfiles for better OSV coverage; fallback to npm audit
                 gen_locks = ensure_js_lockfiles(js_manifests)
-                if gen_locks and shutil.which('osv-scanner'):
+                if gen_locks and _which('osv-scanner'):
                     osv_js2 = run_vulnerability_scan('osv-scanner', repo_path, gen_locks)
                     if osv_js2['success']:
                         vulns_list.extend(parse_vulnerability_output('osv-scanner', osv_js2['output']))
@@ -835,7 +837,7 @@ def process_repo(session: requests.Session, repo: Dict[str, Any], report_dir: st
                         logging.error(f"npm audit failed: {npm.get('error')}")
 
         # Java: attempt OSV scanning on manifests (pom.xml / gradle) if available
-        if dep_files.get('java') and shutil.which('osv-scanner'):
+        if dep_files.get('java') and _which('osv-scanner'):
             osv_java = run_vulnerability_scan('osv-scanner', repo_path, dep_files['java'])
             if osv_java['success']:
                 vulns_list.extend(parse_vulnerability_output('osv-scanner', osv_java['output']))
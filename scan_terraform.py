@@ -32,8 +32,14 @@ from typing import Any, Dict, List, Optional
 
 import requests
 from src.github.rate_limit import make_rate_limited_session, request_with_rate_limit
+from src.scanners.tools import TRIVY_CACHE_DIR, download_trivy_db, which as _which
 from dotenv import load_dotenv
 
+try:
+    import orjson  # optional: faster decoding of large Trivy reports
+except Exception:
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv(override=True)
 
@@ -62,6 +68,17 @@ class TFConfig:
 
 config: Optional[TFConfig] = None
 
+# Once warm_trivy_db() has refreshed the shared TRIVY_CACHE_DIR, the parallel
+# trivy fs scans skip their own DB update
+_TRIVY_DB_READY = False
+
+
+def _load_json_report(path: str) -> Any:
+    """Decode a JSON report from disk, with orjson when installed."""
+    with open(path, 'rb') as jf:
+        raw = jf.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 
 def setup_logging(verbosity: int = 1):
     level = logging.INFO
@@ -263,7 +280,7 @@ def check_tooling() -> None:
         ("trivy", ["trivy", "--version"]),
     ]
     for name, cmd in tools:
-        path = shutil.which(name)
+        path = _which(name)
         if not path:
             logging.warning(f"Tool not found on PATH: {name}")
             continue
@@ -280,7 +297,7 @@ def run_checkov(repo_path: str, repo_name: str, report_dir: str, *, no_guideline
     os.makedirs(report_dir, exist_ok=True)
     out_json = os.path.join(report_dir, f"{repo_name}_checkov.json")
     out_md = os.path.join(report_dir, f"{repo_name}_checkov.md")
-    if not shutil.which('checkov'):
+    if not _which('checkov'):
         msg = "Checkov is not installed. Install: pipx install checkov or pip install checkov"
         logging.error(msg)
         with open(out_md, 'w') as f:
@@ -326,8 +343,7 @@ def run_checkov(repo_path: str, repo_name: str, report_dir: str, *, no_guideline
                     parsed = {}
         elif os.path.exists(out_json) and os.path.getsize(out_json) > 0:
             try:
-                with open(out_json, 'r') as jf:
-                    parsed = json.load(jf)
+                parsed = _load_json_report(out_json)
             except Exception:
                 parsed = {}
         if not parsed:
@@ -494,7 +510,7 @@ def run_trivy_config(repo_path: str, repo_name: str, report_dir: str) -> Dict[st
     os.makedirs(report_dir, exist_ok=True)
     out_json = os.path.join(report_dir, f"{repo_name}_trivy_config.json")
     out_md = os.path.join(report_dir, f"{repo_name}_trivy_config.md")
-    if not shutil.which('trivy'):
+    if not _which('trivy'):
         msg = "Trivy is not installed. Install: brew install trivy or see https://aquasecurity.github.io/trivy/"
         logging.error(msg)
         with open(out_md, 'w') as f:
@@ -505,14 +521,14 @@ def run_trivy_config(repo_path: str, repo_name: str, report_dir: str) -> Dict[st
             'trivy', 'config', '--scanners', 'misconfig', '--format', 'json', '--quiet', '--skip-dirs', '.git', '--output', out_json, repo_path
         ]
         logging.info(f"Running Trivy config on {repo_name}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # The report goes to --output; only stderr is kept (for the Markdown error block)
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         with open(out_md, 'w') as f:
             f.write(f"# Trivy Config Report\n\n")
             f.write(f"**Repository:** {repo_name}\n\n")
             if result.returncode in (0, 1):
                 try:
-                    with open(out_json, 'r') as jf:
-                        parsed = json.load(jf)
+                    parsed = _load_json_report(out_json)
                     # Trivy config JSON structure varies; summarize counts
                     misconfigs = 0
                     if isinstance(parsed, dict) and 'Results' in parsed:
@@ -533,11 +549,17 @@ def run_trivy_config(repo_path: str, repo_name: str, report_dir: str) -> Dict[st
         return {"success": False, "error": msg, "report_file": out_md}
 
 
+def warm_trivy_db() -> None:
+    """Download the Trivy vulnerability DB once, before repositories are scanned in parallel."""
+    global _TRIVY_DB_READY
+    _TRIVY_DB_READY = download_trivy_db(_which('trivy') or 'trivy')
+
+
 def run_trivy_fs(repo_path: str, repo_name: str, report_dir: str, kev_cache: Optional[str] = None, epss_cache: Optional[str] = None) -> Dict[str, Any]:
     os.makedirs(report_dir, exist_ok=True)
     out_json = os.path.join(report_dir, f"{repo_name}_trivy_fs.json")
     out_md = os.path.join(report_dir, f"{repo_name}_trivy_fs.md")
-    if not shutil.which('trivy'):
+    if not _which('trivy'):
         msg = "Trivy is not installed. Install: brew install trivy or see https://aquasecurity.github.io/trivy/"
         logging.error(msg)
         with open(out_md, 'w') as f:
@@ -547,17 +569,20 @@ def run_trivy_fs(repo_path: str, repo_name: str, report_dir: str, kev_cache: Opt
         kev = load_kev(kev_cache or ".cache/kev.json")
         epss = load_epss(epss_cache or ".cache/epss.csv")
         cmd = [
-            'trivy', 'fs', '--format', 'json', '--quiet', '--skip-dirs', '.git', '--output', out_json, repo_path
+            'trivy', 'fs', '--format', 'json', '--quiet', '--skip-dirs', '.git', '--cache-dir', TRIVY_CACHE_DIR,
+            '--output', out_json, repo_path
         ]
+        if _TRIVY_DB_READY:
+            cmd.insert(-1, '--skip-db-update')
         logging.info(f"Running Trivy filesystem scan on {repo_name}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # The report goes to --output; only stderr is kept (for the Markdown error block)
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         with open(out_md, 'w') as f:
             f.write(f"# Trivy Filesystem Report\n\n")
             f.write(f"**Repository:** {repo_name}\n\n")
             if result.returncode in (0, 1):
                 try:
-                    with open(out_json, 'r') as jf:
-                        parsed = json.load(jf)
+                    parsed = _load_json_report(out_json)
                     vuln_count = 0
                     rows: List[Dict[str, Any]] = []
                     if isinstance(parsed, dict) and 'Results' in parsed:
@@ -691,8 +716,7 @@ def generate_summary_report(report_dir: str, all_results: List[Dict[str, Any]]):
             try:
                 tvc_json = r.get('trivy_config', {}).get('output_file')
                 if tvc_json and os.path.exists(tvc_json):
-                    with open(tvc_json, 'r') as jf:
-                        tvc_parsed = json.load(jf)
+                    tvc_parsed = _load_json_report(tvc_json)
                     count = 0
                     if isinstance(tvc_parsed, dict) and 'Results' in tvc_parsed:
                         for rr in tvc_parsed.get('Results') or []:
@@ -704,8 +728,7 @@ def generate_summary_report(report_dir: str, all_results: List[Dict[str, Any]]):
             try:
                 tvf_json = r.get('trivy_fs', {}).get('output_file') if r.get('trivy_fs') else None
                 if tvf_json and os.path.exists(tvf_json):
-                    with open(tvf_json, 'r') as jf:
-                        tvf_parsed = json.load(jf)
+                    tvf_parsed = _load_json_report(tvf_json)
                     count_v = 0
                     if isinstance(tvf_parsed, dict) and 'Results' in tvf_parsed:
                         for rr in tvf_parsed.get('Results') or []:
@@ -806,6 +829,9 @@ def main():
     if args.refresh_epss:
         refresh_epss(epss_cache)
 
+    if args.with_trivy_fs and _which('trivy'):
+        warm_trivy_db()
+
     results: List[Dict[str, Any]] = []
     with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
         future_to_repo = {executor.submit(
@@ -863,8 +889,7 @@ def main():
             tvf_json = r.get('trivy_fs', {}).get('output_file') if r.get('trivy_fs') else None
             try:
                 if tvf_json and os.path.exists(tvf_json):
-                    with open(tvf_json, 'r') as jf:
-                        parsed = json.load(jf)
+                    parsed = _load_json_report(tvf_json)
                     for res in (parsed.get('Results') or []):
                         for v in (res.get('Vulnerabilities') or []):
                             cve = (v.get('VulnerabilityID') or '').upper()
@@ -884,8 +909,7 @@ def main():
             tvf_json = r.get('trivy_fs', {}).get('output_file') if r.get('trivy_fs') else None
             try:
                 if tvf_json and os.path.exists(tvf_json):
-                    with open(tvf_json, 'r') as jf:
-                        parsed = json.load(jf)
+                    parsed = _load_json_report(tvf_json)
                     for res in (parsed.get('Results') or []):
                         for v in (res.get('Vulnerabilities') or []):
                             cve = (v.get('VulnerabilityID') or '').upper()
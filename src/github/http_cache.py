@@ -0,0 +1,134 @@
+"""
+Persistent conditional-request (ETag / Last-Modified) cache for GitHub REST GETs.
+
+GitHub answers a conditional request whose validators still match with 304 Not Modified,
+and 304 responses do not count against the rate limit. Caching the body alongside the
+validators lets repeated scans of the same org re-use previous responses for free.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+import requests
+
+# Absolute TTL after which a cached entry is ignored and refetched unconditionally
+_DEFAULT_TTL_SEC = float(os.getenv("GITHUB_CACHE_TTL", str(24 * 3600)))
+
+# Response headers persisted with the body and restored on a 304 hit
+_KEPT_HEADERS = ("ETag", "Last-Modified", "Link", "Content-Type")
+
+
+class ConditionalRequestCache:
+    """SQLite-backed store of GET response bodies keyed by request identity."""
+
+    def __init__(self, path: str, ttl_sec: float = _DEFAULT_TTL_SEC,
+                 logger: Optional[logging.Logger] = None) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.ttl_sec = ttl_sec
+        self.log = logger or logging.getLogger("auditgh.github.http_cache")
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, stored_at REAL, headers TEXT, body BLOB)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Any = None, auth: Optional[str] = None) -> str:
+        """Build a cache key from URL, query params and (hashed) credentials."""
+        query = urlencode(sorted(dict(params).items())) if params else ""
+        raw = f"GET {url}?{query} {auth or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, str], bytes]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT stored_at, headers, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if not row:
+            return None
+        stored_at, headers_raw, body = row
+        if time.time() - stored_at > self.ttl_sec:
+            return None
+        headers = dict(line.split(": ", 1) for line in headers_raw.splitlines() if ": " in line)
+        return headers, body
+
+    def put(self, key: str, resp: requests.Response) -> None:
+        headers = "\n".join(f"{h}: {resp.headers[h]}" for h in _KEPT_HEADERS if h in resp.headers)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, stored_at, headers, body) VALUES (?, ?, ?, ?)",
+                (key, time.time(), headers, resp.content),
+            )
+            self._db.commit()
+
+    def record(self, hit: bool) -> None:
+        """Count one revalidated hit or miss; sessions may be shared across threads."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return (self.hits / total) if total else 0.0
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class ConditionalCachingSession(requests.Session):
+    """requests Session that revalidates GETs against a ConditionalRequestCache.
+
+    A 304 answer is rewritten into a 200 carrying the cached body and headers so callers
+    (pagination, ``raise_for_status``, ``.json()``) need no changes.
+    """
+
+    def __init__(self, cache: ConditionalRequestCache) -> None:
+        super().__init__()
+        self.cache = cache
+
+    def request(self, method, url, *args, **kwargs):  # type: ignore[override]
+        if str(method).upper() != "GET":
+            return super().request(method, url, *args, **kwargs)
+
+        auth = self.headers.get("Authorization")
+        key = self.cache.make_key(url, kwargs.get("params"), auth)
+        cached = self.cache.get(key)
+        if cached:
+            cached_headers, cached_body = cached
+            extra = dict(kwargs.pop("headers", None) or {})
+            if "ETag" in cached_headers:
+                extra["If-None-Match"] = cached_headers["ETag"]
+            if "Last-Modified" in cached_headers:
+                extra["If-Modified-Since"] = cached_headers["Last-Modified"]
+            kwargs["headers"] = extra
+
+        resp = super().request(method, url, *args, **kwargs)
+
+        if cached and resp.status_code == 304:
+            self.cache.record(True)
+            self.cache.log.debug("Cache hit (304) for %s", url)
+            resp.status_code = 200
+            resp._content = cached_body
+            for h, v in cached_headers.items():
+                resp.headers.setdefault(h, v)
+            return resp
+
+        self.cache.record(False)
+        if resp.status_code == 200 and ("ETag" in resp.headers or "Last-Modified" in resp.headers):
+            self.cache.put(key, resp)
+        return resp
@@ -12,6 +12,8 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .http_cache import ConditionalCachingSession, ConditionalRequestCache
+
 # Default minimal delay between API calls to avoid bursting
 _DEFAULT_DELAY_SEC = float(os.getenv("GITHUB_REQ_DELAY", "0.35"))
 # Max attempts when backing off for 429/5xx
@@ -20,12 +22,15 @@ _DEFAULT_MAX_ATTEMPTS = int(os.getenv("GITHUB_REQ_MAX_ATTEMPTS", "6"))
 _DEFAULT_BACKOFF_BASE = float(os.getenv("GITHUB_REQ_BACKOFF_BASE", "1.7"))
 
 
-def make_rate_limited_session(token: Optional[str], user_agent: str = "auditgh") -> requests.Session:
+def make_rate_limited_session(token: Optional[str], user_agent: str = "auditgh",
+                              cache: Optional[ConditionalRequestCache] = None) -> requests.Session:
     """Create a requests Session with retry for idempotent requests and auth headers.
 
     Retries cover transient 5xx and 429, but we still implement explicit rate-limit backoff.
+    When ``cache`` is given, GETs are revalidated with ETag/Last-Modified so unchanged
+    resources come back as (rate-limit free) 304s served from the cache.
     """
-    s = requests.Session()
+    s = ConditionalCachingSession(cache) if cache is not None else requests.Session()
     retry_strategy = Retry(
         total=3,
         backoff_factor=0.5,
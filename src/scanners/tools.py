@@ -0,0 +1,38 @@
+"""
+Helpers for locating and preparing the external scanner CLIs shared by the AuditGH scripts.
+"""
+import logging
+import os
+import shutil
+import subprocess
+from functools import lru_cache
+from typing import Optional
+
+# Trivy vulnerability DB location shared by every scan in a run, so the DB is
+# downloaded once instead of being re-checked per repository
+TRIVY_CACHE_DIR = os.getenv("TRIVY_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "trivy")
+
+
+@lru_cache(maxsize=None)
+def which(name: str) -> Optional[str]:
+    """shutil.which, resolved once per process (PATH does not change mid-run)."""
+    return shutil.which(name)
+
+
+def download_trivy_db(trivy_bin: str = "trivy") -> bool:
+    """Download the Trivy vulnerability DB into TRIVY_CACHE_DIR.
+
+    Returns True when the DB is current, so later scans can pass --skip-db-update.
+    """
+    os.makedirs(TRIVY_CACHE_DIR, exist_ok=True)
+    logging.info("Updating trivy vulnerability database...")
+    try:
+        res = subprocess.run([trivy_bin, "image", "--download-db-only", "-q", "--cache-dir", TRIVY_CACHE_DIR],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=60 * 30)
+    except Exception as e:
+        logging.warning(f"trivy DB download failed: {e}")
+        return False
+    if res.returncode != 0:
+        logging.warning(f"trivy DB download failed: {res.stderr.strip()}")
+        return False
+    return True
@@ -1,32 +1,33 @@
 #!/usr/bin/env python3
 import argparse
+import atexit
+import base64
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import csv
 import datetime
 import fnmatch
+import gzip
+import heapq
 import json
 import logging
 import logging.handlers
+import io
+import itertools
+import mmap
 import os
+import pickle
+import queue
+import random
 import re
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)-8s | %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.handlers.RotatingFileHandler('auditgh_scan.log', maxBytes=5*1024*1024, backupCount=3)
-    ]
-)
-
-# Enable debug logging for requests/urllib3
+# Logging is configured in configure_logging(); keep requests/urllib3 quiet
 logging.getLogger('urllib3').setLevel(logging.WARNING)
 logging.getLogger('requests').setLevel(logging.WARNING)
 import shutil
 import threading
 import select
+import socket
 import tty
 import termios
 import subprocess
@@ -36,25 +37,52 @@ import time
 import traceback
 import requests
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any, DefaultDict
-from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any, DefaultDict
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from dotenv import load_dotenv
-import toml
+from src.github.http_cache import ConditionalCachingSession, ConditionalRequestCache
+from src.scanners.tools import TRIVY_CACHE_DIR, download_trivy_db, which as _which
+try:
+    import tomllib  # Python 3.11+
+except ModuleNotFoundError:  # pragma: no cover - older interpreters
+    import tomli as tomllib
+try:
+    import orjson  # optional: faster JSON encoding/decoding
+except Exception:
+    orjson = None
+try:
+    import ijson  # optional: stream-parse large scanner JSON reports
+except Exception:
+    ijson = None
+try:
+    import inotify_simple  # optional: event-driven control flag watching on Linux
+except Exception:
+    inotify_simple = None
 from functools import lru_cache
+from urllib.parse import parse_qs, urlparse
 
 # Load environment variables from .env file
 load_dotenv()
 
 class Config:
     """Global configuration for the script."""
+    # Fixed attribute set: no per-instance __dict__, and typos in assignments fail loudly
+    __slots__ = ('GITHUB_API', 'ORG_NAME', 'GITHUB_TOKEN', 'REPORT_DIR', 'CLONE_DIR', 'MIRROR_DIR',
+                 'HEADERS', 'DOCKER_IMAGE', 'SYFT_FORMAT', 'VEX_FILES', 'CONTROL_DIR',
+                 'SEMGREP_TAINT_CONFIG', 'POLICY_PATH', 'GITLEAKS_HISTORY')
+
     def __init__(self):
         self.GITHUB_API = os.getenv("GITHUB_API", "https://api.github.com")
         self.ORG_NAME = os.getenv("GITHUB_ORG", "sleepnumberinc")
         self.GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
         self.REPORT_DIR = os.getenv("REPORT_DIR", "vulnerability_reports")
         self.CLONE_DIR = None
+        # Persistent bare mirrors reused across runs; empty disables the mirror cache
+        self.MIRROR_DIR = os.getenv("AUDITGH_MIRROR_DIR", os.path.join(os.path.expanduser("~"), ".cache", "auditgh", "mirrors"))
         self.HEADERS = {}
         # Optional Docker image target for SBOMs (Syft)
         self.DOCKER_IMAGE = None
@@ -68,6 +96,8 @@ class Config:
         self.SEMGREP_TAINT_CONFIG: Optional[str] = None
         # Optional policy file for gating
         self.POLICY_PATH: Optional[str] = None
+        # Gitleaks scans the full git history only when asked; by default just the checkout
+        self.GITLEAKS_HISTORY = os.getenv("AUDITGH_GITLEAKS_HISTORY", "").lower() in ("1", "true", "yes")
         
         # Set up headers if token is available
         if self.GITHUB_TOKEN:
@@ -79,6 +109,248 @@ class Config:
 # Create a global config instance
 config = Config()
 
+# Cap on simultaneous `git clone` subprocesses across scan worker threads, so that a
+# large --max-workers does not saturate the network link with clones alone
+CLONE_CONCURRENCY = int(os.getenv("AUDITGH_CLONE_CONCURRENCY", "4"))
+_CLONE_SEMAPHORE = threading.BoundedSemaphore(CLONE_CONCURRENCY)
+# Serializes creation of the shared clone directory between worker threads
+_CLONE_DIR_LOCK = threading.Lock()
+
+# Upper bound on concurrent repository listing page requests
+MAX_PAGE_FETCH_WORKERS = 8
+
+# Process-wide pool for per-repo scanner runs, shared by all repository workers so the
+# total number of concurrent scanner subprocesses stays bounded. Scanner threads spend
+# their time in subprocess waits (which release the GIL), so a thread per running tool
+# costs little; the pool size, not the threading model, is what caps the parallelism.
+SCAN_WORKERS = int(os.getenv("AUDITGH_SCAN_WORKERS", str(min(8, (os.cpu_count() or 1) * 2))))
+_SCAN_POOL = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="scan")
+atexit.register(_SCAN_POOL.shutdown, wait=True)
+
+# Scanners that usually dominate a repository's wall time, slowest first. Submitting
+# them ahead of the quick ones lets the short jobs fill in around them instead of a
+# long scan starting last and holding up the summary.
+_SLOW_SCANNERS = ('dependency_check', 'semgrep', 'semgrep_taint', 'trivy_fs', 'grype_repo',
+                  'grype_image', 'syft_image', 'syft_repo', 'checkov')
+_SCAN_ORDER = {name: rank for rank, name in enumerate(_SLOW_SCANNERS)}
+
+def set_scan_workers(workers: int) -> None:
+    """Resize the shared scanner pool; call before any repository is processed."""
+    global _SCAN_POOL, SCAN_WORKERS
+    previous = _SCAN_POOL
+    SCAN_WORKERS = max(1, workers)
+    _SCAN_POOL = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="scan")
+    atexit.register(_SCAN_POOL.shutdown, wait=True)
+    previous.shutdown(wait=False)
+
+# Install hints for the optional scanner CLIs that process_repo gates on _tool_available
+_TOOL_INSTALL_HINTS = {
+    'syft': "brew install syft or follow https://github.com/anchore/syft",
+    'grype': "brew install grype or see https://github.com/anchore/grype",
+    'checkov': "pip install checkov or see https://github.com/bridgecrewio/checkov",
+    'gitleaks': "brew install gitleaks or see https://github.com/gitleaks/gitleaks",
+    'bandit': "pip install bandit or brew install bandit",
+    'trivy': "brew install trivy or see https://aquasecurity.github.io/trivy/",
+}
+_MISSING_TOOLS: set = set()
+_MISSING_TOOLS_LOCK = threading.Lock()
+
+def _tool_available(name: str) -> bool:
+    """Whether a scanner CLI is on PATH.
+
+    A missing tool is reported once per run, in REPORT_DIR/tools_missing.md (cleared
+    by main() at startup), instead of a "not installed" stub report for every repository.
+    """
+    if _which(name):
+        return True
+    with _MISSING_TOOLS_LOCK:
+        if name not in _MISSING_TOOLS:
+            first = not _MISSING_TOOLS
+            _MISSING_TOOLS.add(name)
+            logging.warning(f"{name} is not installed; skipping it for every repository")
+            try:
+                with open(os.path.join(config.REPORT_DIR, "tools_missing.md"), 'a') as f:
+                    if first:
+                        f.write("# Scanners Not Installed\n\n")
+                    f.write(f"- {name}: install via {_TOOL_INSTALL_HINTS.get(name, 'your package manager')}\n")
+            except OSError as e:
+                logging.debug("Could not record missing tool %s: %s", name, e)
+    return False
+
+# Persistent vulnerability database locations shared by every repository scan, so the
+# databases are downloaded once per run instead of being re-checked per repository
+# (TRIVY_CACHE_DIR comes from src.scanners.tools, shared with scan_terraform)
+GRYPE_DB_CACHE_DIR = os.getenv("GRYPE_DB_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "grype", "db")
+DC_DATA_DIR = os.getenv("DC_DATA_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "dependency-check")
+# Set by warm_vuln_dbs() once the grype/trivy databases are known to be current
+_GRYPE_DB_READY = False
+_TRIVY_DB_READY = False
+# One long-lived `trivy server` holds the vulnerability DB for every repository's
+# `trivy fs --server` client instead of each scan loading it again (AUDITGH_TRIVY_SERVER=0
+# opts out); _TRIVY_SERVER_URL is set once the server answers its health check
+TRIVY_SERVER = os.getenv("AUDITGH_TRIVY_SERVER", "1") != "0"
+TRIVY_SERVER_START_TIMEOUT = 60
+_TRIVY_SERVER_URL: Optional[str] = None
+# Dependency-Check's NVD update is only paid for once a Java repository shows up:
+# None = not attempted yet, True/False = outcome of the one-time --updateonly run
+_DC_DB_READY: Optional[bool] = None
+_DC_DB_LOCK = threading.Lock()
+
+def warm_vuln_dbs() -> None:
+    """Create the shared DB cache dirs, update the grype/trivy databases once and
+    load the KEV/EPSS feeds.
+
+    After a successful update the per-repo scans run with DB updates disabled; if an
+    update fails they fall back to the tools' own update checks.
+    """
+    global _GRYPE_DB_READY, _TRIVY_DB_READY
+    for path in (GRYPE_DB_CACHE_DIR, TRIVY_CACHE_DIR, DC_DATA_DIR):
+        os.makedirs(path, exist_ok=True)
+    # lru_cache does not coalesce concurrent misses, so populate the threat-intel maps
+    # here rather than letting every worker thread's first lookup download the feeds.
+    # Both feeds download side by side, overlapping the database updates below.
+    logging.info("Loading KEV/EPSS threat intelligence feeds...")
+    feeds_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="threat-intel")
+    feeds = [feeds_pool.submit(load_kev), feeds_pool.submit(load_epss)]
+    feeds_pool.shutdown(wait=False)
+    grype_bin = _which("grype")
+    if grype_bin:
+        logging.info("Updating grype vulnerability database...")
+        env = {**os.environ, "GRYPE_DB_CACHE_DIR": GRYPE_DB_CACHE_DIR}
+        try:
+            res = subprocess.run([grype_bin, "db", "update"], env=env, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.PIPE, text=True, timeout=60*30)
+            _GRYPE_DB_READY = res.returncode == 0
+            if not _GRYPE_DB_READY:
+                logging.warning(f"grype db update failed: {res.stderr.strip()}")
+        except Exception as e:
+            logging.warning(f"grype db update failed: {e}")
+    trivy_bin = _which("trivy")
+    if trivy_bin:
+        _TRIVY_DB_READY = download_trivy_db(trivy_bin)
+        if _TRIVY_DB_READY and TRIVY_SERVER:
+            start_trivy_server(trivy_bin)
+    concurrent.futures.wait(feeds)
+
+def start_trivy_server(trivy_bin: str) -> None:
+    """Launch `trivy server` on a free loopback port and wait until it is healthy.
+
+    On success run_trivy_fs scans as a client of it; if the server does not come up in
+    TRIVY_SERVER_START_TIMEOUT seconds it is stopped and scans stay standalone.
+    """
+    global _TRIVY_SERVER_URL
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    url = f"http://127.0.0.1:{port}"
+    try:
+        proc = subprocess.Popen([trivy_bin, "server", "-q", "--listen", f"127.0.0.1:{port}",
+                                 "--cache-dir", TRIVY_CACHE_DIR, "--skip-db-update"],
+                                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        logging.warning(f"Could not start trivy server: {e}")
+        return
+    deadline = time.monotonic() + TRIVY_SERVER_START_TIMEOUT
+    while proc.poll() is None and time.monotonic() < deadline:
+        try:
+            if requests.get(f"{url}/healthz", timeout=1).ok:
+                _TRIVY_SERVER_URL = url
+                atexit.register(stop_trivy_server, proc)
+                logging.info(f"trivy server listening on {url}")
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    logging.warning("trivy server did not become ready; running trivy scans standalone")
+    stop_trivy_server(proc)
+
+def stop_trivy_server(proc: subprocess.Popen) -> None:
+    """Terminate a trivy server started by start_trivy_server."""
+    if proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+# Background deletion of cloned trees so cleanup overlaps with the next clone/scan
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cleanup")
+atexit.register(_CLEANUP_POOL.shutdown, wait=True)
+
+# Per-repo console lines are queued and written in batches by a single thread, so
+# parallel repository workers neither contend on stdout nor interleave their lines
+PROGRESS_FLUSH_INTERVAL = 0.5
+_PROGRESS_Q: "queue.SimpleQueue[Union[str, threading.Event]]" = queue.SimpleQueue()
+_PROGRESS_THREAD: Optional[threading.Thread] = None
+_PROGRESS_THREAD_LOCK = threading.Lock()
+
+def _progress_writer() -> None:
+    """Collect queued lines for up to PROGRESS_FLUSH_INTERVAL and write them at once."""
+    while True:
+        batch: List[str] = []
+        waiters: List[threading.Event] = []
+        item = _PROGRESS_Q.get()
+        deadline = time.monotonic() + PROGRESS_FLUSH_INTERVAL
+        while True:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+                break  # flush requested: write what we have now
+            batch.append(item)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _PROGRESS_Q.get(timeout=remaining)
+            except queue.Empty:
+                break
+        if batch:
+            try:
+                sys.stdout.write("".join(f"{line}\n" for line in batch))
+                sys.stdout.flush()
+            except Exception:
+                pass
+        for waiter in waiters:
+            waiter.set()
+
+def progress(line: str) -> None:
+    """Queue a console progress line for the batched writer thread."""
+    global _PROGRESS_THREAD
+    if _PROGRESS_THREAD is None:
+        with _PROGRESS_THREAD_LOCK:
+            if _PROGRESS_THREAD is None:
+                _PROGRESS_THREAD = threading.Thread(target=_progress_writer, name="progress", daemon=True)
+                _PROGRESS_THREAD.start()
+    _PROGRESS_Q.put(line)
+
+def flush_progress(timeout: float = 2.0) -> None:
+    """Block until every queued progress line has been written."""
+    if _PROGRESS_THREAD is None:
+        return
+    done = threading.Event()
+    _PROGRESS_Q.put(done)
+    done.wait(timeout)
+
+atexit.register(flush_progress)
+
+# str.translate table mapping characters unsafe in file names to '_'
+_SAFE_TABLE = {b: b if chr(b).isalnum() or chr(b) in '._-' else ord('_') for b in range(256)}
+
+def discard_tree(path: str) -> None:
+    """Remove a directory tree without blocking the caller.
+
+    The tree is renamed aside (O(1), frees the original path immediately) and deleted
+    on _CLEANUP_POOL; falls back to a synchronous rmtree if the rename fails.
+    """
+    trash = f"{path}.trash.{os.getpid()}.{time.monotonic_ns()}"
+    try:
+        os.rename(path, trash)
+    except FileNotFoundError:
+        return
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    _CLEANUP_POOL.submit(shutil.rmtree, trash, ignore_errors=True)
+
 def setup_temp_dir() -> str:
     """
     Create and return a temporary directory for repository cloning.
@@ -109,20 +381,62 @@ def setup_temp_dir() -> str:
         raise RuntimeError(error_msg)
         raise
 
-def configure_logging(verbosity: int) -> None:
-    level = logging.WARNING
-    if verbosity == 1:
-        level = logging.INFO
-    elif verbosity >= 2:
-        level = logging.DEBUG
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s | %(levelname)s | %(message)s",
-    )
+LOG_FORMAT = '%(asctime)s | %(levelname)-8s | %(message)s'
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+def configure_logging(verbosity: int = 0, level: Optional[int] = None) -> None:
+    """Configure the root logger: console plus rotating auditgh_scan.log.
 
+    Records go through a QueueHandler so worker threads never block on console or
+    file I/O; a QueueListener thread writes them out. Safe to call again to change
+    the level. ``level`` overrides the level derived from ``verbosity``.
+    """
+    global _LOG_LISTENER
+    if level is None:
+        level = logging.WARNING
+        if verbosity == 1:
+            level = logging.INFO
+        elif verbosity >= 2:
+            level = logging.DEBUG
+    root = logging.getLogger()
+    root.setLevel(level)
+    if _LOG_LISTENER is not None:
+        return
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [
+        logging.StreamHandler(),
+        logging.handlers.RotatingFileHandler('auditgh_scan.log', maxBytes=5*1024*1024, backupCount=3),
+    ]
+    for h in handlers:
+        h.setFormatter(formatter)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    for h in list(root.handlers):
+        root.removeHandler(h)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _LOG_LISTENER = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _LOG_LISTENER.start()
+    atexit.register(_LOG_LISTENER.stop)
+
+@lru_cache(maxsize=1)
 def make_session():
-    """Create and configure a requests session with retry logic and GitHub authentication."""
+    """Return the shared requests session with retry logic and GitHub authentication.
+
+    Memoized so every caller (listing, per-repo metadata, summary reports) reuses one
+    keep-alive connection pool instead of re-doing TCP/TLS setup. Call after
+    config.HEADERS and config.REPORT_DIR are final.
+    
+    GETs are revalidated against an ETag/Last-Modified cache in the report directory,
+    so repository metadata that has not changed since the last run comes back as a
+    (rate-limit free) 304 served from disk.
+    """
     session = requests.Session()
+    if config.REPORT_DIR:
+        os.makedirs(config.REPORT_DIR, exist_ok=True)
+        cache = ConditionalRequestCache(
+            os.path.join(config.REPORT_DIR, '.gh_cache.sqlite'),
+            logger=logging.getLogger('auditgh.cache'),
+        )
+        session = ConditionalCachingSession(cache)
     
     # Configure retry strategy
     retry_strategy = Retry(
@@ -132,52 +446,191 @@ def make_session():
         allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
     )
     
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    # Pool sized for concurrent repository workers sharing this session. requests only
+    # speaks HTTP/1.1, so a connection carries one request at a time: block for a free
+    # keep-alive connection when all are busy rather than opening a one-off connection
+    # (with its own TLS handshake) that the full pool would then discard.
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry_strategy,
+                          pool_block=True)
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     
     # Add headers from config
-    if hasattr(config, 'HEADERS') and config.HEADERS:
+    if config.HEADERS:
         session.headers.update(config.HEADERS)
     
     return session
 
 # -------------------- Control: Pause / Resume / Stop --------------------
 
+# Control file paths, rebuilt only when config.CONTROL_DIR changes
+_CONTROL_FILES = ("pause.flag", "stop.flag", "scan_state.json")
+_PATHS: Dict[str, str] = {}
+_PATHS_DIR: Optional[str] = None
+_CONTROL_DIR_READY: Optional[str] = None
+
+def _init_control_paths() -> None:
+    global _PATHS, _PATHS_DIR
+    _PATHS = {name: os.path.join(config.CONTROL_DIR, name) for name in _CONTROL_FILES}
+    _PATHS_DIR = config.CONTROL_DIR
+
 def ensure_control_dir():
+    global _CONTROL_DIR_READY
+    if _CONTROL_DIR_READY == config.CONTROL_DIR:
+        return
     try:
         os.makedirs(config.CONTROL_DIR, exist_ok=True)
+        _CONTROL_DIR_READY = config.CONTROL_DIR
     except Exception:
         pass
 
 def _control_path(name: str) -> str:
-    return os.path.join(config.CONTROL_DIR, name)
+    if _PATHS_DIR != config.CONTROL_DIR:
+        _init_control_paths()
+    try:
+        return _PATHS[name]
+    except KeyError:
+        return os.path.join(config.CONTROL_DIR, name)
+
+_init_control_paths()
 
 def write_scan_state(status: str, last_repo: str = ""):
     try:
         ensure_control_dir()
         state = {"status": status, "last_repo": last_repo}
-        with open(_control_path("scan_state.json"), 'w') as f:
-            json.dump(state, f, indent=2)
+        with open(_control_path("scan_state.json"), 'wb') as f:
+            f.write(_json_dumps(state, indent=True))
     except Exception:
         logging.debug("Failed to write scan_state.json")
 
+# Mirrors of the control flag files: STOP_EVENT is set while stop.flag exists, RESUME_EVENT
+# is set while the scan may run (no pause.flag, or a stop is pending)
+STOP_EVENT = threading.Event()
+RESUME_EVENT = threading.Event()
+RESUME_EVENT.set()
+_FLAG_WATCHER: Optional["FlagWatcher"] = None
+
+class _FlagCache:
+    """Snapshot of CONTROL_DIR entry names, shared across threads.
+
+    One scandir() answers both flag checks, and callers may accept a snapshot up to
+    ``max_age`` seconds old instead of hitting the filesystem at every checkpoint.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last = 0.0
+        self._dir: Optional[str] = None
+        self._names: frozenset = frozenset()
+
+    def names(self, max_age: float = 0.0) -> frozenset:
+        now = time.monotonic()
+        with self._lock:
+            if self._dir != config.CONTROL_DIR or now - self._last >= max_age:
+                try:
+                    with os.scandir(config.CONTROL_DIR) as it:
+                        self._names = frozenset(e.name for e in it)
+                except OSError:
+                    self._names = frozenset()
+                self._dir = config.CONTROL_DIR
+                self._last = now
+            return self._names
+
+    def has_flag(self, name: str, max_age: float = 0.0) -> bool:
+        return name in self.names(max_age)
+
+_FLAG_CACHE = _FlagCache()
+
+def _refresh_control_events(max_age: float = 0.0) -> None:
+    """Sync STOP_EVENT/RESUME_EVENT with the flag files on disk."""
+    names = _FLAG_CACHE.names(max_age)
+    stop = "stop.flag" in names
+    paused = "pause.flag" in names
+    if stop:
+        STOP_EVENT.set()
+    else:
+        STOP_EVENT.clear()
+    if paused and not stop:
+        RESUME_EVENT.clear()
+    else:
+        RESUME_EVENT.set()
+
+class FlagWatcher(threading.Thread):
+    """Keep the control events in sync with CONTROL_DIR in the background.
+
+    Uses inotify when inotify_simple is installed (blocking in select() until the
+    directory changes or stop() is called), otherwise polls once per second, so
+    checkpoints only read an Event instead of stat()ing the flag files.
+    """
+    def __init__(self, poll_interval: float = 1.0):
+        super().__init__(daemon=True)
+        self._running = True
+        self.poll_interval = poll_interval
+        # Self-pipe used by stop() to wake a blocking select()
+        self._wake_r, self._wake_w = os.pipe()
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._running = False
+        self._stopped.set()
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+
+    def run(self):
+        _refresh_control_events()
+        inotify = None
+        if inotify_simple is not None:
+            try:
+                inotify = inotify_simple.INotify()
+                mask = (inotify_simple.flags.CREATE | inotify_simple.flags.DELETE |
+                        inotify_simple.flags.MOVED_TO | inotify_simple.flags.MOVED_FROM)
+                inotify.add_watch(config.CONTROL_DIR, mask)
+            except Exception:
+                inotify = None
+        try:
+            while self._running:
+                if inotify is not None:
+                    rlist, _, _ = select.select([inotify, self._wake_r], [], [])
+                    if self._wake_r in rlist:
+                        break
+                    inotify.read(timeout=0)
+                elif self._stopped.wait(self.poll_interval):
+                    break
+                _refresh_control_events()
+        finally:
+            if inotify is not None:
+                inotify.close()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+def start_flag_watcher() -> None:
+    """Start the background FlagWatcher once per process."""
+    global _FLAG_WATCHER
+    ensure_control_dir()
+    if _FLAG_WATCHER is None or not _FLAG_WATCHER.is_alive():
+        _FLAG_WATCHER = FlagWatcher()
+        _FLAG_WATCHER.start()
+
 def check_control(current_repo: str):
-    """Blocking wait loop for pause. Stop exits current repo gracefully.
+    """Blocking wait for pause. Stop exits current repo gracefully.
 
     If stop.flag exists: write state and raise SystemExit to abort processing.
-    If pause.flag exists: write state=paused and sleep until it is removed.
+    If pause.flag exists: write state=paused and block until it is removed.
+    Without a running FlagWatcher the flag files are checked directly.
     """
-    ensure_control_dir()
-    stop_flag = _control_path("stop.flag")
-    pause_flag = _control_path("pause.flag")
+    watching = _FLAG_WATCHER is not None and _FLAG_WATCHER.is_alive()
+    if not watching:
+        ensure_control_dir()
+        # Without a watcher, a snapshot up to 1s old is shared by all worker threads
+        _refresh_control_events(max_age=1.0)
     # Stop immediately if requested
-    if os.path.exists(stop_flag):
+    if STOP_EVENT.is_set():
         write_scan_state("stopped", current_repo)
         logging.warning("Stop requested via stop.flag. Halting after current checkpoint.")
         raise SystemExit("Stopped by control flag")
-    # Pause loop
-    while os.path.exists(pause_flag):
+    # Pause until the watcher (or our own re-check) sees pause.flag go away or stop.flag appear
+    if not RESUME_EVENT.is_set():
         write_scan_state("paused", current_repo)
         logging.info("Paused by pause.flag. Remove the flag file to resume...")
         # Print convenience commands to help the user resume/stop
@@ -185,9 +638,10 @@ def check_control(current_repo: str):
             print_control_instructions()
         except Exception:
             pass
-        time.sleep(10)
+        while not RESUME_EVENT.wait(timeout=None if watching else 10):
+            _refresh_control_events()
         # Check stop while paused
-        if os.path.exists(stop_flag):
+        if STOP_EVENT.is_set():
             write_scan_state("stopped", current_repo)
             logging.warning("Stop requested during pause. Halting.")
             raise SystemExit("Stopped by control flag")
@@ -198,10 +652,9 @@ def print_control_instructions():
     """Print convenience commands for pause/resume/stop using the configured control dir."""
     try:
         ensure_control_dir()
-        cdir = config.CONTROL_DIR
-        pause = os.path.join(cdir, "pause.flag")
-        stop = os.path.join(cdir, "stop.flag")
-        state = os.path.join(cdir, "scan_state.json")
+        pause = _control_path("pause.flag")
+        stop = _control_path("stop.flag")
+        state = _control_path("scan_state.json")
         print("[auditgh] Control commands:")
         print(f"  Pause:   touch {pause}")
         print(f"  Resume:  rm {pause}")
@@ -229,9 +682,15 @@ class HotkeyListener(threading.Thread):
     def __init__(self):
         super().__init__(daemon=True)
         self._running = True
+        # Self-pipe used by stop() to wake the blocking select() on stdin
+        self._wake_r, self._wake_w = os.pipe()
 
     def stop(self):
         self._running = False
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
 
     def _toggle_pause(self):
         ensure_control_dir()
@@ -239,6 +698,7 @@ class HotkeyListener(threading.Thread):
         if os.path.exists(pf):
             try:
                 os.remove(pf)
+                _refresh_control_events()
                 print("[auditgh] Hotkey: resume (removed pause.flag)")
             except Exception:
                 pass
@@ -246,6 +706,7 @@ class HotkeyListener(threading.Thread):
             try:
                 with open(pf, 'w'):
                     pass
+                _refresh_control_events()
                 print("[auditgh] Hotkey: pause (created pause.flag)")
             except Exception:
                 pass
@@ -256,6 +717,7 @@ class HotkeyListener(threading.Thread):
         try:
             with open(sf, 'w'):
                 pass
+            _refresh_control_events()
             print("[auditgh] Hotkey: stop (created stop.flag)")
         except Exception:
             pass
@@ -272,9 +734,10 @@ class HotkeyListener(threading.Thread):
         try:
             tty.setcbreak(fd)
             while self._running:
-                rlist, _, _ = select.select([sys.stdin], [], [], 0.5)
-                if not rlist:
-                    continue
+                # No timeout: sleep until a key is pressed or stop() writes to the pipe
+                rlist, _, _ = select.select([sys.stdin, self._wake_r], [], [])
+                if self._wake_r in rlist:
+                    break
                 ch = sys.stdin.read(1)
                 if not ch:
                     continue
@@ -292,6 +755,142 @@ class HotkeyListener(threading.Thread):
             except Exception:
                 pass
 
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON text or bytes, with orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+    catching the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes, with orjson when available.
+
+    Non-ASCII text is written as-is rather than \\uXXXX-escaped, and the stdlib
+    fallback uses compact separators unless indent is requested.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _run_to_file(cmd: List[str], output_path: str, **kwargs: Any) -> subprocess.CompletedProcess:
+    """Run cmd with its stdout redirected straight into output_path.
+
+    The report never passes through Python memory; only stderr is captured (as text).
+    stdin is /dev/null so no tool can block on, or read keystrokes meant for, the
+    interactive pause/stop controls.
+    The returned CompletedProcess has an empty stdout: read output_path instead.
+    Output goes to a temporary sibling that replaces output_path only once the tool
+    has exited, so an interrupted run never leaves a truncated report behind.
+    """
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as out:
+            proc = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=out, stderr=subprocess.PIPE, **kwargs)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout="",
+                                       stderr=proc.stderr.decode(errors="replace"))
+
+def _write_report_bytes(path: str, *chunks: bytes) -> None:
+    """Write byte chunks to path in one os.writev on a raw descriptor.
+
+    Skips Python's buffered IO layer for reports that are already in memory as bytes;
+    a short write resumes where it stopped.
+    """
+    views = [memoryview(c) for c in chunks if c]
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while views:
+            written = os.writev(fd, views)
+            while views and written >= len(views[0]):
+                written -= len(views.pop(0))
+            if views:
+                views[0] = views[0][written:]
+    finally:
+        os.close(fd)
+
+def _read_json_report(path: str, empty: bytes) -> Any:
+    """Decode a report written by _run_to_file, treating empty output as ``empty``.
+
+    With orjson the file is memory-mapped and parsed in place, without first copying
+    it into a bytes object.
+    """
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return _json_loads(f.read() or empty)
+
+# Scanner reports at least this large are stream-parsed with ijson (when installed)
+REPORT_STREAM_MIN_BYTES = 1 << 20
+
+def _report_items(path: str, keys: Tuple[str, ...], empty: bytes = b'') -> Iterable[Any]:
+    """Entries of the array found under ``keys`` (() for a top-level array) in a report on disk.
+
+    Returns [] when there is no such array.
+
+    Large reports are streamed with ijson so only one entry is in memory at a time;
+    smaller ones are decoded whole. Empty output decodes as ``empty`` (by default an
+    error, as with _read_json_file).
+    """
+    if ijson is not None and os.path.getsize(path) >= REPORT_STREAM_MIN_BYTES:
+        def stream() -> Iterator[Any]:
+            with open(path, 'rb') as f:
+                yield from ijson.items(f, '.'.join(keys + ('item',)), use_float=True)
+        return stream()
+    data = _read_json_report(path, empty)
+    for key in keys:
+        data = data.get(key) if isinstance(data, dict) else None
+    return data if isinstance(data, list) else []
+
+# "Severity" members of a Trivy report, matched on the raw bytes (escaped quotes inside
+# strings cannot match), and the result classes besides Vulnerabilities that carry one too
+_TRIVY_SEVERITY_RE = re.compile(rb'"Severity"\s*:\s*"([^"\\]*)"')
+_TRIVY_OTHER_FINDINGS_RE = re.compile(rb'"(?:Secrets|Misconfigurations|Licenses)"\s*:\s*\[')
+
+def _trivy_severity_counts(path: str) -> Counter:
+    """How many vulnerabilities in a Trivy JSON report on disk carry each raw Severity.
+
+    The tally runs inside Counter (in C); callers normalise the few distinct values.
+    When the report holds only vulnerabilities, every "Severity" member belongs to
+    one, so the severities are read with a regex over the memory-mapped file and
+    nothing is parsed. Otherwise large reports are streamed with ijson, which builds
+    only the vulnerability Severity strings, and smaller ones are decoded whole.
+    """
+    if not os.path.getsize(path):
+        return Counter()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if not _TRIVY_OTHER_FINDINGS_RE.search(mm):
+            raw = Counter(_TRIVY_SEVERITY_RE.findall(mm))
+            return Counter({sev.decode('utf-8', 'replace'): n for sev, n in raw.items()})
+    if ijson is not None and os.path.getsize(path) >= REPORT_STREAM_MIN_BYTES:
+        with open(path, 'rb') as f:
+            return Counter(ijson.items(f, 'Results.item.Vulnerabilities.item.Severity'))
+    data = _read_json_report(path, b'{}')
+    results = data.get('Results', []) if isinstance(data, dict) else []
+    return Counter(v.get('Severity') for res in results for v in res.get('Vulnerabilities', []) or [])
+
+def _read_json_file(path: str) -> Any:
+    """Decode a JSON report from disk (an empty file decodes as an error, like empty stdout)."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+def _json_body(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 def get_rate_limit_headers(response: requests.Response) -> dict:
     """Extract rate limit headers from response."""
     return {
@@ -300,9 +899,46 @@ def get_rate_limit_headers(response: requests.Response) -> dict:
         'reset': int(response.headers.get('X-RateLimit-Reset', 0)),
     }
 
-def get_all_repos(session: requests.Session, include_forks: bool = False, include_archived: bool = False, timeout: int = 30) -> list:
+def _get_repo_page(session: requests.Session, url: str, page: int, timeout: int = 30,
+                   max_retries: int = 3, retry_delay: int = 5) -> list:
+    """Fetch one page of a repository listing with rate-limit handling and backoff.
+
+    Raises RequestException once max_retries attempts have failed; waiting out a
+    rate limit does not count as an attempt.
     """
-    Fetch all repositories from the organization with pagination and rate limit handling.
+    params = {
+        'per_page': 100,
+        'page': page,
+        'type': 'all',
+        'sort': 'full_name',
+        'direction': 'asc'
+    }
+    attempt = 0
+    while True:
+        try:
+            logging.debug("Fetching repos page %s...", page)
+            _wait_for_gate()
+            response = session.get(url, params=params, timeout=timeout)
+            check_rate_limits(response)
+            if response.status_code == 403:
+                # Like page 1: wait on the shared gate, then retry the same request
+                handle_rate_limit(response)
+                continue
+            response.raise_for_status()
+            return _json_body(response)
+        except requests.exceptions.RequestException:
+            attempt += 1
+            if attempt >= max_retries:
+                raise
+            wait_time = retry_delay * (2 ** (attempt - 1))
+            logging.warning(f"Page {page} request failed (attempt {attempt}/{max_retries}). Retrying in {wait_time} seconds...")
+            time.sleep(wait_time)
+
+def _fetch_repo_pages(session: requests.Session, include_forks: bool = False, include_archived: bool = False, timeout: int = 30) -> Iterator[List[dict]]:
+    """
+    Yield the organization's repositories one filtered page at a time, with pagination
+    and rate limit handling. Callers can start work on a page and let it be freed
+    instead of holding the whole listing in memory.
     
     Args:
         session: The requests session to use for API calls
@@ -310,30 +946,36 @@ def get_all_repos(session: requests.Session, include_forks: bool = False, includ
         include_archived: Whether to include archived repositories
         timeout: Request timeout in seconds
         
-    Returns:
-        List of repository objects
+    Yields:
+        Lists of repository objects that pass the fork/archived filters
+
+    Raises:
+        requests.exceptions.RequestException: if a page after the first cannot be fetched
     """
     if not all([config.GITHUB_API, config.ORG_NAME, config.HEADERS]):
         logging.error("Missing required configuration for get_all_repos")
-        return []
+        return
     
-    logging.info(f"Fetching repositories for organization: {config.ORG_NAME}")
+    # Bind hot config attributes once for the paging loop
+    api = config.GITHUB_API
+    org = config.ORG_NAME
+    logging.info(f"Fetching repositories for organization: {org}")
     
-    repos = []
     page = 1
     per_page = 100  # Maximum allowed by GitHub API
     max_retries = 3
     retry_delay = 5  # seconds
     # Default to organization endpoint, but fall back to user endpoint on 404
-    api_path = f"/orgs/{config.ORG_NAME}/repos"
+    api_path = f"/orgs/{org}/repos"
     tried_user_fallback = False
+    last_page = 1  # Set from page 1's Link header when there are more pages
     
     while True:
         retry_count = 0
         while retry_count < max_retries:
             try:
                 # Build the API URL with parameters
-                url = f"{config.GITHUB_API}{api_path}"
+                url = f"{api}{api_path}"
                 params = {
                     'per_page': per_page,
                     'page': page,
@@ -342,10 +984,10 @@ def get_all_repos(session: requests.Session, include_forks: bool = False, includ
                     'direction': 'asc'
                 }
                 
-                logging.debug(f"Fetching repos page {page}...")
+                logging.debug("Fetching repos page %s...", page)
+                _wait_for_gate()
                 response = session.get(
                     url,
-                    headers=config.HEADERS,
                     params=params,
                     timeout=timeout
                 )
@@ -360,8 +1002,8 @@ def get_all_repos(session: requests.Session, include_forks: bool = False, includ
                 
                 # Handle 404 for orgs by falling back to user endpoint once
                 if response.status_code == 404 and not tried_user_fallback and api_path.startswith("/orgs/"):
-                    logging.info(f"Organization '{config.ORG_NAME}' not found or inaccessible. Retrying as a user account...")
-                    api_path = f"/users/{config.ORG_NAME}/repos"
+                    logging.info(f"Organization '{org}' not found or inaccessible. Retrying as a user account...")
+                    api_path = f"/users/{org}/repos"
                     tried_user_fallback = True
                     # Reset retries and keep page at 1 for user listing
                     retry_count = 0
@@ -373,18 +1015,28 @@ def get_all_repos(session: requests.Session, include_forks: bool = False, includ
                 response.raise_for_status()
                 
                 # Process the successful response
-                page_repos = response.json()
+                page_repos = _json_body(response)
                 if not page_repos:
                     logging.debug("No more repositories found")
-                    return repos
+                    return
                 
                 # Process repositories from this page
-                process_repositories(page_repos, repos, include_forks, include_archived)
+                batch: List[dict] = []
+                process_repositories(page_repos, batch, include_forks, include_archived)
+                yield batch
+                
+                # The first page's Link header reveals the page count: the rest are
+                # fetched concurrently below, outside this page's retry handlers
+                last_url = response.links.get('last', {}).get('url')
+                if page == 1 and last_url:
+                    last_page = int(parse_qs(urlparse(last_url).query).get('page', ['1'])[0])
+                    if last_page > 1:
+                        break
                 
                 # Check if we've reached the last page
                 if len(page_repos) < per_page:
                     logging.debug("Reached the last page of repositories")
-                    return repos
+                    return
                 
                 # Move to the next page
                 page += 1
@@ -393,14 +1045,14 @@ def get_all_repos(session: requests.Session, include_forks: bool = False, includ
             except requests.exceptions.HTTPError as http_err:
                 # If we already tried user fallback and still got 404, stop early
                 if http_err.response is not None and http_err.response.status_code == 404 and tried_user_fallback:
-                    logging.error(f"Account '{config.ORG_NAME}' not found as organization or user at {url}")
-                    return repos
+                    logging.error(f"Account '{org}' not found as organization or user at {url}")
+                    return
                 retry_count += 1
                 if retry_count >= max_retries:
                     logging.error(f"Failed to fetch repositories after {max_retries} attempts: {str(http_err)}")
                     if hasattr(http_err, 'response') and http_err.response is not None:
                         logging.error(f"Response: {http_err.response.status_code} - {http_err.response.text}")
-                    return repos
+                    return
                 wait_time = retry_delay * (2 ** (retry_count - 1))
                 logging.warning(f"Request failed (attempt {retry_count}/{max_retries}). Retrying in {wait_time} seconds...")
                 time.sleep(wait_time)
@@ -410,13 +1062,46 @@ def get_all_repos(session: requests.Session, include_forks: bool = False, includ
                     logging.error(f"Failed to fetch repositories after {max_retries} attempts: {str(e)}")
                     if hasattr(e, 'response') and e.response is not None:
                         logging.error(f"Response: {e.response.status_code} - {e.response.text}")
-                    return repos
+                    return
                 
                 wait_time = retry_delay * (2 ** (retry_count - 1))  # Exponential backoff
                 logging.warning(f"Request failed (attempt {retry_count}/{max_retries}). Retrying in {wait_time} seconds...")
                 time.sleep(wait_time)
+        
+        if last_page > 1:
+            break
+    
+    # Fetch pages 2..last concurrently and merge them in order. A page that still fails
+    # propagates: stopping here would hand back a silently truncated listing.
+    workers = min(MAX_PAGE_FETCH_WORKERS, last_page - 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pages = pool.map(
+            lambda p: _get_repo_page(session, url, p, timeout),
+            range(2, last_page + 1),
+        )
+        try:
+            for page_repos in pages:
+                batch = []
+                process_repositories(page_repos, batch, include_forks, include_archived)
+                yield batch
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Failed to fetch repositories after {max_retries} attempts: {str(e)}")
+            raise
+
+def get_all_repos(session: requests.Session, include_forks: bool = False, include_archived: bool = False, timeout: int = 30) -> list:
+    """
+    Fetch all repositories from the organization with pagination and rate limit handling.
     
-    return repos
+    Args:
+        session: The requests session to use for API calls
+        include_forks: Whether to include forked repositories
+        include_archived: Whether to include archived repositories
+        timeout: Request timeout in seconds
+        
+    Returns:
+        List of repository objects
+    """
+    return [repo for batch in _fetch_repo_pages(session, include_forks, include_archived, timeout) for repo in batch]
 
 def get_single_repo(session: requests.Session, repo_identifier: str, timeout: int = 30) -> Optional[dict]:
     """Fetch a single repository by name or owner/name.
@@ -432,12 +1117,13 @@ def get_single_repo(session: requests.Session, repo_identifier: str, timeout: in
             owner, name = config.ORG_NAME, repo_identifier
         url = f"{config.GITHUB_API}/repos/{owner}/{name}"
         logging.info(f"Fetching repository: {owner}/{name}")
-        resp = session.get(url, headers=config.HEADERS, timeout=timeout)
+        _wait_for_gate()
+        resp = session.get(url, timeout=timeout)
         if resp.status_code == 404:
             logging.error(f"Repository not found or inaccessible: {owner}/{name}")
             return None
         resp.raise_for_status()
-        return resp.json()
+        return _json_body(resp)
     except requests.exceptions.RequestException as e:
         logging.error(f"Failed to fetch repository {repo_identifier}: {e}")
         return None
@@ -456,38 +1142,136 @@ def check_rate_limits(response: requests.Response) -> None:
                 f"Resets at {reset_dt.strftime('%Y-%m-%d %H:%M:%S')}"
             )
 
-def handle_rate_limit(response: requests.Response) -> None:
-    """Handle GitHub API rate limiting by waiting until the rate limit resets."""
-    if 'X-RateLimit-Reset' in response.headers:
-        reset_time = int(response.headers['X-RateLimit-Reset'])
-        wait_time = max(0, reset_time - int(time.time())) + 5  # Add buffer
-        logging.warning(f"Rate limit reached. Waiting {wait_time} seconds until reset...")
-        time.sleep(wait_time)
+# Shared rate-limit window: threads that hit (or would hit) the limit all wait on the
+# same condition until _RATE_RESET_AT instead of each sleeping on its own schedule
+_RATE_GATE = threading.Condition()
+_RATE_RESET_AT = 0.0
+
+def _wait_for_gate() -> None:
+    """Block while a rate-limit window recorded by handle_rate_limit is open."""
+    with _RATE_GATE:
+        while True:
+            remaining = _RATE_RESET_AT - time.time()
+            if remaining <= 0:
+                return
+            _RATE_GATE.wait(timeout=remaining)
+
+def handle_rate_limit(response: requests.Response, wait: Optional[float] = None) -> None:
+    """Handle GitHub API rate limiting by waiting until the rate limit resets.
+
+    wait, when given, is the number of seconds the caller has already worked out
+    (e.g. from _retry_wait). It is used instead of the response headers.
+    """
+    global _RATE_RESET_AT
+    if wait is not None:
+        reset_at = time.time() + wait
+        message = "Rate limited. Waiting {} seconds..."
+    elif 'X-RateLimit-Reset' in response.headers:
+        reset_at = int(response.headers['X-RateLimit-Reset']) + 5  # Add buffer
+        message = "Rate limit reached. Waiting {} seconds until reset..."
     else:
         # If we don't have reset info, use a default wait time
-        logging.warning("Rate limited but no reset time provided. Waiting 60 seconds...")
-        time.sleep(60)
+        reset_at = time.time() + 60
+        message = "Rate limited but no reset time provided. Waiting {} seconds..."
+    with _RATE_GATE:
+        # Only the first thread to see a new window logs it and wakes the others
+        if reset_at > _RATE_RESET_AT:
+            _RATE_RESET_AT = reset_at
+            logging.warning(message.format(max(0, int(reset_at - time.time()))))
+            _RATE_GATE.notify_all()
+    _wait_for_gate()
 
 def process_repositories(page_repos: list, repos: list, include_forks: bool, include_archived: bool) -> None:
     """Process a page of repositories and add them to the results if they match the criteria."""
+    # Resolve the debug check once per page; %-style args are only formatted when enabled
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
     for repo in page_repos:
-        repo_name = repo.get('name', 'unnamed')
         is_fork = repo.get('fork', False)
         is_archived = repo.get('archived', False)
         
         # Skip based on filters
         if (not include_forks and is_fork) or (not include_archived and is_archived):
-            logging.debug(
-                f"Skipping repository: {repo_name} "
-                f"(fork={is_fork}, archived={is_archived})"
-            )
+            if debug:
+                logging.debug("Skipping repository: %s (fork=%s, archived=%s)",
+                              repo.get('name', 'unnamed'), is_fork, is_archived)
             continue
         
         # Add repository to results
         repos.append(repo)
-        logging.debug(f"Added repository: {repo_name} (fork={is_fork}, archived={is_archived})")
+        if debug:
+            logging.debug("Added repository: %s (fork=%s, archived=%s)",
+                          repo.get('name', 'unnamed'), is_fork, is_archived)
     
-    logging.info(f"Processed {len(page_repos)} repositories. Total so far: {len(repos)}")
+    logging.info("Processed %d repositories, %d match the filters", len(page_repos), len(repos))
+
+def _git_auth_env() -> Dict[str, str]:
+    """Environment for git subprocesses that authenticates via an HTTP header.
+
+    Keeps the token out of argv and out of the persisted mirror config; lazy blob
+    fetches from a partial-clone mirror pick up the same header.
+    """
+    env = os.environ.copy()
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    if config.GITHUB_TOKEN:
+        basic = base64.b64encode(f"x-access-token:{config.GITHUB_TOKEN}".encode()).decode()
+        env.update({
+            "GIT_CONFIG_COUNT": "1",
+            "GIT_CONFIG_KEY_0": "http.extraHeader",
+            "GIT_CONFIG_VALUE_0": f"Authorization: Basic {basic}",
+        })
+    return env
+
+def ensure_bare_mirror(owner: str, repo_name: str, clone_url: str) -> Optional[Tuple[str, str]]:
+    """Create or refresh a persistent blobless bare mirror under config.MIRROR_DIR.
+
+    Returns (mirror_path, revision to check out) or None on failure.
+    """
+    mirror = os.path.join(config.MIRROR_DIR, owner, f"{repo_name}.git")
+    env = _git_auth_env()
+    # Gitleaks history scans need every commit; otherwise the tip is enough
+    depth = [] if config.GITLEAKS_HISTORY else ["--depth", "1"]
+    if os.path.isdir(mirror):
+        # Forget worktrees from previous runs whose directories were removed
+        subprocess.run(["git", "-C", mirror, "worktree", "prune"], capture_output=True, env=env)
+        if config.GITLEAKS_HISTORY and os.path.exists(os.path.join(mirror, "shallow")):
+            depth = ["--unshallow"]
+        cmd = ["git", "-C", mirror, "fetch", "--quiet", "--prune", "--filter=blob:none",
+               *depth, "origin", "HEAD"]
+        rev = "FETCH_HEAD"
+    else:
+        os.makedirs(os.path.dirname(mirror), exist_ok=True)
+        cmd = ["git", "clone", "--quiet", "--bare", "--filter=blob:none", "--single-branch",
+               *depth, clone_url, mirror]
+        rev = "HEAD"
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, env=env, timeout=300)
+    except subprocess.TimeoutExpired:
+        logging.error(f"Mirror update timed out for {owner}/{repo_name}")
+        return None
+    if result.returncode != 0:
+        logging.warning(f"Mirror update failed for {owner}/{repo_name}: {result.stderr.strip()}")
+        if rev == "HEAD":
+            discard_tree(mirror)
+        return None
+    return mirror, rev
+
+def materialize_worktree(mirror: str, rev: str, dest_path: str) -> bool:
+    """Check out `rev` of a bare mirror into dest_path as a detached worktree.
+
+    Missing blobs are fetched from the promisor remote on checkout.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "-C", mirror, "worktree", "add", "--force", "--detach", dest_path, rev],
+            capture_output=True, text=True, env=_git_auth_env(), timeout=300,
+        )
+    except subprocess.TimeoutExpired:
+        logging.error(f"Worktree checkout timed out for {dest_path}")
+        return False
+    if result.returncode != 0:
+        logging.warning(f"Worktree checkout failed for {dest_path}: {result.stderr.strip()}")
+        return False
+    return os.path.isdir(dest_path)
 
 def clone_repo(repo: dict) -> bool:
     """
@@ -519,61 +1303,73 @@ def clone_repo(repo: dict) -> bool:
         logging.error(f"No clone URL found for repository: {repo_name}")
         return False
     
+    owner = (repo.get("owner") or {}).get("login") or \
+        (repo["full_name"].split("/")[0] if "/" in repo.get("full_name", "") else config.ORG_NAME)
+    
     # Insert token into the URL for authentication (no global git config side-effects)
-    if config.GITHUB_TOKEN and "@github.com" not in clone_url and clone_url.startswith("https://"):
-        from urllib.parse import urlparse, urlunparse
-        parsed = urlparse(clone_url)
-        if parsed.scheme == 'https':
-            netloc = f"x-access-token:{config.GITHUB_TOKEN}@{parsed.netloc}"
-            clone_url = urlunparse((
-                parsed.scheme,
-                netloc,
-                parsed.path,
-                parsed.params,
-                parsed.query,
-                parsed.fragment
-            ))
+    auth_clone_url = clone_url
+    if clone_url.startswith("https://") and config.GITHUB_TOKEN and "@github.com" not in clone_url:
+        auth_clone_url = clone_url.replace("https://", f"https://x-access-token:{config.GITHUB_TOKEN}@", 1)
     
     try:
         # Create parent directory if it doesn't exist
-        os.makedirs(config.CLONE_DIR, exist_ok=True)
+        with _CLONE_DIR_LOCK:
+            os.makedirs(config.CLONE_DIR, exist_ok=True)
         
         # Remove existing directory if it exists
         if os.path.exists(dest_path):
             logging.debug(f"Removing existing directory: {dest_path}")
-            shutil.rmtree(dest_path, ignore_errors=True)
+            discard_tree(dest_path)
         
         # Clone the repository with a timeout
         logging.info(f"Cloning {repo_name} from {clone_url} to {dest_path}...")
         
-        # Use subprocess.Popen for better control over the process
-        process = subprocess.Popen(
-            ["git", "clone", "--depth", "1", clone_url, dest_path],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        try:
-            # Wait for the process to complete with a timeout
-            stdout, stderr = process.communicate(timeout=300)  # 5 minute timeout
+        # Use subprocess.Popen for better control over the process; the semaphore bounds
+        # how many clones run at once while other workers keep scanning
+        with _CLONE_SEMAPHORE:
+            # Preferred path: refresh the persistent mirror and check out a worktree, so
+            # re-scans only transfer what changed since the previous run
+            if config.MIRROR_DIR:
+                mirror = ensure_bare_mirror(owner, repo_name, clone_url)
+                if mirror and materialize_worktree(*mirror, dest_path):
+                    logging.info(f"Checked out {repo_name} from mirror {mirror[0]} to {dest_path}")
+                    return True
+                logging.warning(f"Mirror checkout failed for {repo_name}; falling back to a direct clone")
+                if os.path.exists(dest_path):
+                    discard_tree(dest_path)
+            
+            # Partial clone: only blobs reachable from the checked-out tip are transferred.
+            # History is kept only when Gitleaks will walk it.
+            # Only stderr matters (on failure); --quiet keeps it to error lines, and stdout
+            # is discarded without being read or decoded
+            depth = [] if config.GITLEAKS_HISTORY else ["--depth", "1"]
+            process = subprocess.Popen(
+                ["git", "clone", "--quiet", *depth, "--filter=blob:none",
+                 "--single-branch", "--no-tags", auth_clone_url, dest_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
             
-            if process.returncode != 0:
-                error_msg = stderr or "Unknown error"
-                logging.error(f"Failed to clone {repo_name}: {error_msg}")
-                # Clean up partial clone if it exists
+            try:
+                # Wait for the process to complete with a timeout
+                _, stderr = process.communicate(timeout=300)  # 5 minute timeout
+                
+                if process.returncode != 0:
+                    error_msg = stderr.decode(errors="replace").strip() or "Unknown error"
+                    logging.error(f"Failed to clone {repo_name}: {error_msg}")
+                    # Clean up partial clone if it exists
+                    if os.path.exists(dest_path):
+                        discard_tree(dest_path)
+                    return False
+                    
+            except subprocess.TimeoutExpired:
+                # Terminate the process if it times out
+                process.kill()
+                process.communicate()
+                logging.error(f"Clone operation timed out for {repo_name}")
                 if os.path.exists(dest_path):
-                    shutil.rmtree(dest_path, ignore_errors=True)
+                    discard_tree(dest_path)
                 return False
-                
-        except subprocess.TimeoutExpired:
-            # Terminate the process if it times out
-            process.kill()
-            stdout, stderr = process.communicate()
-            logging.error(f"Clone operation timed out for {repo_name}")
-            if os.path.exists(dest_path):
-                shutil.rmtree(dest_path, ignore_errors=True)
-            return False
         
         # Verify the repository was cloned successfully
         if not os.path.isdir(dest_path):
@@ -584,12 +1380,69 @@ def clone_repo(repo: dict) -> bool:
         return True
         
     except Exception as e:
-        logging.error(f"Error cloning {repo_name}: {str(e)}", exc_info=True)
+        # Clone failures are routine (auth, missing repos); only pay for a traceback at DEBUG
+        logging.error("Error cloning %s: %s", repo_name, e,
+                      exc_info=logging.getLogger().isEnabledFor(logging.DEBUG))
         # Clean up on error
         if os.path.exists(dest_path):
-            shutil.rmtree(dest_path, ignore_errors=True)
+            discard_tree(dest_path)
         return False
 
+# Directories never worth descending into when fingerprinting a checkout
+_FINGERPRINT_PRUNE = frozenset({'.git', 'node_modules', '.venv', 'venv', 'dist', '__pycache__', '.tox'})
+# Root-level manifests that make an ecosystem audit applicable
+_ROOT_MARKERS = {
+    'package.json': 'js',
+    'go.mod': 'go',
+    'Gemfile.lock': 'rb',
+    'pom.xml': 'java',
+    'build.gradle': 'java',
+    'build.gradle.kts': 'java',
+}
+# File extensions that make a scanner applicable wherever they appear in the tree
+_EXT_MARKERS = {'.py': 'py', '.tf': 'tf'}
+# GitHub (linguist) language names that stand for an extension marker
+_GH_LANGUAGE_MARKERS = {'Python': 'py', 'HCL': 'tf', 'Terraform': 'tf'}
+
+def fingerprint_repo(repo_path: str, absent: Iterable[str] = ()) -> set:
+    """Detect which ecosystems a checkout contains in a single directory walk.
+
+    Returns a subset of {"py", "js", "go", "rb", "java", "tf"}: "js"/"go"/"rb"/"java"
+    come from manifests at the repository root, "py"/"tf" from files anywhere in the
+    tree (vendored and build directories excluded). Extension markers listed in
+    ``absent`` are known not to occur and are not searched for; when that covers all
+    of them only the repository root is listed.
+    """
+    langs = set()
+    # One scandir walk serves both kinds of marker and returns as soon as every
+    # extension marker still wanted has been seen (root manifests are always listed first)
+    wanted = set(_EXT_MARKERS.values()).difference(absent)
+    stack = [repo_path]
+    while stack:
+        path = stack.pop()
+        at_root = path == repo_path
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _FINGERPRINT_PRUNE:
+                            stack.append(entry.path)
+                        continue
+                    if at_root:
+                        tag = _ROOT_MARKERS.get(entry.name)
+                        if tag and entry.is_file():
+                            langs.add(tag)
+                    tag = _EXT_MARKERS.get(os.path.splitext(entry.name)[1])
+                    if tag:
+                        langs.add(tag)
+                        if not at_root and wanted <= langs:
+                            return langs
+        except OSError:
+            continue
+        if wanted <= langs:
+            return langs
+    return langs
+
 def extract_requirements(repo_path):
     """
     Extract Python dependencies from various dependency files.
@@ -599,12 +1452,17 @@ def extract_requirements(repo_path):
     req_file = os.path.join(repo_path, "requirements.txt")
     if os.path.exists(req_file):
         return req_file, False, "requirements.txt"
+    
+    # Generated requirements are named per repo: workers share config.CLONE_DIR
+    temp_req = os.path.join(config.CLONE_DIR or tempfile.gettempdir(),
+                            f"{os.path.basename(os.path.normpath(repo_path))}_temp_requirements.txt")
         
     # Check for pyproject.toml
     pyproject = os.path.join(repo_path, "pyproject.toml")
     if os.path.exists(pyproject):
         try:
-            data = toml.load(pyproject)
+            with open(pyproject, "rb") as fh:
+                data = tomllib.load(fh)
             deps = []
             
             # Check for modern PEP 621 format
@@ -617,13 +1475,9 @@ def extract_requirements(repo_path):
                     deps.extend(optional_deps)
             
             if deps:
-                temp_req = os.path.join(CLONE_DIR, "temp_requirements.txt")
+                # Skip environment markers for now; one buffered write for the whole file
                 with open(temp_req, "w") as f:
-                    for dep in deps:
-                        # Skip environment markers for now
-                        if ";" in dep:
-                            dep = dep.split(";")[0].strip()
-                        f.write(f"{dep}\n")
+                    f.write("\n".join(dep.partition(";")[0].strip() for dep in deps) + "\n")
                 return temp_req, True, "pyproject.toml"
                 
         except Exception as e:
@@ -634,7 +1488,6 @@ def extract_requirements(repo_path):
     if os.path.exists(setup_py):
         try:
             # Use pipreqs to generate requirements.txt from imports
-            temp_req = os.path.join(CLONE_DIR, "temp_requirements.txt")
             result = subprocess.run(
                 ["pipreqs", "--print", repo_path],
                 capture_output=True,
@@ -649,6 +1502,65 @@ def extract_requirements(repo_path):
     
     return None, False, None
 
+@dataclass(slots=True)
+class ScanResults:
+    """Scanner results for one repository, one field per scan_jobs entry in process_repo.
+
+    A field stays None when the scanner did not apply, was not installed or failed.
+    """
+    safety: Optional[subprocess.CompletedProcess] = None
+    pip_audit: Optional[subprocess.CompletedProcess] = None
+    npm_audit: Optional[subprocess.CompletedProcess] = None
+    govulncheck: Optional[subprocess.CompletedProcess] = None
+    bundle_audit: Optional[subprocess.CompletedProcess] = None
+    dependency_check: Optional[subprocess.CompletedProcess] = None
+    semgrep: Optional[subprocess.CompletedProcess] = None
+    semgrep_taint: Optional[subprocess.CompletedProcess] = None
+    syft_repo: Optional[subprocess.CompletedProcess] = None
+    grype_repo: Optional[subprocess.CompletedProcess] = None
+    syft_image: Optional[subprocess.CompletedProcess] = None
+    grype_image: Optional[subprocess.CompletedProcess] = None
+    checkov: Optional[subprocess.CompletedProcess] = None
+    gitleaks: Optional[subprocess.CompletedProcess] = None
+    bandit: Optional[subprocess.CompletedProcess] = None
+    trivy_fs: Optional[subprocess.CompletedProcess] = None
+
+# (ScanResults field, label) rows of the summary report's status table, in order
+SUMMARY_TOOLS: Tuple[Tuple[str, str], ...] = (
+    ('safety', 'Safety'),
+    ('pip_audit', 'pip-audit'),
+    ('npm_audit', 'npm audit'),
+    ('govulncheck', 'govulncheck'),
+    ('bundle_audit', 'bundle audit'),
+    ('dependency_check', 'OWASP Dependency-Check'),
+    ('semgrep', 'Semgrep'),
+    ('semgrep_taint', 'Semgrep (taint)'),
+    ('checkov', 'Checkov (Terraform)'),
+    ('gitleaks', 'Gitleaks (Secrets)'),
+    ('bandit', 'Bandit (Python)'),
+    ('trivy_fs', 'Trivy (fs)'),
+)
+
+# Fixed Markdown table headers of the summary report
+_STATUS_TABLE_HEADER = "| Tool | Status |\n|------|--------|\n"
+_REPORTS_TABLE_HEADER = "| Report | Link |\n|--------|------|\n"
+_SECRETS_TABLE_HEADER = "| Rule | File:Line | Description |\n|------|-----------|-------------|\n"
+_CONTRIBUTOR_TABLE_HEADER = (
+    "| Contributor | Total Number of Commits | Timestamp of Last Commit | Number of Exploitable Vulnerabilities Introduced by Contributor | Exploitable Code Location |\n"
+    "|---|---:|---|---:|---|\n"
+)
+_VULN_TABLE_HEADER = (
+    "| Type | Package | Severity | Exploitability | Affected | Fixed In | Remediation |\n"
+    "|------|---------|----------|----------------|-----------|-----------|-------------|\n"
+)
+_VULN_LEGEND = "\n> Legend: [KEV] = Known Exploited Vulnerability; EPSS = Exploit Prediction Scoring System probability.\n\n"
+_TI_TABLE_HEADER = "#### Threat Intel Diagnostics\n\n| Package | KEV | EPSS | Notes |\n|---------|-----|------|-------|\n"
+
+# Severity buckets of the per-scanner Markdown summaries, in display order
+_SEVERITY_LEVELS = ("CRITICAL", "HIGH", "MEDIUM", "LOW", "UNKNOWN")
+_SEVERITY_SET = frozenset(_SEVERITY_LEVELS)
+_GRYPE_SEVERITY_LEVELS = ("Critical", "High", "Medium", "Low", "Negligible", "Unknown")
+
 def process_repo(repo: Dict[str, Any], report_dir: str) -> None:
     """
     Process a single repository: clone, scan for vulnerabilities, and generate a report.
@@ -675,7 +1587,7 @@ def process_repo(repo: Dict[str, Any], report_dir: str) -> None:
         return
     
     # Sanitize the repository name for use in file paths
-    safe_repo_name = "".join(c if c.isalnum() or c in '._-' else '_' for c in repo_name)
+    safe_repo_name = repo_name.translate(_SAFE_TABLE)
     
     logging.info(f"Processing repository: {repo_name}")
     
@@ -687,17 +1599,27 @@ def process_repo(repo: Dict[str, Any], report_dir: str) -> None:
     # Initialize error log file
     error_log_path = os.path.join(repo_report_dir, f"{safe_repo_name}_error.log")
     
+    # Opened on the first error and kept open (line-buffered) until process_repo returns
+    error_log = None
+    
     def log_error(message: str) -> None:
         """Helper function to log errors to both console and error log"""
+        nonlocal error_log
         logging.error(message)
-        with open(error_log_path, 'a') as f:
-            f.write(f"{datetime.datetime.now().isoformat()} - {message}\n")
+        if error_log is None:
+            error_log = open(error_log_path, 'a', buffering=1)
+        error_log.write(f"{time.strftime('%Y-%m-%dT%H:%M:%S')} - {message}\n")
+    
+    def close_error_log() -> None:
+        if error_log is not None:
+            error_log.close()
     
     # Clone the repository
     logging.info(f"Cloning repository: {repo_name}")
     if not clone_repo(repo):
         error_msg = f"Failed to clone repository: {repo_name}"
         log_error(error_msg)
+        close_error_log()
         return
     
     # Verify the repository was cloned successfully
@@ -705,6 +1627,7 @@ def process_repo(repo: Dict[str, Any], report_dir: str) -> None:
     if not os.path.isdir(repo_path):
         error_msg = f"Repository directory not found after clone: {repo_path}"
         log_error(error_msg)
+        close_error_log()
         return
         
     logging.info(f"Successfully cloned repository to: {repo_path}")
@@ -713,121 +1636,104 @@ def process_repo(repo: Dict[str, Any], report_dir: str) -> None:
         # Run various security scans
         logging.info(f"Running security scans for {repo_name}...")
         
+        control_id = repo_full_name or repo_name
+        scan_jobs: Dict[str, Tuple[Any, tuple, dict]] = {}
+        
         # Extract requirements for Python projects
         requirements_path, is_temp, source_file = extract_requirements(repo_path)
         if requirements_path:
             logging.info(f"Found requirements file: {source_file} at {requirements_path}")
-            
-            # Run safety scan
-            safety_result = run_safety_scan(requirements_path, repo_name, repo_report_dir)
-            
-            # Run pip-audit scan
-            pip_audit_result = run_pip_audit_scan(requirements_path, repo_name, repo_report_dir)
-            
-            # Clean up temporary requirements file if created
-            if is_temp and os.path.exists(requirements_path):
-                os.remove(requirements_path)
+            # Safety and pip-audit read the requirements file (removed in the finally block)
+            scan_jobs['safety'] = (run_safety_scan, (requirements_path, repo_name, repo_report_dir), {})
+            scan_jobs['pip_audit'] = (run_pip_audit_scan, (requirements_path, repo_name, repo_report_dir), {})
         else:
             logging.info("No Python requirements file found")
-            safety_result = None
-            pip_audit_result = None
-        semgrep_result = None
-        syft_repo_result = None
-        syft_image_result = None
-        grype_repo_result = None
-        grype_image_result = None
-        checkov_result = None
-        gitleaks_result = None
-        semgrep_taint_result = None
-        bandit_result = None
-        trivy_fs_result = None
-        
-        # Control checkpoint
-        check_control(repo_full_name or repo_name)
-        # Run npm audit for Node.js projects
-        npm_audit_result = run_npm_audit(repo_path, repo_name, repo_report_dir)
-        
-        # Control checkpoint
-        check_control(repo_full_name or repo_name)
-        # Run govulncheck for Go projects
-        govulncheck_result = run_govulncheck(repo_path, repo_name, repo_report_dir)
-        
-        # Control checkpoint
-        check_control(repo_full_name or repo_name)
-        # Run bundle audit for Ruby projects
-        bundle_audit_result = run_bundle_audit(repo_path, repo_name, repo_report_dir)
         
-        # Control checkpoint
-        check_control(repo_full_name or repo_name)
-        # Run OWASP Dependency-Check for Java projects
-        dependency_check_result = run_dependency_check(repo_path, repo_name, repo_report_dir)
+        # One walk of the checkout decides which ecosystem-specific scanners apply. When
+        # GitHub's language breakdown shows no Python / HCL, Bandit and Checkov cannot
+        # apply and the walk stops at the root listing; without it, walk the whole tree
+        # (the breakdown is fetched once here and reused by the summary report)
+        absent: set = set()
+        gh_languages: Optional[List[Tuple[str, int]]] = None
+        if repo_full_name and config.GITHUB_TOKEN:
+            gh_languages = get_repo_languages(make_session(), repo_full_name, limit=None)
+            if gh_languages:
+                present = {_GH_LANGUAGE_MARKERS.get(name) for name, _ in gh_languages}
+                absent = set(_EXT_MARKERS.values()) - present
+        langs = fingerprint_repo(repo_path, absent)
+        logging.debug("Detected ecosystems for %s: %s", repo_name, sorted(langs))
         
-        # Control checkpoint
-        check_control(repo_full_name or repo_name)
-        # Run Semgrep scan for the repository
-        semgrep_result = run_semgrep_scan(repo_path, repo_name, repo_report_dir)
-        # Optional Semgrep taint-mode scan
+        # Language ecosystem audits: Node.js, Go, Ruby, Java
+        if 'js' in langs:
+            scan_jobs['npm_audit'] = (run_npm_audit, (repo_path, repo_name, repo_report_dir), {})
+        if 'go' in langs:
+            scan_jobs['govulncheck'] = (run_govulncheck, (repo_path, repo_name, repo_report_dir), {})
+        if 'rb' in langs:
+            scan_jobs['bundle_audit'] = (run_bundle_audit, (repo_path, repo_name, repo_report_dir), {})
+        if 'java' in langs:
+            scan_jobs['dependency_check'] = (run_dependency_check, (repo_path, repo_name, repo_report_dir), {})
+        # Semgrep, plus the optional taint-mode pass
+        scan_jobs['semgrep'] = (run_semgrep_scan, (repo_path, repo_name, repo_report_dir), {})
         if config.SEMGREP_TAINT_CONFIG:
-            check_control(repo_full_name or repo_name)
-            semgrep_taint_result = run_semgrep_taint(repo_path, repo_name, repo_report_dir, config.SEMGREP_TAINT_CONFIG)
+            scan_jobs['semgrep_taint'] = (run_semgrep_taint, (repo_path, repo_name, repo_report_dir, config.SEMGREP_TAINT_CONFIG), {})
+        # Syft SBOMs and Grype vulnerability scans for the repo directory (and Docker image if provided)
+        # (tools that are not installed are skipped here and reported once per run)
+        if _tool_available('syft'):
+            scan_jobs['syft_repo'] = (run_syft, (repo_path, repo_name, repo_report_dir), {"target_type": "repo", "sbom_format": config.SYFT_FORMAT})
+        if _tool_available('grype'):
+            scan_jobs['grype_repo'] = (run_grype, (repo_path, repo_name, repo_report_dir), {"target_type": "repo", "vex_files": config.VEX_FILES})
+        if config.DOCKER_IMAGE:
+            if _tool_available('syft'):
+                scan_jobs['syft_image'] = (run_syft, (config.DOCKER_IMAGE, repo_name, repo_report_dir), {"target_type": "image", "sbom_format": config.SYFT_FORMAT})
+            if _tool_available('grype'):
+                scan_jobs['grype_image'] = (run_grype, (config.DOCKER_IMAGE, repo_name, repo_report_dir), {"target_type": "image", "vex_files": config.VEX_FILES})
+        # Checkov (Terraform), Gitleaks (secrets), Bandit (Python), Trivy filesystem scan
+        if 'tf' in langs and _tool_available('checkov'):
+            scan_jobs['checkov'] = (run_checkov, (repo_path, repo_name, repo_report_dir), {})
+        if _tool_available('gitleaks'):
+            scan_jobs['gitleaks'] = (run_gitleaks, (repo_path, repo_name, repo_report_dir), {})
+        if 'py' in langs and _tool_available('bandit'):
+            scan_jobs['bandit'] = (run_bandit, (repo_path, repo_name, repo_report_dir), {})
+        if _tool_available('trivy'):
+            scan_jobs['trivy_fs'] = (run_trivy_fs, (repo_path, repo_name, repo_report_dir), {})
         
-        # Control checkpoint
-        check_control(repo_full_name or repo_name)
-        # Run Syft to generate SBOM for the repo directory
-        syft_repo_result = run_syft(repo_path, repo_name, repo_report_dir, target_type="repo", sbom_format=config.SYFT_FORMAT)
+        # Scanners are independent, so they share the process-wide _SCAN_POOL. Each job
+        # passes a control checkpoint before it starts, so pause/stop still take effect
+        # between scanners.
+        def _checked(fn, args, kwargs):
+            check_control(control_id)
+            return fn(*args, **kwargs)
         
-        # If Docker image provided, also run Syft on the image
-        if config.DOCKER_IMAGE:
-            syft_image_result = run_syft(config.DOCKER_IMAGE, repo_name, repo_report_dir, target_type="image", sbom_format=config.SYFT_FORMAT)
+        ordered = sorted(scan_jobs.items(), key=lambda kv: _SCAN_ORDER.get(kv[0], len(_SCAN_ORDER)))
+        futures = {_SCAN_POOL.submit(_checked, *job): name for name, job in ordered}
+        results = ScanResults()
+        try:
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    setattr(results, name, future.result())
+                except Exception as e:
+                    log_error(f"{name} scan failed for {repo_name}: {e}")
+        except BaseException:
+            # Stop requested (SystemExit) or interrupted: drop scanners that have not started
+            # and let running ones finish before the clone is removed
+            for future in futures:
+                future.cancel()
+            concurrent.futures.wait(futures)
+            raise
         
         # Control checkpoint
-        check_control(repo_full_name or repo_name)
-        # Run Grype vulnerability scan on the repo directory
-        grype_repo_result = run_grype(repo_path, repo_name, repo_report_dir, target_type="repo", vex_files=config.VEX_FILES)
-        # If Docker image provided, run Grype on the image
-        if config.DOCKER_IMAGE:
-            grype_image_result = run_grype(config.DOCKER_IMAGE, repo_name, repo_report_dir, target_type="image", vex_files=config.VEX_FILES)
-
-        # Control checkpoint
-        check_control(repo_full_name or repo_name)
-        # Run Checkov for Terraform if applicable
-        check_control(repo_full_name or repo_name)
-        checkov_result = run_checkov(repo_path, repo_name, repo_report_dir)
-
-        # Secrets scanning with Gitleaks
-        check_control(repo_full_name or repo_name)
-        gitleaks_result = run_gitleaks(repo_path, repo_name, repo_report_dir)
-
-        # Bandit for Python projects (if any .py files)
-        check_control(repo_full_name or repo_name)
-        bandit_result = run_bandit(repo_path, repo_name, repo_report_dir)
-
-        # Trivy filesystem scan (optional if installed)
-        check_control(repo_full_name or repo_name)
-        trivy_fs_result = run_trivy_fs(repo_path, repo_name, repo_report_dir)
-
-        # Control checkpoint
-        check_control(repo_full_name or repo_name)
+        check_control(control_id)
         # Generate summary report
         generate_summary_report(
             repo_name=repo_name,
             repo_url=repo_url,
             requirements_path=requirements_path if requirements_path else "",
-            safety_result=safety_result,
-            pip_audit_result=pip_audit_result,
-            npm_audit_result=npm_audit_result,
-            govulncheck_result=govulncheck_result,
-            bundle_audit_result=bundle_audit_result,
-            dependency_check_result=dependency_check_result,
-            semgrep_result=semgrep_result,
-            semgrep_taint_result=semgrep_taint_result,
-            checkov_result=checkov_result,
-            gitleaks_result=gitleaks_result,
-            bandit_result=bandit_result,
-            trivy_fs_result=trivy_fs_result,
+            results=results,
             repo_local_path=repo_path,
             report_dir=repo_report_dir,
-            repo_full_name=repo_full_name
+            repo_full_name=repo_full_name,
+            languages=gh_languages
         )
         
         logging.info(f"Completed processing repository: {repo_name}")
@@ -836,9 +1742,9 @@ def process_repo(repo: Dict[str, Any], report_dir: str) -> None:
         try:
             summary_path = os.path.join(repo_report_dir, f"{repo_name}_summary.md")
             if os.path.exists(summary_path):
-                print(f"[auditgh] {repo_name}: summary -> {summary_path}")
+                progress(f"[auditgh] {repo_name}: summary -> {summary_path}")
             else:
-                print(f"[auditgh] {repo_name}: reports -> {repo_report_dir}")
+                progress(f"[auditgh] {repo_name}: reports -> {repo_report_dir}")
         except Exception:
             pass
         
@@ -848,6 +1754,7 @@ def process_repo(repo: Dict[str, Any], report_dir: str) -> None:
         logging.exception("Unexpected error:")
         
     finally:
+        close_error_log()
         # Clean up temporary files
         if 'requirements_path' in locals() and is_temp and requirements_path and os.path.exists(requirements_path):
             try:
@@ -859,7 +1766,7 @@ def process_repo(repo: Dict[str, Any], report_dir: str) -> None:
         # Clean up the cloned repository if it exists
         if repo_path and os.path.exists(repo_path):
             try:
-                shutil.rmtree(repo_path, ignore_errors=True)
+                discard_tree(repo_path)
                 logging.debug(f"Cleaned up repository directory: {repo_path}")
             except Exception as e:
                 logging.warning(f"Failed to clean up repository directory {repo_path}: {e}")
@@ -879,8 +1786,9 @@ def run_safety_scan(requirements_path, repo_name, report_dir):
     ]
     
     try:
-        logging.debug(f"Running command: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        logging.debug("Running command: %s", cmd)
+        # Kept as bytes: the JSON is written to disk and decoded straight from bytes
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True)
         
         # If we get no output but the command succeeded, it might mean no vulnerabilities
         if not result.stdout.strip() and result.returncode == 0:
@@ -893,16 +1801,14 @@ def run_safety_scan(requirements_path, repo_name, report_dir):
                 stderr=result.stderr
             )
         
-        # Write results to file
-        with open(output_path, "w") as f:
-            f.write(result.stdout or "")
-            if result.stderr:
-                f.write("\n[ERROR] stderr output:\n")
-                f.write(result.stderr)
-            
-            # Add warning if there were issues
-            if result.returncode != 0:
-                f.write("\n[WARNING] Safety scan completed with non-zero exit code")
+        # Write results to file (stdout, then any stderr and the non-zero exit warning)
+        _write_report_bytes(
+            output_path,
+            result.stdout,
+            b"\n[ERROR] stderr output:\n" if result.stderr else b"",
+            result.stderr,
+            b"\n[WARNING] Safety scan completed with non-zero exit code" if result.returncode != 0 else b"",
+        )
         
         if result.returncode != 0:
             logging.warning(f"Safety scan exited with code {result.returncode} for {repo_name}")
@@ -927,30 +1833,26 @@ def run_semgrep_taint(repo_path: str, repo_name: str, report_dir: str, config_pa
     output_md = os.path.join(report_dir, f"{repo_name}_semgrep_taint.md")
     os.makedirs(report_dir, exist_ok=True)
     cmd = ["semgrep", "--config", config_path, "--json", "--quiet", repo_path]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    with open(output_json, 'w') as f:
-        f.write(result.stdout or "")
+    result = _run_to_file(cmd, output_json)
     try:
-        data = json.loads(result.stdout or '{}')
+        data = _read_json_file(output_json) if os.path.getsize(output_json) else {}
     except Exception:
         data = {}
-    # Minimal exploitable flows summary
+    # Minimal exploitable flows summary, built in memory and written once
+    parts = ["# Semgrep Taint-Mode (Exploitable Flows)\n\n"]
+    flows = data.get('results', []) if isinstance(data, dict) else []
+    if not flows:
+        parts.append("No exploitable flows found or ruleset produced no results.\n")
+    else:
+        # show up to 10 flows with source->sink
+        for r in flows[:10]:
+            path = r.get('path','')
+            m = (r.get('extra') or _EMPTY).get('message','')
+            start = (r.get('start') or _EMPTY).get('line')
+            end = (r.get('end') or _EMPTY).get('line')
+            parts.append(f"- {path}:{start}-{end} — {m}\n")
     with open(output_md, 'w') as f:
-        f.write("# Semgrep Taint-Mode (Exploitable Flows)\n\n")
-        flows = data.get('results', []) if isinstance(data, dict) else []
-        if not flows:
-            f.write("No exploitable flows found or ruleset produced no results.\n")
-        else:
-            # show up to 10 flows with source->sink
-            count = 0
-            for r in flows:
-                if count >= 10: break
-                path = r.get('path','')
-                m = r.get('extra',{}).get('message','')
-                start = r.get('start',{}).get('line')
-                end = r.get('end',{}).get('line')
-                f.write(f"- {path}:{start}-{end} — {m}\n")
-                count += 1
+        f.write("".join(parts))
     return result
 
 def run_pip_audit_scan(requirements_path, repo_name, report_dir):
@@ -963,42 +1865,48 @@ def run_pip_audit_scan(requirements_path, repo_name, report_dir):
     try:
         # First try with markdown output
         cmd = base_cmd + ["--output", "markdown"]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True)
         
         # If markdown output fails, try with JSON and convert
         if result.returncode != 0 or not result.stdout.strip():
             logging.debug("Markdown output failed, trying JSON output")
             cmd = base_cmd + ["--format", "json"]
-            json_result = subprocess.run(cmd, capture_output=True, text=True)
+            # Kept as bytes: decoded straight into objects, never used as text
+            json_result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True)
             
             if json_result.returncode == 0 and json_result.stdout.strip():
                 try:
                     # Convert JSON to markdown
-                    data = json.loads(json_result.stdout)
-                    markdown = "# pip-audit Report\n\n"
+                    data = _json_loads(json_result.stdout)
+                    parts = ["# pip-audit Report\n\n"]
                     
                     if "vulnerabilities" in data and data["vulnerabilities"]:
-                        markdown += "## Vulnerabilities\n\n"
+                        parts.append("## Vulnerabilities\n\n")
                         for vuln in data["vulnerabilities"]:
                             pkg = vuln.get("package", {})
-                            markdown += f"### {pkg.get('name', 'Unknown')} {pkg.get('version', '')}\n"
-                            markdown += f"- **ID:** {vuln.get('id', 'Unknown')}\n"
+                            parts.append(f"### {pkg.get('name', 'Unknown')} {pkg.get('version', '')}\n")
+                            parts.append(f"- **ID:** {vuln.get('id', 'Unknown')}\n")
                             if "fix_versions" in vuln and vuln["fix_versions"]:
-                                markdown += f"- **Fixed in:** {', '.join(vuln['fix_versions'])}\n"
+                                parts.append(f"- **Fixed in:** {', '.join(vuln['fix_versions'])}\n")
                             if "details" in vuln:
-                                markdown += f"\n{vuln['details']}\n"
-                            markdown += "\n---\n\n"
+                                parts.append(f"\n{vuln['details']}\n")
+                            parts.append("\n---\n\n")
                     else:
-                        markdown += "No vulnerabilities found.\n"
+                        parts.append("No vulnerabilities found.\n")
                     
                     result = subprocess.CompletedProcess(
                         args=cmd,
                         returncode=0,
-                        stdout=markdown,
-                        stderr=json_result.stderr
+                        stdout="".join(parts),
+                        stderr=json_result.stderr.decode(errors="replace")
                     )
                 except json.JSONDecodeError:
-                    result = json_result
+                    result = subprocess.CompletedProcess(
+                        args=cmd,
+                        returncode=json_result.returncode,
+                        stdout=json_result.stdout.decode(errors="replace"),
+                        stderr=json_result.stderr.decode(errors="replace")
+                    )
         
         # Write the output to file
         with open(output_path, "w") as f:
@@ -1026,88 +1934,123 @@ def run_pip_audit_scan(requirements_path, repo_name, report_dir):
         )
 
 
+# npm's own severity order (as used in audit metadata), for the summary list
+_NPM_SEVERITY_ORDER = {'info': 0, 'low': 1, 'moderate': 2, 'high': 3, 'critical': 4}
+# npm audit reports at least this large are stream-parsed with ijson (when installed)
+NPM_STREAM_MIN_BYTES = 1 << 20
+
+def _npm_report_sections(path: str):
+    """Return a function mapping a top-level npm audit key to its (key, entry) pairs.
+
+    Large reports are stream-parsed from disk with ijson (when installed), one entry
+    at a time; smaller ones are decoded once and served from memory.
+    """
+    if ijson is not None and os.path.getsize(path) >= NPM_STREAM_MIN_BYTES:
+        def section(name: str) -> Iterator[Tuple[str, Any]]:
+            with open(path, 'rb') as f:
+                yield from ijson.kvitems(f, name)
+        return section
+    with open(path, 'rb') as f:
+        data = _json_loads(f.read())
+    def section(name: str):
+        value = data.get(name) if isinstance(data, dict) else None
+        return value.items() if isinstance(value, dict) else ()
+    return section
+
 def run_npm_audit(repo_path, repo_name, report_dir):
-    """Run npm audit for Node.js projects."""
+    """Run npm audit for Node.js projects (caller checks for package.json)."""
     output_path = os.path.join(report_dir, f"{repo_name}_npm_audit.json")
     logging.info(f"Running npm audit for {repo_name}...")
-    
-    if not os.path.exists(os.path.join(repo_path, "package.json")):
-        return None
         
     try:
         cmd = ["npm", "audit", "--json"]
-        result = subprocess.run(
-            cmd,
-            cwd=repo_path,
-            capture_output=True,
-            text=True
-        )
-        
-        with open(output_path, "w") as f:
-            f.write(result.stdout)
+        # npm writes its report straight into the JSON file; the Markdown is rendered
+        # from that file, so the report is never held in memory as a string
+        with tempfile.TemporaryFile() as err, open(output_path, "wb") as out:
+            returncode = subprocess.run(cmd, cwd=repo_path, stdin=subprocess.DEVNULL, stdout=out, stderr=err).returncode
+            err.seek(0)
+            stderr = err.read().decode(errors="replace")
+        result = subprocess.CompletedProcess(cmd, returncode, stdout="", stderr=stderr)
             
         # Convert to markdown (handle both legacy 'advisories' and modern 'vulnerabilities' schemas)
         md_output = os.path.join(report_dir, f"{repo_name}_npm_audit.md")
         try:
-            data = json.loads(result.stdout)
-            with open(md_output, "w") as f:
-                f.write(f"# npm Audit Report\n\n")
-                f.write(f"**Repository:** {repo_name}\n\n")
+            section = _npm_report_sections(output_path)
+            # Build the whole report in memory and write it once
+            parts: List[str] = []
+            w = parts.append
+            w(f"# npm Audit Report\n\n")
+            w(f"**Repository:** {repo_name}\n\n")
+            # The summary precedes the findings but is only known after them
+            summary_at = len(parts)
+            w("")
+
+            # Legacy schema: 'advisories'
+            legacy = False
+            for _id, adv in section('advisories'):
+                if not legacy:
+                    legacy = True
+                    w("## Vulnerabilities\n\n")
+                w(f"### {adv.get('module_name','unknown')} ({adv.get('vulnerable_versions','unknown')})\n")
+                w(f"**Severity:** {adv.get('severity','unknown').title()}\n")
+                w(f"**Vulnerable Versions:** {adv.get('vulnerable_versions','unknown')}\n")
+                w(f"**Fixed In:** {adv.get('patched_versions','None')}\n")
+                w(f"**Title:** {adv.get('title','No title')}\n")
+                overview = adv.get('overview') or adv.get('recommendation') or 'No overview'
+                w(f"**Overview:** {overview}\n")
+                if adv.get('url'):
+                    w(f"**More Info:** {adv['url']}\n")
+                w("\n---\n\n")
+
+            # Modern schema: 'vulnerabilities' is a dict keyed by package
+            counts: Counter = Counter()
+            if not legacy:
+                for pkg, vuln in section('vulnerabilities'):
+                    if not counts:
+                        w("## Vulnerabilities\n\n")
+                    counts[(vuln.get('severity') or 'unknown').lower()] += 1
+                    severity = (vuln.get('severity') or 'unknown').title()
+                    rng = vuln.get('range') or vuln.get('vulnerable_versions') or 'unknown'
+                    fix = vuln.get('fixAvailable')
+                    if isinstance(fix, dict):
+                        fixed_in = f"{fix.get('name', pkg)}@{fix.get('version','unknown')}"
+                    elif fix is True:
+                        fixed_in = 'Update to latest'
+                    else:
+                        fixed_in = 'No fix available'
+
+                    title = ' | '.join(sorted({(i.get('title') if isinstance(i, dict) else str(i)) for i in (vuln.get('via') or []) if i})) or 'No title'
+                    nodes = vuln.get('nodes') or []
+                    sample_paths = '\n'.join(f"  - `{n}`" for n in nodes[:5]) if nodes else '  - (paths not provided)'
+
+                    w(f"### {pkg}\n")
+                    w(f"**Severity:** {severity}\n")
+                    w(f"**Vulnerable Range:** {rng}\n")
+                    w(f"**Fixed In:** {fixed_in}\n")
+                    w(f"**Title(s):** {title}\n")
+                    w(f"**Sample Paths:**\n{sample_paths}\n")
+                    w("\n---\n\n")
+            if not legacy and not counts:
+                w("## No vulnerabilities found\n")
+
+            # Summary: count the modern per-package entries directly, otherwise fall
+            # back to metadata (npm 7+ adds its own 'total', which must not be summed)
+            if counts:
+                vulns_summary = dict(sorted(counts.items(), key=lambda kv: _NPM_SEVERITY_ORDER.get(kv[0], -1)))
+            else:
+                metadata = dict(section('metadata'))
+                vulns_summary = {k: v for k, v in (metadata.get('vulnerabilities') or {}).items() if k != 'total'}
+            if vulns_summary:
+                parts[summary_at] = (
+                    "## Summary\n\n"
+                    + "".join(f"- {sev.title()}: {count}\n" for sev, count in vulns_summary.items())
+                    + f"- Total: {sum(vulns_summary.values())}\n\n"
+                )
 
-                # Summary from metadata if available
-                metadata = data.get('metadata') or {}
-                vulns_summary = metadata.get('vulnerabilities') or {}
-                if vulns_summary:
-                    f.write("## Summary\n\n")
-                    for sev, count in vulns_summary.items():
-                        f.write(f"- {sev.title()}: {count}\n")
-                    total = sum(vulns_summary.values())
-                    f.write(f"- Total: {total}\n\n")
-
-                # Legacy schema: 'advisories'
-                if isinstance(data.get('advisories'), dict) and data['advisories']:
-                    f.write("## Vulnerabilities\n\n")
-                    for adv in data['advisories'].values():
-                        f.write(f"### {adv.get('module_name','unknown')} ({adv.get('vulnerable_versions','unknown')})\n")
-                        f.write(f"**Severity:** {adv.get('severity','unknown').title()}\n")
-                        f.write(f"**Vulnerable Versions:** {adv.get('vulnerable_versions','unknown')}\n")
-                        f.write(f"**Fixed In:** {adv.get('patched_versions','None')}\n")
-                        f.write(f"**Title:** {adv.get('title','No title')}\n")
-                        overview = adv.get('overview') or adv.get('recommendation') or 'No overview'
-                        f.write(f"**Overview:** {overview}\n")
-                        if adv.get('url'):
-                            f.write(f"**More Info:** {adv['url']}\n")
-                        f.write("\n---\n\n")
-
-                # Modern schema: 'vulnerabilities' is a dict keyed by package
-                elif isinstance(data.get('vulnerabilities'), dict) and data['vulnerabilities']:
-                    f.write("## Vulnerabilities\n\n")
-                    for pkg, vuln in data['vulnerabilities'].items():
-                        severity = (vuln.get('severity') or 'unknown').title()
-                        rng = vuln.get('range') or vuln.get('vulnerable_versions') or 'unknown'
-                        fix = vuln.get('fixAvailable')
-                        if isinstance(fix, dict):
-                            fixed_in = f"{fix.get('name', pkg)}@{fix.get('version','unknown')}"
-                        elif fix is True:
-                            fixed_in = 'Update to latest'
-                        else:
-                            fixed_in = 'No fix available'
-
-                        title = ' | '.join(sorted({(i.get('title') if isinstance(i, dict) else str(i)) for i in (vuln.get('via') or []) if i})) or 'No title'
-                        nodes = vuln.get('nodes') or []
-                        sample_paths = '\n'.join(f"  - `{n}`" for n in nodes[:5]) if nodes else '  - (paths not provided)'
-
-                        f.write(f"### {pkg}\n")
-                        f.write(f"**Severity:** {severity}\n")
-                        f.write(f"**Vulnerable Range:** {rng}\n")
-                        f.write(f"**Fixed In:** {fixed_in}\n")
-                        f.write(f"**Title(s):** {title}\n")
-                        f.write(f"**Sample Paths:**\n{sample_paths}\n")
-                        f.write("\n---\n\n")
-                else:
-                    f.write("## No vulnerabilities found\n")
+            with open(md_output, "w") as f:
+                f.write("".join(parts))
 
-        except json.JSONDecodeError:
+        except Exception:
             with open(md_output, "w") as f:
                 f.write("Error parsing npm audit output\n")
                 f.write(result.stderr or "No error details available")
@@ -1120,76 +2063,118 @@ def run_npm_audit(repo_path, repo_name, report_dir):
             f.write(f"Error running npm audit: {e}")
         return None
 
+_WS_RE = re.compile(r'\s*')
+
+def _iter_json_values(chunks: Iterator[str]) -> Iterator[Any]:
+    """Yield each JSON value from a stream of concatenated JSON documents.
+
+    Documents may be pretty-printed across many lines and split at any chunk boundary;
+    raw_decode picks them off the buffer in place. A document still incomplete when
+    the stream ends raises json.JSONDecodeError.
+    """
+    decode = json.JSONDecoder().raw_decode
+    buf = ""
+    for chunk in itertools.chain(chunks, (None,)):
+        final = chunk is None
+        if not final:
+            buf += chunk
+        idx = 0
+        while True:
+            idx = _WS_RE.match(buf, idx).end()
+            if idx == len(buf):
+                break
+            try:
+                value, idx = decode(buf, idx)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break  # incomplete document: wait for the next chunk
+            yield value
+        buf = buf[idx:]
+
 def run_govulncheck(repo_path, repo_name, report_dir):
-    """Run govulncheck for Go projects."""
+    """Run govulncheck for Go projects (caller checks for go.mod)."""
     output_path = os.path.join(report_dir, f"{repo_name}_govulncheck.json")
     logging.info(f"Running govulncheck for {repo_name}...")
-    
-    if not os.path.exists(os.path.join(repo_path, "go.mod")):
-        return None
         
     try:
         cmd = ["govulncheck", "-json", "./..."]
-        result = subprocess.run(
-            cmd,
-            cwd=repo_path,
-            capture_output=True,
-            text=True
-        )
+        md_output = os.path.join(report_dir, f"{repo_name}_govulncheck.md")
+        # Build the whole report in memory and write it once
+        parts = [f"# Go Vulnerability Check Report\n\n", f"**Repository:** {repo_name}\n\n"]
+        seen_output = False
+        parse_error = False
         
-        with open(output_path, "w") as f:
-            f.write(result.stdout)
+        # Stream the JSON straight from the pipe: each chunk is copied to the raw
+        # report and its documents decoded once (govulncheck pretty-prints objects
+        # over several lines, so they are not split on newlines), so the full stdout
+        # is never held in memory. stderr is spooled to a temp file so a chatty tool
+        # cannot fill its pipe and stall while we are still reading stdout.
+        with tempfile.TemporaryFile(mode="w+") as err, open(output_path, "w") as out:
+            proc = subprocess.Popen(
+                cmd,
+                cwd=repo_path,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=err,
+                text=True,
+                bufsize=1 << 20,
+            )
             
-        # Convert to markdown
-        md_output = os.path.join(report_dir, f"{repo_name}_govulncheck.md")
-        with open(md_output, "w") as f:
-            f.write(f"# Go Vulnerability Check Report\n\n")
-            f.write(f"**Repository:** {repo_name}\n\n")
+            def chunks() -> Iterator[str]:
+                for chunk in iter(lambda: proc.stdout.read(1 << 16), ""):
+                    out.write(chunk)
+                    yield chunk
             
-            if result.stdout.strip():
+            with proc.stdout:
                 try:
-                    for line in result.stdout.splitlines():
-                        if line.strip():
-                            vuln = json.loads(line)
-                            if vuln.get("Type") == "vuln":
-                                f.write(f"## {vuln.get('OSV', 'Unknown')}\n")
-                                f.write(f"**Module:** {vuln.get('PkgPath', 'Unknown')}\n")
-                                f.write(f"**Version:** {vuln.get('FoundIn', 'Unknown')}\n")
-                                f.write(f"**Fixed In:** {vuln.get('FixedIn', 'Not fixed')}\n")
-                                f.write(f"**Details:** {vuln.get('Details', 'No details')}\n")
-                                f.write("\n---\n\n")
+                    for vuln in _iter_json_values(chunks()):
+                        seen_output = True
+                        if isinstance(vuln, dict) and vuln.get("Type") == "vuln":
+                            parts.append(
+                                f"## {vuln.get('OSV', 'Unknown')}\n"
+                                f"**Module:** {vuln.get('PkgPath', 'Unknown')}\n"
+                                f"**Version:** {vuln.get('FoundIn', 'Unknown')}\n"
+                                f"**Fixed In:** {vuln.get('FixedIn', 'Not fixed')}\n"
+                                f"**Details:** {vuln.get('Details', 'No details')}\n"
+                                "\n---\n\n"
+                            )
                 except json.JSONDecodeError:
-                    f.write("Error parsing govulncheck output\n")
-                    f.write(result.stderr or "No error details available")
-            else:
-                f.write("## No vulnerabilities found\n")
+                    parse_error = True
+                    # Keep copying the rest of the output into the raw report
+                    for _chunk in chunks():
+                        pass
+            returncode = proc.wait()
+            err.seek(0)
+            stderr = err.read()
+        
+        if parse_error:
+            parts.append("Error parsing govulncheck output\n")
+            parts.append(stderr or "No error details available")
+        elif not seen_output:
+            parts.append("## No vulnerabilities found\n")
+        with open(md_output, "w") as f:
+            f.write("".join(parts))
                 
-        return result
+        return subprocess.CompletedProcess(cmd, returncode, stdout="", stderr=stderr)
         
     except Exception as e:
         logging.error(f"Error running govulncheck: {e}")
         with open(output_path, "w") as f:
             f.write(f"Error running govulncheck: {e}")
         return None
-    finally:
-        # Clean up the temporary directory if the clone failed
-        if temp_dir and os.path.exists(temp_dir) and not os.path.isdir(os.path.join(temp_dir, repo_name)):
-            logging.debug(f"Cleaning up temporary directory: {temp_dir}")
-            shutil.rmtree(temp_dir, ignore_errors=True)
 
 def run_bundle_audit(repo_path, repo_name, report_dir):
-    """Run bundle audit for Ruby projects."""
+    """Run bundle audit for Ruby projects (caller checks for Gemfile.lock)."""
     output_path = os.path.join(report_dir, f"{repo_name}_bundle_audit.txt")
     logging.info(f"Running bundle audit for {repo_name}...")
-    
-    if not os.path.exists(os.path.join(repo_path, "Gemfile.lock")):
-        return None
         
     try:
         cmd = ["bundle", "audit", "--update"]
         result = subprocess.run(
             cmd,
             cwd=repo_path,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True
         )
@@ -1208,9 +2193,30 @@ def run_bundle_audit(repo_path, repo_name, report_dir):
             f.write(f"Error running bundle audit: {e}")
         return None
 
+def _ensure_dc_db(dc_bin: str, env: Dict[str, str]) -> bool:
+    """Update the Dependency-Check NVD data once per run; True if it is current.
+
+    The first Java repository runs the update while later ones wait on the lock, so
+    every scan after it can pass --noupdate.
+    """
+    global _DC_DB_READY
+    with _DC_DB_LOCK:
+        if _DC_DB_READY is None:
+            logging.info("Updating OWASP Dependency-Check data (first Java repository)...")
+            try:
+                res = subprocess.run([dc_bin, "--updateonly", "--data", DC_DATA_DIR], env=env,
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=60*60)
+                _DC_DB_READY = res.returncode == 0
+                if not _DC_DB_READY:
+                    logging.warning(f"Dependency-Check update failed: {res.stderr.decode(errors='replace').strip()}")
+            except Exception as e:
+                logging.warning(f"Dependency-Check update failed: {e}")
+                _DC_DB_READY = False
+        return _DC_DB_READY
+
 def run_dependency_check(repo_path, repo_name, report_dir):
     """
-    Run OWASP Dependency-Check for Java projects.
+    Run OWASP Dependency-Check for Java projects (caller checks for a Maven/Gradle build file).
     
     Args:
         repo_path: Path to the repository
@@ -1223,19 +2229,11 @@ def run_dependency_check(repo_path, repo_name, report_dir):
     output_dir = os.path.join(report_dir, f"{repo_name}_dependency_check")
     output_path = os.path.join(output_dir, "dependency-check-report.json")
     logging.info(f"Running OWASP Dependency-Check for {repo_name}...")
-    
-    # Check for common Java build files
-    java_project = any(
-        os.path.exists(os.path.join(repo_path, f)) 
-        for f in ["pom.xml", "build.gradle", "build.gradle.kts"]
-    )
-    if not java_project:
-        return None
         
     try:
         # Skip if dependency-check is not installed
         # Prefer Python wrapper 'dependency-check' (dependency-check-py), fallback to shell script if present
-        dc_bin = shutil.which("dependency-check") or shutil.which("dependency-check.sh")
+        dc_bin = _which("dependency-check") or _which("dependency-check.sh")
         if not dc_bin:
             logging.info("OWASP Dependency-Check not found on PATH; skipping for this repository")
             return None
@@ -1258,52 +2256,59 @@ def run_dependency_check(repo_path, repo_name, report_dir):
         # Prefer not to fail the whole scan due to minor issues
         cmd += ["--disableAssembly"]
         
-        # Ensure a cache/data directory for NVD to avoid repeated downloads
-        env = os.environ.copy()
-        data_dir = env.get("DC_DATA_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "dependency-check")
-        os.makedirs(data_dir, exist_ok=True)
-        env["DC_DATA_DIR"] = data_dir
+        # Shared cache/data directory for NVD to avoid repeated downloads
+        env = {**os.environ, "DC_DATA_DIR": DC_DATA_DIR}
+        cmd += ["--data", DC_DATA_DIR]
+        if _ensure_dc_db(dc_bin, env):
+            cmd += ["--noupdate"]
         
-        logging.debug(f"Running Dependency-Check: {' '.join(cmd)}")
+        logging.debug("Running Dependency-Check: %s", cmd)
         
-        result = subprocess.run(cmd, capture_output=True, text=True, env=env, timeout=60*20)
+        # The report goes to --out; the console log is not needed, so it is not captured
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                env=env, timeout=60*20)
         
         # Convert to markdown if the report was generated
         if os.path.exists(output_path):
             md_output = os.path.join(report_dir, f"{repo_name}_dependency_check.md")
             try:
-                with open(output_path, 'r') as f:
-                    data = json.load(f)
+                data = _read_json_file(output_path)
                     
-                with open(md_output, 'w') as f:
-                    f.write(f"# OWASP Dependency-Check Report\n\n")
-                    f.write(f"**Repository:** {repo_name}\n")
-                    f.write(f"**Generated:** {data.get('projectInfo', {}).get('reportDate', 'Unknown')}\n\n")
+                # Build the whole report in memory and write it once
+                parts = [
+                    f"# OWASP Dependency-Check Report\n\n",
+                    f"**Repository:** {repo_name}\n",
+                    f"**Generated:** {data.get('projectInfo', {}).get('reportDate', 'Unknown')}\n\n",
+                ]
+                
+                if 'dependencies' in data:
+                    vuln_count = sum(1 for dep in data['dependencies'] 
+                                  if 'vulnerabilities' in dep and dep['vulnerabilities'])
+                    parts.append(f"## Summary\n"
+                                 f"- **Total Dependencies:** {len(data['dependencies'])}\n"
+                                 f"- **Vulnerable Dependencies:** {vuln_count}\n\n")
                     
-                    if 'dependencies' in data:
-                        vuln_count = sum(1 for dep in data['dependencies'] 
-                                      if 'vulnerabilities' in dep and dep['vulnerabilities'])
-                        f.write(f"## Summary\n")
-                        f.write(f"- **Total Dependencies:** {len(data['dependencies'])}\n")
-                        f.write(f"- **Vulnerable Dependencies:** {vuln_count}\n\n")
-                        
-                        if vuln_count > 0:
-                            f.write("## Vulnerable Dependencies\n\n")
-                            for dep in data['dependencies']:
-                                if 'vulnerabilities' in dep and dep['vulnerabilities']:
-                                    f.write(f"### {dep.get('fileName', 'Unknown')}\n")
-                                    f.write(f"**Version:** {dep.get('version', 'Unknown')}\n")
-                                    f.write(f"**Vulnerabilities:** {len(dep['vulnerabilities'])}\n\n")
-                                    
-                                    for vuln in dep['vulnerabilities']:
-                                        f.write(f"#### {vuln.get('name', 'Unknown')}\n")
-                                        f.write(f"**Severity:** {vuln.get('severity', 'Unknown').title()}\n")
-                                        f.write(f"**CVSS Score:** {vuln.get('cvssv3', {}).get('baseScore', 'N/A')}\n")
-                                        f.write(f"**Description:** {vuln.get('description', 'No description')}\n")
-                                        f.write(f"**Solution:** {vuln.get('solution', 'No solution provided')}\n")
-                                        f.write("\n---\n\n")
-                    else:
-                        f.write("## No vulnerabilities found\n")
+                    if vuln_count > 0:
+                        parts.append("## Vulnerable Dependencies\n\n")
+                        for dep in data['dependencies']:
+                            if 'vulnerabilities' in dep and dep['vulnerabilities']:
+                                parts.append(f"### {dep.get('fileName', 'Unknown')}\n"
+                                             f"**Version:** {dep.get('version', 'Unknown')}\n"
+                                             f"**Vulnerabilities:** {len(dep['vulnerabilities'])}\n\n")
+                                
+                                for vuln in dep['vulnerabilities']:
+                                    parts.append(
+                                        f"#### {vuln.get('name', 'Unknown')}\n"
+                                        f"**Severity:** {vuln.get('severity', 'Unknown').title()}\n"
+                                        f"**CVSS Score:** {vuln.get('cvssv3', {}).get('baseScore', 'N/A')}\n"
+                                        f"**Description:** {vuln.get('description', 'No description')}\n"
+                                        f"**Solution:** {vuln.get('solution', 'No solution provided')}\n"
+                                        "\n---\n\n"
+                                    )
+                else:
+                    parts.append("## No vulnerabilities found\n")
+                with open(md_output, 'w') as f:
+                    f.write("".join(parts))
                         
             except Exception as e:
                 logging.error(f"Error processing dependency-check report: {e}")
@@ -1318,20 +2323,75 @@ def run_dependency_check(repo_path, repo_name, report_dir):
             f.write(f"Error running OWASP Dependency-Check: {e}")
         return None
 
+# Shared read-only stand-in for missing sub-objects in scanner findings, so chained
+# lookups like (finding.get('extra') or _EMPTY).get(...) allocate nothing per miss
+_EMPTY = MappingProxyType({})
+
 def write_code_snippet(f, finding):
     """Helper function to write code snippet with line numbers."""
-    extra = finding.get('extra', {})
-    if not ('lines' in extra and extra['lines']):
+    extra = finding.get('extra') or _EMPTY
+    lines = extra.get('lines')
+    if not lines:
         return
     
-    lang = extra['lines'][0].get('language', '')
-    content = extra['lines'][0].get('content', '')
-    start = int(finding.get('start', {}).get('line', 1)) - 1
+    first = lines[0]
+    lang = first.get('language', '')
+    content = first.get('content', '')
+    start = int((finding.get('start') or _EMPTY).get('line', 1)) - 1
     code_lines = [f"{i + start + 1}: {line}" for i, line in enumerate(content.split('\n'))]
     f.write(f"```{lang}\n")
     f.write("\n".join(code_lines))
     f.write("\n```\n\n")
 
+# Vendored dependency / build output directories left out of Semgrep, Bandit and Gitleaks
+SCAN_EXCLUDE_DIRS = ("node_modules", ".venv", "venv", "dist", "build", "vendor")
+# Gitleaks config extending the default rules with an allowlist for SCAN_EXCLUDE_DIRS
+GITLEAKS_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gitleaks-allowlist.toml")
+
+# Registry rulesets passed to every Semgrep scan
+SEMGREP_REGISTRY_CONFIGS = ("p/security-audit", "p/ci", "p/owasp-top-ten", "p/secrets")
+
+@lru_cache(maxsize=1)
+def _local_semgrep_configs() -> Tuple[str, ...]:
+    """Return --config paths for the bundled semgrep-rules/ directory.
+
+    The YAML files are merged once per process into a single ruleset so each scan
+    loads one local config instead of one per file. Falls back to the individual
+    files if PyYAML is unavailable or a file cannot be merged.
+    """
+    rules_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "semgrep-rules")
+    if not os.path.isdir(rules_dir):
+        return ()
+    files = sorted(os.path.join(rules_dir, fname) for fname in os.listdir(rules_dir)
+                   if fname.endswith((".yml", ".yaml")))
+    if len(files) < 2:
+        return tuple(files)
+    try:
+        import yaml  # type: ignore
+        rules: List[Any] = []
+        for path in files:
+            with open(path, 'r') as f:
+                for doc in yaml.safe_load_all(f):
+                    rules.extend((doc or {}).get("rules") or [])
+        fd, merged = tempfile.mkstemp(prefix="auditgh_semgrep_rules_", suffix=".yml")
+        with os.fdopen(fd, 'w') as f:
+            yaml.safe_dump({"rules": rules}, f, sort_keys=False)
+        atexit.register(lambda: os.path.exists(merged) and os.remove(merged))
+        logging.debug(f"Merged {len(rules)} local Semgrep rules from {len(files)} files into {merged}")
+        return (merged,)
+    except Exception as e:
+        logging.debug(f"Could not merge local Semgrep rules, passing them individually: {e}")
+        return tuple(files)
+
+@lru_cache(maxsize=1)
+def _semgrep_version() -> str:
+    """Return `semgrep --version` output; semgrep's start-up is too slow to repeat per repo."""
+    try:
+        ver = subprocess.run([_which("semgrep") or "semgrep", "--version"], capture_output=True, text=True)
+        return ver.stdout.strip() or ver.stderr.strip()
+    except Exception as e:
+        return f"unknown ({e})"
+
 def run_semgrep_scan(repo_path, repo_name, report_dir):
     """Run semgrep scan on the repository and save results."""
     output_path = os.path.join(report_dir, f"{repo_name}_semgrep.json")
@@ -1362,27 +2422,16 @@ def run_semgrep_scan(repo_path, repo_name, report_dir):
     
     try:
         # First, check if semgrep is installed
-        if not shutil.which("semgrep"):
+        if not _which("semgrep"):
             raise RuntimeError("semgrep is not installed. Please install it with 'pip install semgrep'")
         
         # Run semgrep with JSON output
-        cmd = [
-            "semgrep", "scan",
-            "--config", "p/security-audit",
-            "--config", "p/ci",
-            "--config", "p/owasp-top-ten",
-            "--config", "p/secrets",
-        ]
-        # Auto-include local custom rules in semgrep-rules/
-        try:
-            project_root = os.path.dirname(os.path.abspath(__file__))
-            rules_dir = os.path.join(project_root, "semgrep-rules")
-            if os.path.isdir(rules_dir):
-                for fname in os.listdir(rules_dir):
-                    if fname.endswith((".yml", ".yaml")):
-                        cmd += ["--config", os.path.join(rules_dir, fname)]
-        except Exception as _semgrep_rules_err:
-            logging.debug(f"Skipping custom semgrep rules due to error: {_semgrep_rules_err}")
+        cmd = ["semgrep", "scan"]
+        for cfg in SEMGREP_REGISTRY_CONFIGS:
+            cmd += ["--config", cfg]
+        # Auto-include local custom rules in semgrep-rules/ (merged into one file)
+        for cfg in _local_semgrep_configs():
+            cmd += ["--config", cfg]
         # Output and execution options
         cmd += [
             "--json",
@@ -1390,68 +2439,74 @@ def run_semgrep_scan(repo_path, repo_name, report_dir):
             "--error",
             "--metrics", "off",
             "--quiet",
-            "--timeout", "600"
+            "--timeout", "600",
         ]
+        # Vendored dependencies and build output are not the repository's own code
+        for pattern in SCAN_EXCLUDE_DIRS:
+            cmd += ["--exclude", pattern]
+        # Scans already run side by side in _SCAN_POOL, so each one gets its share of
+        # the cores rather than all of them
+        cmd += ["--jobs", str(max(1, (os.cpu_count() or 1) // SCAN_WORKERS))]
         
-        # Log semgrep version for diagnostics
-        try:
-            ver = subprocess.run(["semgrep", "--version"], capture_output=True, text=True)
-            logging.debug(f"Semgrep version: {ver.stdout.strip() or ver.stderr.strip()}")
-        except Exception:
-            pass
-        logging.debug(f"Running command: {' '.join(cmd)} in directory: {repo_path}")
+        # Log semgrep version for diagnostics (probed once per process)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Semgrep version: %s", _semgrep_version())
+        logging.debug("Running command: %s in directory: %s", cmd, repo_path)
         result = subprocess.run(
             cmd,
             cwd=repo_path,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True
         )
         
         # Check if output file was created, create empty results if not
         if not os.path.exists(output_path) and result.returncode == 0:
-            with open(output_path, 'w') as f:
-                json.dump({"results": []}, f)
+            with open(output_path, 'wb') as f:
+                f.write(_json_dumps({"results": []}))
         
-        # Generate markdown report
-        with open(md_output, 'w') as f:
-            f.write(f"# Semgrep Scan Results\n\n")
-            f.write(f"**Repository:** {repo_name}\n")
-            f.write(f"**Scan Date:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        # Generate markdown report in memory; written to disk once (also on early return)
+        f = io.StringIO()
+        try:
+            f.write(
+                f"# Semgrep Scan Results\n\n"
+                f"**Repository:** {repo_name}\n"
+                f"**Scan Date:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            )
             
             if result.returncode in (0, 1):
                 if os.path.exists(output_path):
                     try:
-                        with open(output_path, 'r') as json_file:
-                            semgrep_results = json.load(json_file)
+                        semgrep_results = _read_json_file(output_path)
                         
                         if 'results' in semgrep_results and semgrep_results['results']:
-                            f.write("## Findings Summary\n\n")
-                            f.write(f"Found {len(semgrep_results['results'])} potential issues.\n\n")
+                            f.write(f"## Findings Summary\n\nFound {len(semgrep_results['results'])} potential issues.\n\n")
                             
                             # Group by severity
-                            by_severity = {}
-                            for finding in semgrep_results['results']:
-                                severity = finding.get('extra', {}).get('severity', 'WARNING')
-                                by_severity[severity] = by_severity.get(severity, 0) + 1
+                            by_severity = Counter((finding.get('extra') or _EMPTY).get('severity', 'WARNING')
+                                                  for finding in semgrep_results['results'])
                             
                             if by_severity:
                                 f.write("### Issues by Severity\n\n")
-                                for severity, count in sorted(by_severity.items()):
-                                    f.write(f"- **{severity.capitalize()}**: {count} issues\n")
+                                f.writelines(f"- **{severity.capitalize()}**: {count} issues\n"
+                                             for severity, count in sorted(by_severity.items()))
                                 f.write("\n")
                             
                             # Show top 5 findings
                             f.write("## Top 5 Findings\n\n")
                             for i, finding in enumerate(semgrep_results['results'][:5], 1):
+                                extra = finding.get('extra') or _EMPTY
                                 path = finding.get('path', 'unknown')
-                                line = finding.get('start', {}).get('line', '?')
-                                message = finding.get('extra', {}).get('message', 'No message')
-                                severity = finding.get('extra', {}).get('severity', 'WARNING')
+                                line = (finding.get('start') or _EMPTY).get('line', '?')
+                                message = extra.get('message', 'No message')
+                                severity = extra.get('severity', 'WARNING')
                                 
-                                f.write(f"### {i}. {severity.upper()}: {message.splitlines()[0]}\n")
-                                f.write(f"**File:** `{path}:{line}`  \n")
-                                f.write(f"**Rule ID:** `{finding.get('check_id', 'unknown')}`  \n")
-                                f.write(f"**Severity:** {severity.capitalize()}  \n\n")
+                                f.write(
+                                    f"### {i}. {severity.upper()}: {message.splitlines()[0]}\n"
+                                    f"**File:** `{path}:{line}`  \n"
+                                    f"**Rule ID:** `{finding.get('check_id', 'unknown')}`  \n"
+                                    f"**Severity:** {severity.capitalize()}  \n\n"
+                                )
                                 
                                 # Show code snippet if available
                                 write_code_snippet(f, finding)
@@ -1463,18 +2518,15 @@ def run_semgrep_scan(repo_path, repo_name, report_dir):
                             f.write("## No issues found! ✅\n")
                     
                     except json.JSONDecodeError as e:
-                        f.write("Error: Could not parse semgrep JSON output\n")
-                        f.write("```\n")
-                        f.write(str(e))
-                        f.write("\n```\n")
+                        f.write(f"Error: Could not parse semgrep JSON output\n```\n{e}\n```\n")
                         return result
                 else:
                     f.write("## No issues found! ✅\n")
             else:
-                f.write("## Scan Failed\n\n")
-                f.write("Semgrep encountered an error during the scan.\n\n")
-                f.write("### Error Details\n")
-                f.write("```\n")
+                f.write("## Scan Failed\n\n"
+                        "Semgrep encountered an error during the scan.\n\n"
+                        "### Error Details\n"
+                        "```\n")
                 # Include both stderr and stdout for better diagnostics
                 if result.stderr:
                     f.write(result.stderr)
@@ -1484,20 +2536,123 @@ def run_semgrep_scan(repo_path, repo_name, report_dir):
                 if not (result.stderr or result.stdout):
                     f.write("No error details available")
                 f.write("\n```\n")
+        finally:
+            with open(md_output, 'w') as md_file:
+                md_file.write(f.getvalue())
         
         return result
             
     except Exception as e:
         error_msg = f"Error running semgrep: {str(e)}"
         logging.error(error_msg)
+        # The full stack is only worth formatting when debugging; otherwise the exception line suffices
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            details = traceback.format_exc()
+        else:
+            details = ''.join(traceback.format_exception_only(type(e), e))
         with open(md_output, 'w') as f:
-            f.write(f"# Semgrep Scan Failed\n\n{error_msg}\n\n**Error Details:**\n```\n{traceback.format_exc()}\n```")
+            f.write(f"# Semgrep Scan Failed\n\n{error_msg}\n\n**Error Details:**\n```\n{details}\n```")
         return subprocess.CompletedProcess(
             args=cmd if cmd is not None else [],
             returncode=1,
             stdout="",
             stderr=error_msg
         )
+# Profile fields requested per login by fetch_contributor_details_graphql
+_USER_FIELDS_GQL = ("name company location createdAt updatedAt "
+                    "repositories(privacy: PUBLIC) { totalCount } followers { totalCount }")
+
+def fetch_contributor_details_graphql(session: requests.Session, logins: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch profile details for several users in a single GraphQL request.
+    
+    Each login gets its own aliased ``user(login:)`` field, so N users cost one round
+    trip instead of N REST calls. Logins GraphQL cannot resolve (e.g. bots) are left out.
+    
+    Args:
+        session: The requests session to use for the API call
+        logins: GitHub logins to look up
+        
+    Returns:
+        Dict mapping login to a dict shaped like the REST /users/{login} fields we use
+    """
+    if not logins:
+        return {}
+    params = ", ".join(f"$l{i}: String!" for i in range(len(logins)))
+    fields = " ".join(f"u{i}: user(login: $l{i}) {{ {_USER_FIELDS_GQL} }}" for i in range(len(logins)))
+    query = f"query({params}) {{ {fields} }}"
+    variables = {f"l{i}": login for i, login in enumerate(logins)}
+    
+    response = session.post(f"{config.GITHUB_API}/graphql",
+                            json={"query": query, "variables": variables}, timeout=30)
+    response.raise_for_status()
+    payload = _json_body(response)
+    if payload.get("errors"):
+        # Partial results are normal (unresolvable logins come back as null with an error)
+        logging.debug(f"GraphQL user lookup errors: {payload['errors']}")
+    data = payload.get("data") or {}
+    
+    details = {}
+    for i, login in enumerate(logins):
+        user = data.get(f"u{i}")
+        if not user:
+            continue
+        details[login] = {
+            'name': user.get('name') or '',
+            'company': user.get('company') or '',
+            'location': user.get('location') or '',
+            'public_repos': (user.get('repositories') or {}).get('totalCount', 0),
+            'followers': (user.get('followers') or {}).get('totalCount', 0),
+            'created_at': user.get('createdAt') or '',
+            'updated_at': user.get('updatedAt') or '',
+        }
+    return details
+
+# Bounded pool for the per-repo GitHub metadata reads: with every repository worker
+# sharing it, at most this many of those requests are in flight at once
+GH_READ_CONCURRENCY = 8
+_GH_READ_POOL = ThreadPoolExecutor(max_workers=GH_READ_CONCURRENCY, thread_name_prefix="gh-read")
+atexit.register(_GH_READ_POOL.shutdown, wait=False)
+
+def fetch_repo_metadata(session: requests.Session, repo_full_name: str,
+                        languages: Optional[List[Tuple[str, int]]] = None
+                        ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, int]], Dict[str, Any]]:
+    """Fetch contributors, languages and commit analysis for a repository concurrently.
+
+    The three lookups are independent, so their round trips overlap on _GH_READ_POOL
+    instead of running back to back. Each helper handles its own errors. A languages
+    breakdown the caller already fetched (sorted by bytes) is reused, not requested again.
+    """
+    contributors = _GH_READ_POOL.submit(get_repo_contributors, session, repo_full_name)
+    fetched = _GH_READ_POOL.submit(get_repo_languages, session, repo_full_name) if languages is None else None
+    commits = _GH_READ_POOL.submit(analyze_commit_messages, session, repo_full_name)
+    top_languages = fetched.result() if fetched is not None else languages[:5]
+    return contributors.result(), top_languages, commits.result()
+
+# Attempts for the contributors listing before giving up on a throttled repository
+CONTRIBUTORS_MAX_RETRIES = 5
+
+def _retry_wait(response: requests.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a 403/429 response.
+
+    Prefers the server's Retry-After, then X-RateLimit-Reset, and otherwise falls
+    back to exponential backoff (capped at 60s) with jitter.
+    """
+    retry_after = response.headers.get('Retry-After', '')
+    if retry_after.isdigit():
+        return float(retry_after)
+    reset = response.headers.get('X-RateLimit-Reset', '')
+    if reset.isdigit() and response.headers.get('X-RateLimit-Remaining') == '0':
+        return max(0.0, int(reset) - time.time()) + 5  # Add buffer
+    delay = min(60, 2 ** attempt)
+    return delay + random.uniform(0, delay / 2)
+
+def _is_rate_limited(response: requests.Response) -> bool:
+    """Whether a 403/429 is throttling rather than a permission error (SSO, no access)."""
+    return (response.status_code == 429
+            or response.headers.get('Retry-After', '').isdigit()
+            or response.headers.get('X-RateLimit-Remaining') == '0')
+
 def get_repo_contributors(session: requests.Session, repo_full_name: str) -> List[Dict[str, Any]]:
     """
     Get top 5 contributors for a repository with detailed information.
@@ -1512,39 +2667,40 @@ def get_repo_contributors(session: requests.Session, repo_full_name: str) -> Lis
     try:
         logging.info(f"Fetching contributors for {repo_full_name}")
         
-        # Get basic contributor information
+        # Get basic contributor information, retrying throttled responses with backoff
         url = f"{config.GITHUB_API}/repos/{repo_full_name}/contributors?per_page=5&anon=false"
-        response = session.get(url, headers=config.HEADERS)
-        
-        # Log response status and headers for debugging
-        logging.debug(f"Response status: {response.status_code}")
-        logging.debug(f"Response headers: {dict(response.headers)}")
-        
-        # Handle rate limiting before raising HTTP errors
-        rate_limit = get_rate_limit_headers(response)
-        remaining = int(rate_limit.get('remaining', 0))
-        
-        if remaining < 10:
-            reset_time = int(rate_limit.get('reset', 0))
-            wait_time = max(0, reset_time - int(time.time())) + 5  # Add 5 second buffer
-            if wait_time > 0:
-                logging.warning(f"Approaching rate limit. Remaining: {remaining}. Waiting {wait_time} seconds...")
-                time.sleep(wait_time)
-                # Retry the request after waiting
-                response = session.get(url, headers=HEADERS)
-                response.raise_for_status()
+        for attempt in range(CONTRIBUTORS_MAX_RETRIES):
+            _wait_for_gate()
+            response = session.get(url)
+            
+            # Log response status and headers for debugging
+            logging.debug("Response status: %s", response.status_code)
+            logging.debug("Response headers: %s", response.headers)
+            
+            # A permission 403 will not clear by waiting; raise_for_status reports it below
+            if response.status_code not in (403, 429) or not _is_rate_limited(response):
+                break
+            logging.warning(
+                f"Rate limited fetching contributors for {repo_full_name} "
+                f"(attempt {attempt + 1}/{CONTRIBUTORS_MAX_RETRIES})"
+            )
+            # Wait on the shared gate so every worker backs off together
+            handle_rate_limit(response, _retry_wait(response, attempt))
         else:
-            response.raise_for_status()
+            logging.error(f"Giving up on contributors for {repo_full_name} after {CONTRIBUTORS_MAX_RETRIES} rate-limited attempts")
+            return []
+        check_rate_limits(response)
+        response.raise_for_status()
         
-        # Log response content for debugging
-        response_text = response.text
-        logging.debug(f"Response content (first 500 chars): {response_text[:500]}")
+        # Log response content for debugging (decoding the body only when it is shown)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Response content (first 500 chars): %s", response.text[:500])
         
         try:
             contributors = response.json()
         except json.JSONDecodeError as json_err:
             logging.error(f"Failed to parse JSON response: {json_err}")
-            logging.error(f"Response content: {response_text}")
+            logging.error(f"Response content: {response.text}")
             return []
             
         if not isinstance(contributors, list):
@@ -1552,64 +2708,53 @@ def get_repo_contributors(session: requests.Session, repo_full_name: str) -> Lis
             logging.error(f"Response content: {contributors}")
             return []
             
-        # Get additional user details for each contributor
+        # Get additional user details for the top 5 in one GraphQL round trip
+        top = [c for c in contributors[:5] if 'login' in c]  # Skip anonymous contributors
+        try:
+            user_details = fetch_contributor_details_graphql(session, [c['login'] for c in top])
+        except Exception as user_error:
+            logging.warning(f"Error getting contributor details for {repo_full_name}: {user_error}")
+            user_details = {}
+        
         detailed_contributors = []
-        for contributor in contributors[:5]:  # Limit to top 5
-            try:
-                if 'login' in contributor:  # Skip anonymous contributors
-                    user_url = f"{config.GITHUB_API}/users/{contributor['login']}"
-                    user_response = session.get(user_url, headers=config.HEADERS)
-                    user_response.raise_for_status()
-                    user_data = user_response.json()
-                    
-                    # Combine basic contributor info with detailed user data
-                    detailed_contributor = {
-                        'login': contributor.get('login'),
-                        'id': contributor.get('id'),
-                        'contributions': contributor.get('contributions', 0),
-                        'avatar_url': contributor.get('avatar_url', ''),
-                        'html_url': contributor.get('html_url', ''),
-                        'name': user_data.get('name', ''),
-                        'company': user_data.get('company', ''),
-                        'location': user_data.get('location', ''),
-                        'public_repos': user_data.get('public_repos', 0),
-                        'followers': user_data.get('followers', 0),
-                        'created_at': user_data.get('created_at', ''),
-                        'updated_at': user_data.get('updated_at', '')
-                    }
-                    detailed_contributors.append(detailed_contributor)
-                    
-                    # Be nice to the API
-                    time.sleep(0.5)
-                    
-            except Exception as user_error:
-                logging.warning(f"Error getting details for user {contributor.get('login')}: {user_error}")
-                # Fall back to basic info if detailed fetch fails
+        for contributor in top:
+            user_data = user_details.get(contributor['login'])
+            if user_data is None:
+                # Fall back to basic info if the detailed lookup failed
                 detailed_contributors.append(contributor)
+                continue
+            # Combine basic contributor info with detailed user data
+            detailed_contributors.append({
+                'login': contributor.get('login'),
+                'id': contributor.get('id'),
+                'node_id': contributor.get('node_id'),
+                'contributions': contributor.get('contributions', 0),
+                'avatar_url': contributor.get('avatar_url', ''),
+                'html_url': contributor.get('html_url', ''),
+                **user_data,
+            })
         
         return detailed_contributors
         
     except requests.exceptions.HTTPError as http_err:
-        if http_err.response.status_code == 403:  # Rate limited
-            reset_time = int(http_err.response.headers.get('X-RateLimit-Reset', time.time() + 60))
-            wait_time = max(0, reset_time - int(time.time())) + 5
-            logging.warning(f"Rate limited. Waiting {wait_time} seconds...")
-            time.sleep(wait_time)
-            return get_repo_contributors(session, repo_full_name)  # Retry after waiting
         logging.error(f"HTTP error getting contributors for {repo_full_name}: {http_err}")
     except Exception as e:
         logging.error(f"Error getting contributors for {repo_full_name}: {e}", exc_info=True)
     
     return []
 
-def get_repo_languages(session: requests.Session, repo_full_name: str) -> List[Tuple[str, int]]:
-    """Get programming languages used in the repository, sorted by bytes of code."""
+def get_repo_languages(session: requests.Session, repo_full_name: str,
+                       limit: Optional[int] = 5) -> List[Tuple[str, int]]:
+    """Get programming languages used in the repository, sorted by bytes of code.
+
+    Returns the top ``limit`` languages, or all of them when limit is None.
+    """
     try:
         url = f"{config.GITHUB_API}/repos/{repo_full_name}/languages"
-        response = session.get(url, headers=config.HEADERS)
+        response = session.get(url)
         response.raise_for_status()
         languages = response.json()
-        return sorted(languages.items(), key=lambda x: x[1], reverse=True)[:5]
+        return sorted(languages.items(), key=lambda x: x[1], reverse=True)[:limit]
     except Exception as e:
         logging.error(f"Error getting languages for {repo_full_name}: {e}")
         return []
@@ -1617,31 +2762,21 @@ def get_repo_languages(session: requests.Session, repo_full_name: str) -> List[T
 def analyze_commit_messages(session: requests.Session, repo_full_name: str) -> Dict[str, Any]:
     """Analyze commit messages to get last update date and top 5 commit reasons."""
     try:
-        # Get the latest commit
-        commits_url = f"{config.GITHUB_API}/repos/{repo_full_name}/commits?per_page=1"
-        commits_response = session.get(commits_url, headers=config.HEADERS)
-        commits_response.raise_for_status()
-        
-        last_commit = commits_response.json()[0] if commits_response.json() else None
-        last_update = last_commit['commit']['committer']['date'] if last_commit else "Unknown"
-        
-        # Get recent commits for analysis (last 100)
+        # Recent commits for analysis (last 100); the newest one gives the last update
         all_commits_url = f"{config.GITHUB_API}/repos/{repo_full_name}/commits?per_page=100"
-        all_commits_response = session.get(all_commits_url, headers=config.HEADERS)
+        all_commits_response = session.get(all_commits_url)
         all_commits_response.raise_for_status()
+        commits_json = _json_body(all_commits_response)
+        last_update = commits_json[0]['commit']['committer']['date'] if commits_json else "Unknown"
         
         # Simple commit message analysis
-        commit_messages = [commit['commit']['message'] for commit in all_commits_response.json()]
-        common_prefixes = defaultdict(int)
-        
-        for msg in commit_messages:
-            # Extract first few words as a prefix
-            words = msg.strip().split()
-            if words:
-                prefix = ' '.join(words[:3]).lower()
-                common_prefixes[prefix] += 1
-        
-        top_commit_reasons = sorted(common_prefixes.items(), key=lambda x: x[1], reverse=True)[:5]
+        commit_messages = [commit['commit']['message'] for commit in commits_json]
+        # Extract the first few words of each message as a prefix
+        prefixes = Counter(
+            ' '.join(words[:3]).lower()
+            for words in (msg.split() for msg in commit_messages) if words
+        )
+        top_commit_reasons = prefixes.most_common(5)
         
         return {
             'last_update': last_update,
@@ -1654,17 +2789,42 @@ def analyze_commit_messages(session: requests.Session, repo_full_name: str) -> D
             'top_commit_reasons': []
         }
 
+# Severity rankings shared by the Top 5 list and the policy gates; read-only so they are
+# built once at import time instead of on every call
+_TOP_SEV_ORDER = MappingProxyType({'critical': 0, 'high': 1, 'moderate': 2, 'medium': 2, 'low': 3, 'unknown': 4})
+_GRYPE_SEV_RANK = MappingProxyType({'critical': 4, 'high': 3, 'medium': 2, 'low': 1, 'negligible': 0})
+_UPPER_SEV_RANK = MappingProxyType({'CRITICAL': 4, 'HIGH': 3, 'MEDIUM': 2, 'LOW': 1, 'UNKNOWN': 0})
+_SEMGREP_SEV_MAP = MappingProxyType({'ERROR': 'high', 'WARNING': 'medium', 'INFO': 'low'})
+_SEMGREP_GATE_RANK = MappingProxyType({'critical': 3, 'high': 2, 'medium': 1, 'low': 0})
+_BANDIT_GATE_RANK = MappingProxyType({'CRITICAL': 3, 'HIGH': 2, 'MEDIUM': 1, 'LOW': 0})
+_CHECKOV_TOP_ORDER = MappingProxyType({"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "UNKNOWN": 4})
+
 def get_top_vulnerabilities(scan_results: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Extract top 5 vulnerabilities from scan results (Safety, npm audit, and Grype)."""
-    vulnerabilities: List[Dict[str, Any]] = []
+    # Findings are deduplicated across sources as they are collected
+    seen = set()
+    unique_vulns: List[Dict[str, Any]] = []
+
+    def _add(v: Dict[str, Any]) -> None:
+        key = (
+            (v.get('type') or '').lower(),
+            (v.get('name') or '').lower(),
+            (v.get('affected_versions') or '').lower(),
+            (v.get('severity') or '').lower(),
+            (v.get('fixed_in') or '').lower(),
+        )
+        if key in seen:
+            return
+        seen.add(key)
+        unique_vulns.append(v)
 
     # Process Safety results
     try:
         res = scan_results.get('safety')
         if res and res.stdout:
-            safety_data = json.loads(res.stdout)
+            safety_data = _json_loads(res.stdout)
             for vuln in safety_data.get('vulnerabilities', [])[:10]:
-                vulnerabilities.append({
+                _add({
                     'type': 'Python',
                     'name': vuln.get('package_name', 'Unknown'),
                     'severity': (vuln.get('severity') or 'unknown'),
@@ -1675,14 +2835,14 @@ def get_top_vulnerabilities(scan_results: Dict[str, Any]) -> List[Dict[str, Any]
     except Exception as e:
         logging.error(f"Error processing safety results: {e}")
 
-    # Process npm audit results (legacy format; modern npm uses audit levels differently)
+    # Process npm audit results (legacy format; modern npm uses audit levels differently).
+    # run_npm_audit leaves its report on disk rather than in the result's stdout.
     try:
-        res = scan_results.get('npm_audit')
-        if res and res.stdout:
-            npm_data = json.loads(res.stdout)
-            advisories = (npm_data.get('advisories') or {}) if isinstance(npm_data, dict) else {}
-            for adv in list(advisories.values())[:10]:
-                vulnerabilities.append({
+        npm_json = scan_results.get('npm_audit_json')
+        if scan_results.get('npm_audit') and npm_json and os.path.exists(npm_json):
+            advisories = _npm_report_sections(npm_json)('advisories')
+            for _id, adv in itertools.islice(advisories, 10):
+                _add({
                     'type': 'Node',
                     'name': adv.get('module_name', 'Unknown'),
                     'severity': (adv.get('severity') or 'unknown'),
@@ -1706,7 +2866,7 @@ def get_top_vulnerabilities(scan_results: Dict[str, Any]) -> List[Dict[str, Any]
                 sev = (v.get('Severity') or 'unknown').lower()
                 affected = v.get('InstalledVersion') or ''
                 fixed_in = v.get('FixedVersion') or ''
-                vulnerabilities.append({
+                _add({
                     'type': 'Trivy',
                     'name': name,
                     'severity': sev,
@@ -1724,26 +2884,20 @@ def get_top_vulnerabilities(scan_results: Dict[str, Any]) -> List[Dict[str, Any]
         grype_data = scan_results.get('grype') or {}
         matches = grype_data.get('matches', []) if isinstance(grype_data, dict) else []
         for m in matches:
-            v = m.get('vulnerability', {})
-            vuln = m.get('vulnerability', {})
-            art = m.get('artifact', {})
+            vuln = m.get('vulnerability') or _EMPTY
+            art = m.get('artifact') or _EMPTY
             sev = (vuln.get('severity') or 'Unknown').lower()
             pkg = art.get('name') or 'Unknown'
             ver = art.get('version') or 'Unknown'
-            fix = vuln.get('fix', {}) or {}
+            fix = vuln.get('fix') or _EMPTY
             fix_versions = fix.get('versions') or []
             fixed_in = ', '.join(fix_versions) if isinstance(fix_versions, list) and fix_versions else fix.get('state', 'None')
             # Threat intel
             cve = vuln.get('id') or ''
-            kev = False
-            epss = None
-            try:
-                ti = m.get('_threat', {})
-                kev = bool(ti.get('kev'))
-                epss = ti.get('epss')
-            except Exception:
-                pass
-            vulnerabilities.append({
+            ti = m.get('_threat') or _EMPTY
+            kev = bool(ti.get('kev'))
+            epss = ti.get('epss')
+            _add({
                 'type': 'Dependency',
                 'name': pkg,
                 'severity': sev,
@@ -1757,28 +2911,11 @@ def get_top_vulnerabilities(scan_results: Dict[str, Any]) -> List[Dict[str, Any]
     except Exception as e:
         logging.error(f"Error processing grype results: {e}")
 
-    # Deduplicate entries across sources
-    seen = set()
-    unique_vulns: List[Dict[str, Any]] = []
-    for v in vulnerabilities:
-        key = (
-            (v.get('type') or '').lower(),
-            (v.get('name') or '').lower(),
-            (v.get('affected_versions') or '').lower(),
-            (v.get('severity') or '').lower(),
-            (v.get('fixed_in') or '').lower(),
-        )
-        if key in seen:
-            continue
-        seen.add(key)
-        unique_vulns.append(v)
-
     # Sort by KEV, EPSS, then severity (critical, high, moderate/medium, low, unknown)
-    severity_order = {'critical': 0, 'high': 1, 'moderate': 2, 'medium': 2, 'low': 3, 'unknown': 4}
     def _rank(v: Dict[str, Any]):
         kev = 0 if not v.get('kev') else -1  # kev=True gets higher priority
         epss_rank = -float(v.get('epss') or 0.0)
-        sev_rank = severity_order.get((v.get('severity') or 'unknown').lower(), 5)
+        sev_rank = _TOP_SEV_ORDER.get((v.get('severity') or 'unknown').lower(), 5)
         return (kev, epss_rank, sev_rank)
     unique_vulns.sort(key=_rank)
 
@@ -1801,20 +2938,19 @@ def load_kev() -> Dict[str, bool]:
     try:
         r = requests.get(url, timeout=10)
         if r.ok:
-            data = r.json()
+            data = _json_body(r)
             for item in data.get('vulnerabilities', []):
                 cve = item.get('cveID')
                 if cve:
                     kev_map[cve] = True
             # cache file
-            with open(os.path.join(_cache_dir(), 'kev.json'), 'w') as f:
-                json.dump(list(kev_map.keys()), f)
+            with open(os.path.join(_cache_dir(), 'kev.json'), 'wb') as f:
+                f.write(_json_dumps(list(kev_map)))
     except Exception:
         # try cache
         try:
-            with open(os.path.join(_cache_dir(), 'kev.json'), 'r') as f:
-                ids = json.load(f)
-                kev_map = {cve: True for cve in ids}
+            ids = _read_json_file(os.path.join(_cache_dir(), 'kev.json'))
+            kev_map = {cve: True for cve in ids}
         except Exception:
             pass
     return kev_map
@@ -1824,28 +2960,27 @@ def load_epss() -> Dict[str, float]:
     epss_map: Dict[str, float] = {}
     url = 'https://epss.cyentia.com/epss_scores-current.csv.gz'
     try:
-        r = requests.get(url, timeout=10)
-        if r.ok:
-            import gzip
-            import io
-            buf = io.BytesIO(r.content)
-            with gzip.open(buf, 'rt') as gz:
-                for line in gz:
-                    if line.startswith('cve,epss,percentile'):
-                        continue
-                    parts = line.strip().split(',')
-                    if len(parts) >= 2:
-                        cve, epss = parts[0], float(parts[1] or 0.0)
-                        epss_map[cve] = epss
-            with open(os.path.join(_cache_dir(), 'epss.json'), 'w') as f:
-                json.dump(epss_map, f)
+        # Stream the gzip body through the parser rather than buffering the whole feed
+        with requests.get(url, stream=True, timeout=10) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True
+            with gzip.GzipFile(fileobj=r.raw) as gz:
+                # csv.reader splits rows in C; the prefix check skips the
+                # '#model_version' comment and the csv header
+                rows = csv.reader(io.TextIOWrapper(gz, encoding='utf-8'))
+                epss_map = {row[0]: float(row[1] or 0.0) for row in rows
+                            if row and row[0].startswith('CVE-')}
+        with open(os.path.join(_cache_dir(), 'epss.pkl'), 'wb') as f:
+            pickle.dump(epss_map, f, protocol=5)
     except Exception:
-        # try cache
-        try:
-            with open(os.path.join(_cache_dir(), 'epss.json'), 'r') as f:
-                epss_map = json.load(f)
-        except Exception:
-            pass
+        # try cache (pickle first, then the older JSON format)
+        for name, loader in (('epss.pkl', pickle.load), ('epss.json', json.load)):
+            try:
+                with open(os.path.join(_cache_dir(), name), 'rb') as f:
+                    epss_map = loader(f)
+                break
+            except Exception:
+                continue
     return epss_map
 
 def enrich_grype_with_threat_intel(grype_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1868,11 +3003,8 @@ def enrich_grype_with_threat_intel(grype_data: Dict[str, Any]) -> Dict[str, Any]
 # -------------------- Policy Loading and Evaluation --------------------
 
 def _read_json(path: str) -> Any:
-    if not os.path.exists(path):
-        return None
     try:
-        with open(path, 'r') as f:
-            return json.load(f)
+        return _read_json_file(path)
     except Exception:
         return None
 
@@ -1888,7 +3020,25 @@ def load_policy() -> Dict[str, Any]:
         # Very small fallback: attempt to parse limited subset is not safe; return empty
         return {}
 
-def evaluate_policy(report_dir: str, repo_name: str) -> Tuple[bool, List[str]]:
+# (policy gate, report file suffix) for each gate evaluate_policy knows about
+_POLICY_GATE_REPORTS = (
+    ('grype', 'grype_repo'),
+    ('checkov', 'checkov'),
+    ('secrets', 'gitleaks'),
+    ('semgrep', 'semgrep'),
+    ('semgrep_taint', 'semgrep_taint'),
+    ('bandit', 'bandit'),
+    ('trivy_fs', 'trivy_fs'),
+)
+
+def evaluate_policy(report_dir: str, repo_name: str,
+                    preloaded: Optional[Dict[str, Any]] = None) -> Tuple[bool, List[str]]:
+    """Check the repository's reports against the policy gates.
+
+    ``preloaded`` maps gate names to reports the caller has already decoded (the Grype
+    one already enriched with threat intel); only the remaining reports are read.
+    """
+    preloaded = preloaded or {}
     policy = load_policy()
     if not policy:
         # default: evaluate current Checkov gate only (High+ = fail)
@@ -1903,14 +3053,22 @@ def evaluate_policy(report_dir: str, repo_name: str) -> Tuple[bool, List[str]]:
     gates = (policy.get('gates') or {})
     violations: List[str] = []
 
+    # Read the reports of all enabled gates concurrently rather than one after another
+    enabled = {gate: os.path.join(report_dir, f"{repo_name}_{suffix}.json")
+               for gate, suffix in _POLICY_GATE_REPORTS if gates.get(gate) and gate not in preloaded}
+    reports: Dict[str, Any] = dict(preloaded)
+    if enabled:
+        with ThreadPoolExecutor(max_workers=len(enabled), thread_name_prefix="policy-read") as ex:
+            futures = {gate: ex.submit(_read_json, path) for gate, path in enabled.items()}
+            reports.update((gate, f.result()) for gate, f in futures.items())
+
     # Grype gates
     gcfg = gates.get('grype') or {}
     if gcfg:
-        grype_json = os.path.join(report_dir, f"{repo_name}_grype_repo.json")
-        gd = _read_json(grype_json) or {}
+        gd = reports['grype'] or {}
         # If enriched not present, enrich on the fly
         try:
-            if gd:
+            if gd and 'grype' not in preloaded:
                 gd = enrich_grype_with_threat_intel(gd)
         except Exception:
             pass
@@ -1923,19 +3081,16 @@ def evaluate_policy(report_dir: str, repo_name: str) -> Tuple[bool, List[str]]:
             if any(float(m.get('_threat',{}).get('epss') or 0.0) >= float(max_epss) for m in matches):
                 violations.append(f"grype: EPSS >= {max_epss}")
         max_sev = (gcfg.get('max_severity') or '').lower()
-        sev_rank = {'critical':4,'high':3,'medium':2,'low':1,'negligible':0}
-        if max_sev in sev_rank:
-            for m in matches:
-                s = (m.get('vulnerability',{}).get('severity') or 'unknown').lower()
-                if sev_rank.get(s, -1) >= sev_rank[max_sev]:
-                    violations.append(f"grype: severity {s} >= {max_sev}")
-                    break
+        if max_sev in _GRYPE_SEV_RANK:
+            severities = ((m.get('vulnerability',{}).get('severity') or 'unknown').lower() for m in matches)
+            hit = next((s for s in severities if _GRYPE_SEV_RANK.get(s, -1) >= _GRYPE_SEV_RANK[max_sev]), None)
+            if hit:
+                violations.append(f"grype: severity {hit} >= {max_sev}")
 
     # Checkov gates
     ccfg = gates.get('checkov') or {}
     if ccfg:
-        chk_json = os.path.join(report_dir, f"{repo_name}_checkov.json")
-        data = _read_json(chk_json) or {}
+        data = reports['checkov'] or {}
         failed = (data.get('results', {}) or {}).get('failed_checks', [])
         counts = {'CRITICAL':0,'HIGH':0,'MEDIUM':0,'LOW':0,'UNKNOWN':0}
         for i in failed or []:
@@ -1943,12 +3098,11 @@ def evaluate_policy(report_dir: str, repo_name: str) -> Tuple[bool, List[str]]:
             if sev not in counts: sev = 'UNKNOWN'
             counts[sev]+=1
         max_sev = (ccfg.get('max_severity') or '').upper()
-        order = {'CRITICAL':4,'HIGH':3,'MEDIUM':2,'LOW':1,'UNKNOWN':0}
-        if max_sev in order:
-            for sev, n in counts.items():
-                if order[sev] >= order[max_sev] and n>0 and (sev in ('CRITICAL','HIGH','MEDIUM','LOW')):
-                    violations.append(f"checkov: contains {sev} findings >= {max_sev}")
-                    break
+        if max_sev in _UPPER_SEV_RANK:
+            hit = next((sev for sev, n in counts.items()
+                        if n>0 and sev != 'UNKNOWN' and _UPPER_SEV_RANK[sev] >= _UPPER_SEV_RANK[max_sev]), None)
+            if hit:
+                violations.append(f"checkov: contains {hit} findings >= {max_sev}")
         mcounts = ccfg.get('max_counts') or {}
         for sev, limit in mcounts.items():
             s = sev.upper()
@@ -1962,8 +3116,7 @@ def evaluate_policy(report_dir: str, repo_name: str) -> Tuple[bool, List[str]]:
     # Secrets gates
     scfg = gates.get('secrets') or {}
     if scfg:
-        gl_json = os.path.join(report_dir, f"{repo_name}_gitleaks.json")
-        secrets = _read_json(gl_json)
+        secrets = reports['secrets']
         total = len(secrets) if isinstance(secrets, list) else 0
         max_findings = scfg.get('max_findings')
         if isinstance(max_findings, int) and total > max_findings:
@@ -1972,22 +3125,19 @@ def evaluate_policy(report_dir: str, repo_name: str) -> Tuple[bool, List[str]]:
     # Semgrep gates
     sgcfg = gates.get('semgrep') or {}
     if sgcfg:
-        sg_json = os.path.join(report_dir, f"{repo_name}_semgrep.json")
-        data = _read_json(sg_json) or {}
+        data = reports['semgrep'] or {}
         results = data.get('results', []) if isinstance(data, dict) else []
         # Map severities
-        map_sev = {'ERROR':'high','WARNING':'medium','INFO':'low'}
         counts = {'high':0,'medium':0,'low':0}
         for r in results:
-            sev = map_sev.get((r.get('extra',{}).get('severity') or '').upper())
+            sev = _SEMGREP_SEV_MAP.get((r.get('extra',{}).get('severity') or '').upper())
             if sev: counts[sev]+=1
         max_sev = (sgcfg.get('max_severity') or '').lower()
-        rank = {'critical':3,'high':2,'medium':1,'low':0}
-        if max_sev in rank and counts:
-            for sev, n in counts.items():
-                if rank.get(sev, -1) >= rank[max_sev] and n>0:
-                    violations.append(f"semgrep: contains {sev} findings >= {max_sev}")
-                    break
+        if max_sev in _SEMGREP_GATE_RANK and counts:
+            hit = next((sev for sev, n in counts.items()
+                        if n>0 and _SEMGREP_GATE_RANK.get(sev, -1) >= _SEMGREP_GATE_RANK[max_sev]), None)
+            if hit:
+                violations.append(f"semgrep: contains {hit} findings >= {max_sev}")
         mcounts = sgcfg.get('max_counts') or {}
         for sev, limit in mcounts.items():
             try:
@@ -1999,8 +3149,7 @@ def evaluate_policy(report_dir: str, repo_name: str) -> Tuple[bool, List[str]]:
     # Semgrep taint gates
     tcfg = gates.get('semgrep_taint') or {}
     if tcfg:
-        st_json = os.path.join(report_dir, f"{repo_name}_semgrep_taint.json")
-        data = _read_json(st_json) or {}
+        data = reports['semgrep_taint'] or {}
         flows = data.get('results', []) if isinstance(data, dict) else []
         max_flows = tcfg.get('max_flows')
         if isinstance(max_flows, int) and len(flows) > max_flows:
@@ -2009,20 +3158,18 @@ def evaluate_policy(report_dir: str, repo_name: str) -> Tuple[bool, List[str]]:
     # Bandit gates (if present)
     bcfg = gates.get('bandit') or {}
     if bcfg:
-        bj = os.path.join(report_dir, f"{repo_name}_bandit.json")
-        bd = _read_json(bj) or {}
+        bd = reports['bandit'] or {}
         results = bd.get('results', []) if isinstance(bd, dict) else []
         counts = {'HIGH':0,'MEDIUM':0,'LOW':0}
         for r in results:
             sev = (r.get('issue_severity') or '').upper()
             if sev in counts: counts[sev]+=1
         max_sev = (bcfg.get('max_severity') or '').upper()
-        order = {'CRITICAL':3,'HIGH':2,'MEDIUM':1,'LOW':0}
-        if max_sev in order:
-            for sev, n in counts.items():
-                if order.get(sev, -1) >= order[max_sev] and n>0:
-                    violations.append(f"bandit: contains {sev} findings >= {max_sev}")
-                    break
+        if max_sev in _BANDIT_GATE_RANK:
+            hit = next((sev for sev, n in counts.items()
+                        if n>0 and _BANDIT_GATE_RANK.get(sev, -1) >= _BANDIT_GATE_RANK[max_sev]), None)
+            if hit:
+                violations.append(f"bandit: contains {hit} findings >= {max_sev}")
         mcounts = bcfg.get('max_counts') or {}
         for sev, limit in mcounts.items():
             try:
@@ -2034,8 +3181,7 @@ def evaluate_policy(report_dir: str, repo_name: str) -> Tuple[bool, List[str]]:
     # Trivy FS gates (if present)
     tvcfg = gates.get('trivy_fs') or {}
     if tvcfg:
-        tj = os.path.join(report_dir, f"{repo_name}_trivy_fs.json")
-        td = _read_json(tj) or {}
+        td = reports['trivy_fs'] or {}
         results = td.get('Results', []) if isinstance(td, dict) else []
         counts = {'CRITICAL':0,'HIGH':0,'MEDIUM':0,'LOW':0,'UNKNOWN':0}
         for res in results:
@@ -2044,12 +3190,11 @@ def evaluate_policy(report_dir: str, repo_name: str) -> Tuple[bool, List[str]]:
                 if sev not in counts: sev='UNKNOWN'
                 counts[sev]+=1
         max_sev = (tvcfg.get('max_severity') or '').upper()
-        order = {'CRITICAL':4,'HIGH':3,'MEDIUM':2,'LOW':1,'UNKNOWN':0}
-        if max_sev in order:
-            for sev, n in counts.items():
-                if order[sev] >= order[max_sev] and n>0 and sev in order:
-                    violations.append(f"trivy_fs: contains {sev} findings >= {max_sev}")
-                    break
+        if max_sev in _UPPER_SEV_RANK:
+            hit = next((sev for sev, n in counts.items()
+                        if n>0 and _UPPER_SEV_RANK[sev] >= _UPPER_SEV_RANK[max_sev]), None)
+            if hit:
+                violations.append(f"trivy_fs: contains {hit} findings >= {max_sev}")
         mcounts = tvcfg.get('max_counts') or {}
         for sev, limit in mcounts.items():
             try:
@@ -2063,53 +3208,100 @@ def evaluate_policy(report_dir: str, repo_name: str) -> Tuple[bool, List[str]]:
 # -------------------- Contributor Attribution Helpers --------------------
 
 def load_semgrep_results(path: str) -> List[dict]:
-    if not path or not os.path.exists(path):
+    if not path:
         return []
     try:
-        with open(path, 'r') as f:
-            data = json.load(f)
+        data = _read_json_file(path)
         return data.get('results', []) if isinstance(data, dict) else []
     except Exception:
         return []
 
 def load_grype_results(path: str) -> Dict[str, Any]:
-    if not path or not os.path.exists(path):
+    if not path:
         return {}
     try:
-        with open(path, 'r') as f:
-            return json.load(f)
+        return _read_json_file(path)
     except Exception:
         return {}
 
-@lru_cache(maxsize=2048)
-def _blame_cache_key(repo_path: str, rel_path: str, line: int) -> str:
-    return f"{rel_path}:{line}"
+# Shared bound on concurrent git blame processes across all repository workers; blames
+# of distinct files are read-only and do not contend on the index
+BLAME_CONCURRENCY = min(8, os.cpu_count() or 1)
+_BLAME_POOL = ThreadPoolExecutor(max_workers=BLAME_CONCURRENCY, thread_name_prefix="blame")
+atexit.register(_BLAME_POOL.shutdown, wait=False)
 
-def blame_line(repo_local_path: str, rel_path: str, line: int) -> Dict[str, str]:
-    try:
-        cmd = ["git", "blame", "-L", f"{line},{line}", "--line-porcelain", rel_path]
-        result = subprocess.run(cmd, cwd=repo_local_path, capture_output=True, text=True)
-        if result.returncode != 0:
-            return {"name": "unknown", "email": "", "raw": result.stderr.strip()}
-        name, email = "unknown", ""
-        for ln in result.stdout.splitlines():
-            if ln.startswith("author "):
-                name = ln[len("author ") :].strip()
-            elif ln.startswith("author-mail "):
-                email = ln[len("author-mail ") :].strip(" <>")
-        return {"name": name or "unknown", "email": email, "raw": ""}
-    except Exception as e:
-        return {"name": "unknown", "email": "", "raw": str(e)}
+@lru_cache(maxsize=1024)
+def blame_file(repo_local_path: str, rel_path: str) -> Dict[int, Tuple[str, str]]:
+    """Blame a whole file in one git call, mapping each line number to (author name, email).
+
+    Findings cluster in a handful of files, so one porcelain blame per file replaces a
+    git process per finding.
+    """
+    result = subprocess.run(["git", "blame", "--porcelain", "--", rel_path], cwd=repo_local_path,
+                            stdin=subprocess.DEVNULL, capture_output=True, text=True, errors="replace")
+    if result.returncode != 0:
+        logging.debug("git blame failed for %s: %s", rel_path, result.stderr.strip())
+        return {}
+    # Porcelain output only carries a commit's author headers the first time it appears
+    headers: Dict[str, List[str]] = {}
+    authors: Dict[str, Tuple[str, str]] = {}
+    lines: Dict[int, Tuple[str, str]] = {}
+    sha, final_line, current = "", 0, ["", ""]
+    for ln in result.stdout.split("\n"):
+        if ln.startswith("\t"):
+            author = authors.get(sha)
+            if author is None:
+                author = authors[sha] = (current[0] or "unknown", current[1])
+            lines[final_line] = author
+        elif ln.startswith("author "):
+            current[0] = ln[len("author ") :].strip()
+        elif ln.startswith("author-mail "):
+            current[1] = ln[len("author-mail ") :].strip(" <>")
+        else:
+            parts = ln.split(" ")
+            if len(parts) >= 3 and len(parts[0]) >= 40 and parts[1].isdigit() and parts[2].isdigit():
+                sha, final_line = parts[0], int(parts[2])
+                current = headers.setdefault(sha, ["", ""])
+    return lines
+
+def blame_files(repo_local_path: str, rel_paths: Iterable[str]) -> Dict[str, Dict[int, Tuple[str, str]]]:
+    """Blame each distinct path once, concurrently; a path that cannot be blamed maps to {}."""
+    def _blame(rel: str) -> Dict[int, Tuple[str, str]]:
+        try:
+            return blame_file(repo_local_path, rel)
+        except Exception as e:
+            logging.debug("git blame failed for %s: %s", rel, e)
+            return {}
+
+    paths = list(dict.fromkeys(rel_paths))
+    if len(paths) <= 1:
+        return {rel: _blame(rel) for rel in paths}
+    return dict(zip(paths, _BLAME_POOL.map(_blame, paths)))
 
-def map_author_to_contributor(author_name: str, author_email: str, contributors: List[Dict[str, Any]]) -> str:
+def build_contributor_index(contributors: List[Dict[str, Any]]) -> Dict[str, Dict[str, Tuple[int, str]]]:
+    """Index the top 10 contributors by lowercased login and name for blame attribution.
+
+    Values are (rank, mapped login) so a lookup can honour contributor order when an
+    author matches more than one entry.
+    """
+    by_login: Dict[str, Tuple[int, str]] = {}
+    by_name: Dict[str, Tuple[int, str]] = {}
+    for rank, c in enumerate((contributors or [])[:10]):
+        login = (c.get('login') or '').strip()
+        if login:
+            by_login.setdefault(login.lower(), (rank, login))
+        if c.get('name'):
+            by_name.setdefault(c['name'].strip().lower(), (rank, login or c['name']))
+    return {'login': by_login, 'name': by_name}
+
+def map_author_to_contributor(author_name: str, author_email: str,
+                              index: Dict[str, Dict[str, Tuple[int, str]]]) -> str:
     name_l = (author_name or "").strip().lower()
     email_l = (author_email or "").strip().lower()
-    for c in (contributors or [])[:10]:
-        login = (c.get('login') or '').strip()
-        if login and login.lower() in (name_l, email_l):
-            return login
-        if c.get('name') and c['name'].strip().lower() == name_l:
-            return login or c['name']
+    by_login, by_name = index['login'], index['name']
+    hits = [h for h in (by_login.get(name_l), by_login.get(email_l), by_name.get(name_l)) if h]
+    if hits:
+        return min(hits)[1]
     return author_name or "unknown"
 
 MANIFEST_GLOBS = [
@@ -2118,44 +3310,150 @@ MANIFEST_GLOBS = [
     "go.mod", "Gemfile", "Gemfile.lock"
 ]
 
+# Exact-name lookups plus one suffix test per file entry (any *.lock is a lock file)
+_MANIFEST_NAMES = frozenset(MANIFEST_GLOBS)
+_MANIFEST_LOCK_SUFFIX = ".lock"
+
 def _iter_manifest_files(repo_local_path: str) -> List[str]:
+    """List manifest files (relative paths) with a scandir walk that skips vendored trees.
+
+    Directory entries come with their type from the directory listing, so no per-entry
+    stat is needed; traversal order matches a top-down os.walk.
+    """
     found = []
-    for root, _dirs, files in os.walk(repo_local_path):
-        for fn in files:
-            if fn in MANIFEST_GLOBS or fn.endswith((".lock",)):
-                found.append(os.path.relpath(os.path.join(root, fn), repo_local_path))
+    prefix_len = len(os.path.join(repo_local_path, ''))
+    stack = [repo_local_path]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _FINGERPRINT_PRUNE:
+                            subdirs.append(entry.path)
+                    elif entry.name in _MANIFEST_NAMES or entry.name.endswith(_MANIFEST_LOCK_SUFFIX):
+                        found.append(entry.path[prefix_len:])
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
     return found
 
-def find_manifest_references(repo_local_path: str, package: str, version: Optional[str]) -> List[Tuple[str, int, str]]:
-    refs: List[Tuple[str, int, str]] = []
-    pk_re = re.compile(re.escape(package), re.IGNORECASE)
-    ver_re = re.compile(re.escape(version)) if version else None
+def load_manifests(repo_local_path: str) -> List[Tuple[str, bytes, bytes]]:
+    """Read every manifest once as (relative path, raw bytes, lowercased bytes).
+
+    Kept as bytes: references are located with bytes.find, so the (often multi-MB)
+    lock files are never decoded or split into lines.
+    """
+    manifests: List[Tuple[str, bytes, bytes]] = []
     for rel in _iter_manifest_files(repo_local_path):
         try:
-            with open(os.path.join(repo_local_path, rel), 'r', errors='ignore') as f:
-                for idx, line in enumerate(f, start=1):
-                    if pk_re.search(line) and (ver_re.search(line) if ver_re else True):
-                        disp = f"[dep] {rel}:{idx} {package}{('@'+version) if version else ''}"
-                        refs.append((rel, idx, disp))
-                        if len(refs) >= 3:
-                            return refs
+            with open(os.path.join(repo_local_path, rel), 'rb') as f:
+                data = f.read()
         except Exception:
             continue
+        manifests.append((rel, data, data.lower()))
+    return manifests
+
+def find_manifest_references(manifests: List[Tuple[str, bytes, bytes]], package: str,
+                             version: Optional[str]) -> List[Tuple[str, int, str]]:
+    refs: List[Tuple[str, int, str]] = []
+    # Literal matches on one line: package name case-insensitively, version exactly
+    pkg_b = package.lower().encode()
+    ver_b = version.encode() if version else None
+    disp_pkg = f"{package}{('@'+version) if version else ''}"
+    for rel, data, lower in manifests:
+        pos = 0
+        line_no, counted = 1, 0
+        while True:
+            hit = lower.find(pkg_b, pos)
+            if hit < 0:
+                break
+            start = lower.rfind(b'\n', 0, hit) + 1
+            end = lower.find(b'\n', hit)
+            if end < 0:
+                end = len(lower)
+            if ver_b is None or data.find(ver_b, start, end) >= 0:
+                line_no += lower.count(b'\n', counted, start)
+                counted = start
+                refs.append((rel, line_no, f"[dep] {rel}:{line_no} {disp_pkg}"))
+                if len(refs) >= 3:
+                    return refs
+            pos = end + 1
     return refs
 
+def _last_commit_date(session: requests.Session, repo_full_name: str, login: str) -> Optional[str]:
+    """Date of a contributor's most recent commit to the repository, or None."""
+    try:
+        url = f"{config.GITHUB_API}/repos/{repo_full_name}/commits?author={login}&per_page=1"
+        r = session.get(url, timeout=10)
+        if r.status_code == 200:
+            commits = _json_body(r)
+            if commits:
+                return commits[0]['commit']['author']['date']
+    except Exception:
+        pass
+    return None
+
+def fetch_last_commits_graphql(session: requests.Session, repo_full_name: str,
+                               contributors: List[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    """
+    Fetch each contributor's latest commit date on the default branch in one GraphQL request.
+    
+    Each contributor gets an aliased ``history(first: 1, author: {id:})`` field on the
+    branch head, keyed by the node_id from the REST contributor listing.
+    
+    Returns:
+        Dict mapping login to the commit's authored date, or None when the query cannot
+        be answered (missing node ids, GraphQL errors) and the REST lookup should be used
+    """
+    if not contributors:
+        return {}
+    if not all(c.get('node_id') for c in contributors):
+        return None
+    owner, name = repo_full_name.split('/', 1)
+    params = ", ".join(["$owner: String!", "$name: String!"] +
+                       [f"$a{i}: ID!" for i in range(len(contributors))])
+    fields = " ".join(f"c{i}: history(first: 1, author: {{id: $a{i}}}) {{ nodes {{ authoredDate }} }}"
+                      for i in range(len(contributors)))
+    query = (f"query({params}) {{ repository(owner: $owner, name: $name) {{ "
+             f"defaultBranchRef {{ target {{ ... on Commit {{ {fields} }} }} }} }} }}")
+    variables = {"owner": owner, "name": name,
+                 **{f"a{i}": c['node_id'] for i, c in enumerate(contributors)}}
+    
+    response = session.post(f"{config.GITHUB_API}/graphql",
+                            json={"query": query, "variables": variables}, timeout=30)
+    response.raise_for_status()
+    payload = _json_body(response)
+    if payload.get("errors"):
+        logging.debug(f"GraphQL last-commit lookup errors: {payload['errors']}")
+        return None
+    repo = (payload.get("data") or {}).get("repository") or {}
+    head = ((repo.get("defaultBranchRef") or {}).get("target")) or {}
+    
+    out: Dict[str, str] = {}
+    for i, c in enumerate(contributors):
+        nodes = (head.get(f"c{i}") or {}).get("nodes") or []
+        if nodes and nodes[0].get("authoredDate"):
+            out[c['login']] = nodes[0]['authoredDate']
+    return out
+
 def get_last_commit_per_contributor(session: requests.Session, repo_full_name: str, contributors: List[Dict[str, Any]]) -> Dict[str, str]:
+    top = [c for c in (contributors or [])[:5] if c.get('login')]
+    try:
+        dates = fetch_last_commits_graphql(session, repo_full_name, top)
+    except Exception as e:
+        logging.debug(f"GraphQL last-commit lookup failed for {repo_full_name}: {e}")
+        dates = None
+    if dates is not None:
+        return dates
+    # REST fallback: one lookup per contributor, overlapped on the shared GitHub read pool
+    futures = [(c['login'], _GH_READ_POOL.submit(_last_commit_date, session, repo_full_name, c['login']))
+               for c in top]
     out: Dict[str, str] = {}
-    for c in (contributors or [])[:5]:
-        login = c.get('login')
-        if not login:
-            continue
-        try:
-            url = f"{config.GITHUB_API}/repos/{repo_full_name}/commits?author={login}&per_page=1"
-            r = session.get(url, headers=config.HEADERS)
-            if r.status_code == 200 and r.json():
-                out[login] = r.json()[0]['commit']['author']['date']
-        except Exception:
-            continue
+    for login, fut in futures:
+        date = fut.result()
+        if date:
+            out[login] = date
     return out
 
 def aggregate_vulns_by_contributor(repo_local_path: str,
@@ -2164,11 +3462,17 @@ def aggregate_vulns_by_contributor(repo_local_path: str,
                                    contributors: List[Dict[str, Any]],
                                    blame_cap_semgrep: int = 200,
                                    blame_cap_grype: int = 100) -> Dict[str, Dict[str, Any]]:
-    contrib_map: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"count": 0, "locations": [], "details": []})
+    # locations_set mirrors locations for O(1) membership tests; dropped before returning
+    contrib_map: Dict[str, Dict[str, Any]] = defaultdict(
+        lambda: {"count": 0, "locations": [], "locations_set": set(), "details": []})
+    contrib_index = build_contributor_index(contributors)
 
-    # Semgrep mapping
+    # Collect blame targets first so each file is blamed once, then attribute in memory.
+    # Each target is (path, line, location shown in the table, detail line).
+    targets: List[Tuple[str, int, str, str]] = []
+
+    # Semgrep findings
     seen = set()
-    blamed = 0
     for res in semgrep_results:
         path = res.get('path')
         start = res.get('start', {}).get('line') or res.get('start', {}).get('lineNumber') or 0
@@ -2179,21 +3483,18 @@ def aggregate_vulns_by_contributor(repo_local_path: str,
         if key in seen:
             continue
         seen.add(key)
-        if blamed >= blame_cap_semgrep:
+        if len(targets) >= blame_cap_semgrep:
             break
-        blamed += 1
-        author = blame_line(repo_local_path, path, int(start))
-        who = map_author_to_contributor(author.get('name', ''), author.get('email', ''), contributors)
-        contrib_map[who]["count"] += 1
         loc = f"{path}:{start}"
-        if len(contrib_map[who]["locations"]) < 3 and loc not in contrib_map[who]["locations"]:
-            contrib_map[who]["locations"].append(loc)
-        # Details
         rule_name = res.get('extra', {}).get('message', '') or str(rule_id)
-        contrib_map[who]["details"].append(f"- Semgrep: {loc} ({rule_name})")
+        targets.append((path, int(start), loc, f"- Semgrep: {loc} ({rule_name})"))
 
-    # Grype mapping
+    # Grype matches, located in manifests
     matches = (grype_data.get('matches') or []) if isinstance(grype_data, dict) else []
+    # Manifests are walked and read once, not once per match
+    manifests = load_manifests(repo_local_path) if matches else []
+    # A package with several advisories appears in several matches; search it once
+    refs_by_pkg: Dict[Tuple[str, str], List[Tuple[str, int, str]]] = {}
     blamed_g = 0
     for m in matches:
         if blamed_g >= blame_cap_grype:
@@ -2204,29 +3505,43 @@ def aggregate_vulns_by_contributor(repo_local_path: str,
         ver = art.get('version') or ''
         if not pkg:
             continue
-        refs = find_manifest_references(repo_local_path, pkg, ver)
+        refs = refs_by_pkg.get((pkg, ver))
+        if refs is None:
+            refs = refs_by_pkg[(pkg, ver)] = find_manifest_references(manifests, pkg, ver)
         for (rel, line_no, disp) in refs:
             if blamed_g >= blame_cap_grype:
                 break
             blamed_g += 1
-            author = blame_line(repo_local_path, rel, int(line_no))
-            who = map_author_to_contributor(author.get('name', ''), author.get('email', ''), contributors)
-            contrib_map[who]["count"] += 1
-            if len(contrib_map[who]["locations"]) < 3 and disp not in contrib_map[who]["locations"]:
-                contrib_map[who]["locations"].append(disp)
             vid = vuln.get('id') or vuln.get('cve') or ''
             sev = vuln.get('severity') or ''
-            contrib_map[who]["details"].append(f"- Grype: {disp} {pkg}{('@'+ver) if ver else ''} {vid} {('Severity: '+sev) if sev else ''}")
-
+            targets.append((rel, int(line_no), disp,
+                            f"- Grype: {disp} {pkg}{('@'+ver) if ver else ''} {vid} {('Severity: '+sev) if sev else ''}"))
+
+    blames = blame_files(repo_local_path, (t[0] for t in targets))
+    for path, line, loc, detail in targets:
+        name, email = blames[path].get(line) or ("unknown", "")
+        who = map_author_to_contributor(name, email, contrib_index)
+        entry = contrib_map[who]
+        entry["count"] += 1
+        if len(entry["locations"]) < 3 and loc not in entry["locations_set"]:
+            entry["locations_set"].add(loc)
+            entry["locations"].append(loc)
+        entry["details"].append(detail)
+
+    for entry in contrib_map.values():
+        entry.pop("locations_set", None)
     return contrib_map
 
 def build_contributor_vuln_table(session: requests.Session,
                                  repo_full_name: str,
                                  repo_local_path: str,
                                  report_dir: str,
-                                 repo_name: str) -> Tuple[List[List[str]], Dict[str, str]]:
-    # Load contributors
-    contributors = get_repo_contributors(session, repo_full_name)
+                                 repo_name: str,
+                                 contributors: Optional[List[Dict[str, Any]]] = None
+                                 ) -> Tuple[List[List[str]], Dict[str, str]]:
+    # Load contributors unless the caller already fetched them
+    if contributors is None:
+        contributors = get_repo_contributors(session, repo_full_name)
     # Load Semgrep/Grype outputs
     semgrep_json = os.path.join(report_dir, f"{repo_name}_semgrep.json")
     grype_json = os.path.join(report_dir, f"{repo_name}_grype_repo.json")
@@ -2257,42 +3572,83 @@ def build_contributor_vuln_table(session: requests.Session,
 
 # -------------------- Terraform Pre-Deploy Section --------------------
 
+# Checkov check-name keywords per remediation group; the first group with a match wins
+_TF_REMEDIATION_GROUPS = (
+    ('Security', ('encrypt', 'kms', 'public access block', 'versioning')),
+    ('Network', ('security group', 'ingress', 'egress', 'cidr', 'public')),
+    ('IAM', ('policy', 'role', 'wildcard', 'iam', 'principal')),
+    ('Logging/Monitoring', ('cloudtrail', 'log', 'retention', 'config')),
+    ('Data Protection', ('s3 bucket policy', 'storage_encrypted', 'rds', 'db')),
+    ('Compliance/Tagging', ('tag', 'owner', 'environment', 'cost')),
+)
+
+# Checkov reports the same check name for every affected resource, so classify each
+# distinct name once
+@lru_cache(maxsize=1024)
+def _tf_remediation_group(name: str) -> str:
+    s = (name or '').lower()
+    return next((group for group, keywords in _TF_REMEDIATION_GROUPS
+                 if any(k in s for k in keywords)), 'Security')
+
+# (keywords, hint) pairs for the detailed guidance; first match wins
+_TF_FIX_HINTS = (
+    (('encrypt', 'kms'), "enable encryption at rest (e.g., KMS or SSE where applicable)."),
+    (('public', 'ingress', 'egress', 'cidr'), "restrict network exposure (tighten CIDRs, remove public access)."),
+    (('policy', 'iam', 'wildcard'), "restrict IAM policies (avoid wildcards, least privilege)."),
+    (('log', 'trail', 'retention'), "ensure logging/monitoring is enabled with appropriate retention."),
+    (('tag',), "add required tags (owner, environment, cost-center)."),
+)
+
+@lru_cache(maxsize=1024)
+def _tf_fix_hint(name: str) -> str:
+    s = (name or '').lower()
+    hint = next((h for keywords, h in _TF_FIX_HINTS if any(k in s for k in keywords)),
+                "update resource configuration per guideline.")
+    return f"- How to fix: {hint}\n"
+
+# Fixed closing text of the Terraform section
+_TF_PREDEPLOY_FOOTER = (
+    "### Configuration Hygiene Checklist\n\n"
+    "- terraform fmt and terraform validate pass\n"
+    "- Provider and module versions pinned\n"
+    "- .terraform.lock.hcl committed\n"
+    "- Remote backend state encryption enabled\n"
+    "- Sensitive variables sourced from secrets manager (not plaintext)\n"
+    "- Tagging standards (owner, env, cost-center) applied\n\n"
+    "### Deployment Readiness Criteria\n\n"
+    "- 0 Critical/High failed checks from Checkov\n"
+    "- No public exposure of critical resources\n"
+    "- Encryption-at-rest enabled for storage resources\n"
+    "- Logging/monitoring enabled where applicable\n"
+)
+
 def build_tf_predeploy_section(report_dir: str, repo_name: str) -> str:
     """Build a Terraform Pre-Deploy section using Checkov JSON results.
 
     Returns a markdown string or empty string if no Checkov JSON is available.
     """
     checkov_json = os.path.join(report_dir, f"{repo_name}_checkov.json")
-    if not os.path.exists(checkov_json):
-        return ""
     try:
-        with open(checkov_json, 'r') as f:
-            data = json.load(f)
+        data = _read_json_file(checkov_json)
     except Exception:
         return ""
 
     results = (data or {}).get('results', {})
     failed = results.get('failed_checks', []) or []
     # Severity counts
-    sev_counts = {"CRITICAL":0, "HIGH":0, "MEDIUM":0, "LOW":0, "UNKNOWN":0}
-    for item in failed:
-        sev = (item.get('severity') or 'UNKNOWN').upper()
-        if sev not in sev_counts:
-            sev = 'UNKNOWN'
-        sev_counts[sev] += 1
+    counted = Counter((item.get('severity') or 'UNKNOWN').upper() for item in failed)
+    sev_counts = {k: counted.pop(k, 0) for k in _SEVERITY_LEVELS}
+    sev_counts["UNKNOWN"] += sum(counted.values())  # Unrecognised severities
     gate_fail = (sev_counts['CRITICAL'] > 0) or (sev_counts['HIGH'] > 0)
     gate = "FAIL" if gate_fail else "PASS"
 
     # Deduplicate and sort top items
-    def _sev_rank(s: str) -> int:
-        s = (s or 'UNKNOWN').upper()
-        order = {"CRITICAL":0, "HIGH":1, "MEDIUM":2, "LOW":3, "UNKNOWN":4}
-        return order.get(s, 5)
+    # Check IDs are fixed-case identifiers (CKV_AWS_20), so only resource and path are folded
     seen = set()
     unique_failed = []
     for it in failed:
         key = (
-            (it.get('check_id') or '').lower(),
+            it.get('check_id') or '',
             (it.get('resource') or '').lower(),
             (it.get('file_path') or '').lower(),
             str(it.get('file_line_range') or '')
@@ -2301,16 +3657,21 @@ def build_tf_predeploy_section(report_dir: str, repo_name: str) -> str:
             continue
         seen.add(key)
         unique_failed.append(it)
-    unique_failed.sort(key=lambda x: (_sev_rank(x.get('severity')), (x.get('file_path') or '')))
+    # Only the head of the ordering is ever rendered (top 10 table, 50 detailed entries,
+    # 20 per remediation group), so select with heapq.nsmallest (stable, like sorted)
+    # rather than sorting every failed check
+    def sev_key(x):
+        return (_CHECKOV_TOP_ORDER.get((x.get('severity') or 'UNKNOWN').upper(), 5), (x.get('file_path') or ''))
+    top_failed = heapq.nsmallest(50, unique_failed, key=sev_key)
 
     # Build Top table (up to 10)
-    md = []
-    md.append("## Terraform Pre-Deploy\n")
-    md.append(f"**Gate:** {gate} (Critical: {sev_counts['CRITICAL']}, High: {sev_counts['HIGH']}, Medium: {sev_counts['MEDIUM']}, Low: {sev_counts['LOW']})\n\n")
-    md.append("### Summary of Failed Checks (Top 10)\n\n")
-    md.append("| Severity | Check ID | Resource | File:Line |\n")
-    md.append("|---|---|---|---|\n")
-    for it in unique_failed[:10]:
+    md = io.StringIO()
+    md.write("## Terraform Pre-Deploy\n")
+    md.write(f"**Gate:** {gate} (Critical: {sev_counts['CRITICAL']}, High: {sev_counts['HIGH']}, Medium: {sev_counts['MEDIUM']}, Low: {sev_counts['LOW']})\n\n")
+    md.write("### Summary of Failed Checks (Top 10)\n\n")
+    md.write("| Severity | Check ID | Resource | File:Line |\n")
+    md.write("|---|---|---|---|\n")
+    for it in top_failed[:10]:
         sev = (it.get('severity') or 'UNKNOWN').upper()
         chk = it.get('check_id', 'UNKNOWN')
         res = it.get('resource', 'resource')
@@ -2319,11 +3680,11 @@ def build_tf_predeploy_section(report_dir: str, repo_name: str) -> str:
         line_disp = f"{file_path}{(':' + '-'.join(map(str, lines))) if lines else ''}"
         guide = it.get('guideline') or ''
         chk_disp = f"[{chk}]({guide})" if guide else chk
-        md.append(f"| {sev} | {chk_disp} | {res} | {line_disp} |\n")
-    md.append("\n")
+        md.write(f"| {sev} | {chk_disp} | {res} | {line_disp} |\n")
+    md.write("\n")
 
     # Grouped remediation tasks
-    md.append("### Required Remediation Tasks (Grouped)\n\n")
+    md.write("### Required Remediation Tasks (Grouped)\n\n")
     groups = {
         'Security': [],
         'Network': [],
@@ -2332,101 +3693,56 @@ def build_tf_predeploy_section(report_dir: str, repo_name: str) -> str:
         'Data Protection': [],
         'Compliance/Tagging': [],
     }
-    def _assign_group(name: str) -> str:
-        s = (name or '').lower()
-        if any(k in s for k in ['encrypt', 'kms', 'public access block', 'versioning']):
-            return 'Security'
-        if any(k in s for k in ['security group', 'ingress', 'egress', 'cidr', 'public']):
-            return 'Network'
-        if any(k in s for k in ['policy', 'role', 'wildcard', 'iam', 'principal']):
-            return 'IAM'
-        if any(k in s for k in ['cloudtrail', 'log', 'retention', 'config']):
-            return 'Logging/Monitoring'
-        if any(k in s for k in ['s3 bucket policy', 'storage_encrypted', 'rds', 'db']):
-            return 'Data Protection'
-        if any(k in s for k in ['tag', 'owner', 'environment', 'cost']):
-            return 'Compliance/Tagging'
-        return 'Security'
     for it in unique_failed:
         name = it.get('check_name') or it.get('check_id') or ''
-        grp = _assign_group(name)
+        grp = _tf_remediation_group(name)
         res = it.get('resource', 'resource')
         file_path = it.get('file_path', 'unknown')
         lines = it.get('file_line_range') or []
         md_line = f"- {name} on {res} ({file_path}{':' + '-'.join(map(str, lines)) if lines else ''})"
-        groups[grp].append(md_line)
+        groups[grp].append((sev_key(it), md_line))
     for gname, items in groups.items():
         if not items:
             continue
-        md.append(f"#### {gname}\n\n")
-        md.extend([i + "\n" for i in items[:20]])
-        md.append("\n")
+        md.write(f"#### {gname}\n\n")
+        md.writelines(i + "\n" for _, i in heapq.nsmallest(20, items, key=lambda e: e[0]))
+        md.write("\n")
 
     # Collapsible details
-    md.append("### Detailed Remediation Guidance\n\n")
-    for it in unique_failed[:50]:
+    md.write("### Detailed Remediation Guidance\n\n")
+    for it in top_failed:
         chk = it.get('check_id', 'UNKNOWN')
         name = it.get('check_name', '')
         res = it.get('resource', 'resource')
         file_path = it.get('file_path', 'unknown')
         lines = it.get('file_line_range') or []
         guide = it.get('guideline') or ''
-        md.append(f"<details><summary>{chk}: {name}</summary>\n\n")
-        md.append(f"- Resource: {res}\n")
-        md.append(f"- File: {file_path}{(':' + '-'.join(map(str, lines))) if lines else ''}\n")
+        md.write(f"<details><summary>{chk}: {name}</summary>\n\n")
+        md.write(f"- Resource: {res}\n")
+        md.write(f"- File: {file_path}{(':' + '-'.join(map(str, lines))) if lines else ''}\n")
         if guide:
-            md.append(f"- Guideline: {guide}\n")
+            md.write(f"- Guideline: {guide}\n")
         # Heuristic fix hint
-        lower = (name or '').lower()
-        if 'encrypt' in lower or 'kms' in lower:
-            md.append("- How to fix: enable encryption at rest (e.g., KMS or SSE where applicable).\n")
-        elif 'public' in lower or 'ingress' in lower or 'egress' in lower or 'cidr' in lower:
-            md.append("- How to fix: restrict network exposure (tighten CIDRs, remove public access).\n")
-        elif 'policy' in lower or 'iam' in lower or 'wildcard' in lower:
-            md.append("- How to fix: restrict IAM policies (avoid wildcards, least privilege).\n")
-        elif 'log' in lower or 'trail' in lower or 'retention' in lower:
-            md.append("- How to fix: ensure logging/monitoring is enabled with appropriate retention.\n")
-        elif 'tag' in lower:
-            md.append("- How to fix: add required tags (owner, environment, cost-center).\n")
-        else:
-            md.append("- How to fix: update resource configuration per guideline.\n")
-        md.append("\n</details>\n\n")
+        md.write(_tf_fix_hint(name))
+        md.write("\n</details>\n\n")
 
     # Hygiene & Readiness
-    md.append("### Configuration Hygiene Checklist\n\n")
-    md.append("- terraform fmt and terraform validate pass\n")
-    md.append("- Provider and module versions pinned\n")
-    md.append("- .terraform.lock.hcl committed\n")
-    md.append("- Remote backend state encryption enabled\n")
-    md.append("- Sensitive variables sourced from secrets manager (not plaintext)\n")
-    md.append("- Tagging standards (owner, env, cost-center) applied\n\n")
+    md.write(_TF_PREDEPLOY_FOOTER)
 
-    md.append("### Deployment Readiness Criteria\n\n")
-    md.append("- 0 Critical/High failed checks from Checkov\n")
-    md.append("- No public exposure of critical resources\n")
-    md.append("- Encryption-at-rest enabled for storage resources\n")
-    md.append("- Logging/monitoring enabled where applicable\n")
-
-    return "".join(md)
+    return md.getvalue()
 
 
 def generate_summary_report(repo_name: str, repo_url: str, requirements_path: str, 
-                          safety_result: subprocess.CompletedProcess,
-                          pip_audit_result: subprocess.CompletedProcess,
-                          npm_audit_result: subprocess.CompletedProcess,
-                          govulncheck_result: subprocess.CompletedProcess,
-                          bundle_audit_result: subprocess.CompletedProcess,
-                          dependency_check_result: subprocess.CompletedProcess,
-                          semgrep_result: subprocess.CompletedProcess,
-                          semgrep_taint_result: Optional[subprocess.CompletedProcess],
-                          checkov_result: Optional[subprocess.CompletedProcess],
-                          gitleaks_result: Optional[subprocess.CompletedProcess],
-                          bandit_result: Optional[subprocess.CompletedProcess],
-                          trivy_fs_result: Optional[subprocess.CompletedProcess],
+                          results: ScanResults,
                           repo_local_path: str,
                           report_dir: str,
-                          repo_full_name: str = "") -> None:
-    """Generate a summary report of all scan results."""
+                          repo_full_name: str = "",
+                          languages: Optional[List[Tuple[str, int]]] = None) -> None:
+    """Generate a summary report of all scan results.
+
+    languages is the repository's GitHub language breakdown when process_repo already
+    fetched it; otherwise it is requested along with the other metadata.
+    """
     summary_path = os.path.join(report_dir, f"{repo_name}_summary.md")
     
     def get_scan_status(result):
@@ -2438,8 +3754,52 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
             return "⚠️  Issues found"
         return f"❌ Error (Code: {result.returncode})"
     
+    # Several sections use the same tool reports: parse each (and enrich Grype) only once
+    parsed: Dict[str, Any] = {}
+    def load_report(suffix: str) -> Any:
+        """Decoded {repo_name}_{suffix}.json, or None when the tool did not produce it."""
+        if suffix not in parsed:
+            path = os.path.join(report_dir, f"{repo_name}_{suffix}.json")
+            try:
+                parsed[suffix] = _read_json_file(path)
+            except FileNotFoundError:
+                parsed[suffix] = None
+        return parsed[suffix]
+    
+    def load_grype() -> Any:
+        """The repo Grype report with KEV/EPSS threat intel attached, or None."""
+        if 'grype_enriched' not in parsed:
+            grype_data = load_report('grype_repo')
+            parsed['grype_enriched'] = None if grype_data is None else enrich_grype_with_threat_intel(grype_data)
+        return parsed['grype_enriched']
+    
+    def threat_intel_counts() -> Optional[Tuple[int, int, int]]:
+        """(KEV mapped, EPSS mapped, unmapped) over the Grype matches, counted in one pass."""
+        if 'threat_counts' not in parsed:
+            grype_data = load_grype()
+            counts = None
+            if grype_data is not None:
+                matches = grype_data.get('matches', []) if isinstance(grype_data, dict) else []
+                kev_mapped = epss_mapped = unmapped = 0
+                for m in matches:
+                    thr = m.get('_threat') or _EMPTY
+                    if thr.get('kev'):
+                        kev_mapped += 1
+                    epss = thr.get('epss')
+                    if type(epss) in (int, float) and epss > 0:
+                        epss_mapped += 1
+                    # Consider unmapped where no CVE id or missing _threat entirely
+                    vul_id = (m.get('vulnerability') or _EMPTY).get('id') or ''
+                    if not thr or not vul_id.startswith('CVE-'):
+                        unmapped += 1
+                counts = (kev_mapped, epss_mapped, unmapped)
+            parsed['threat_counts'] = counts
+        return parsed['threat_counts']
+    
     try:
-        with open(summary_path, 'w') as f:
+        # Sections are assembled in memory and the file is written once at the end, so
+        # the many small writes never reach the I/O layer
+        with io.StringIO() as f:
             f.write(f"# Security Scan Summary\n\n")
             f.write(f"**Repository:** [{repo_name}]({repo_url})\n")
             f.write(f"**Scan Date:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
@@ -2449,65 +3809,57 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
             # Derive Bandit and Trivy statuses from JSON outputs (return codes may be 0 even with findings)
             bandit_status = "Not run"
             try:
-                bandit_json = os.path.join(report_dir, f"{repo_name}_bandit.json")
-                if os.path.exists(bandit_json):
-                    bd = json.load(open(bandit_json))
-                    results = bd.get('results', []) if isinstance(bd, dict) else []
-                    bandit_status = "✅ Success (No issues found)" if not results else "⚠️  Issues found"
+                bd = load_report('bandit')
+                if bd is not None:
+                    findings = bd.get('results', []) if isinstance(bd, dict) else []
+                    bandit_status = "✅ Success (No issues found)" if not findings else "⚠️  Issues found"
             except Exception:
-                bandit_status = get_scan_status(bandit_result)
+                bandit_status = get_scan_status(results.bandit)
 
             trivy_status = "Not run"
             try:
-                trivy_json = os.path.join(report_dir, f"{repo_name}_trivy_fs.json")
-                if os.path.exists(trivy_json):
-                    td = json.load(open(trivy_json))
-                    results = td.get('Results', []) if isinstance(td, dict) else []
+                td = load_report('trivy_fs')
+                if td is not None:
+                    trivy_results = td.get('Results', []) if isinstance(td, dict) else []
                     total = 0
-                    for res in results:
+                    for res in trivy_results:
                         vulns = res.get('Vulnerabilities', []) or []
                         total += len(vulns)
                     trivy_status = "✅ Success (No issues found)" if total == 0 else "⚠️  Issues found"
             except Exception:
-                trivy_status = get_scan_status(trivy_fs_result)
-            f.write("| Tool | Status |\n")
-            f.write("|------|--------|\n")
-            f.write(f"| Safety | {get_scan_status(safety_result)} |\n")
-            f.write(f"| pip-audit | {get_scan_status(pip_audit_result)} |\n")
-            f.write(f"| npm audit | {get_scan_status(npm_audit_result)} |\n")
-            f.write(f"| govulncheck | {get_scan_status(govulncheck_result)} |\n")
-            f.write(f"| bundle audit | {get_scan_status(bundle_audit_result)} |\n")
-            f.write(f"| OWASP Dependency-Check | {get_scan_status(dependency_check_result)} |\n")
-            f.write(f"| Semgrep | {get_scan_status(semgrep_result)} |\n")
-            f.write(f"| Semgrep (taint) | {get_scan_status(semgrep_taint_result)} |\n")
-            f.write(f"| Checkov (Terraform) | {get_scan_status(checkov_result)} |\n")
-            f.write(f"| Gitleaks (Secrets) | {get_scan_status(gitleaks_result)} |\n")
-            f.write(f"| Bandit (Python) | {bandit_status} |\n")
-            f.write(f"| Trivy (fs) | {trivy_status} |\n")
-
-            # Policy Gate evaluation (if policy file present)
-            passed, violations = evaluate_policy(report_dir, repo_name)
+                trivy_status = get_scan_status(results.trivy_fs)
+            derived_status = {'bandit': bandit_status, 'trivy_fs': trivy_status}
+            f.write(_STATUS_TABLE_HEADER)
+            for field_name, label in SUMMARY_TOOLS:
+                status = derived_status.get(field_name) or get_scan_status(getattr(results, field_name))
+                f.write(f"| {label} | {status} |\n")
+
+            # Policy Gate evaluation (if policy file present), evaluated once for both the
+            # table row and the Policy Gate section, reusing the enriched Grype report
+            try:
+                policy_reports = {'grype': load_grype()}
+            except Exception:
+                policy_reports = {}  # unreadable: let evaluate_policy treat it as missing
+            passed, violations = evaluate_policy(report_dir, repo_name, policy_reports)
             gate_status = "PASS" if passed else "FAIL"
             f.write(f"| Policy Gate | {gate_status} |\n\n")
             # Compact Threat Intel counts just under the summary table
             try:
-                grype_repo_json = os.path.join(report_dir, f"{repo_name}_grype_repo.json")
-                if os.path.exists(grype_repo_json):
-                    with open(grype_repo_json, 'r') as gf:
-                        grype_data = json.load(gf)
-                    grype_data = enrich_grype_with_threat_intel(grype_data)
-                    matches = grype_data.get('matches', []) if isinstance(grype_data, dict) else []
-                    kev_mapped = sum(1 for m in matches if (m.get('_threat') or {}).get('kev'))
-                    epss_mapped = sum(1 for m in matches if isinstance((m.get('_threat') or {}).get('epss'), (int, float)) and (m.get('_threat') or {}).get('epss') > 0)
+                counts = threat_intel_counts()
+                if counts is not None:
+                    kev_mapped, epss_mapped, _unmapped = counts
                     f.write(f"- Threat Intel: KEV mapped {kev_mapped}, EPSS mapped {epss_mapped}\n\n")
             except Exception:
                 pass
             
+            # One directory listing answers every "was this report produced" check below
+            try:
+                present = set(os.listdir(report_dir))
+            except OSError:
+                present = set()
             # Syft status based on presence of SBOMs
-            syft_repo_path = os.path.join(report_dir, f"{repo_name}_syft_repo.json")
-            syft_image_path = os.path.join(report_dir, f"{repo_name}_syft_image.json")
             syft_status = "Not run"
-            if os.path.exists(syft_repo_path) or os.path.exists(syft_image_path):
+            if f"{repo_name}_syft_repo.json" in present or f"{repo_name}_syft_image.json" in present:
                 syft_status = "✅ Generated"
             f.write(f"| Syft SBOM | {syft_status} |\n\n")
             # Small Policy link for reviewers
@@ -2517,10 +3869,8 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
                 pass
 
             # Grype status based on presence of JSON reports
-            grype_repo_path = os.path.join(report_dir, f"{repo_name}_grype_repo.json")
-            grype_image_path = os.path.join(report_dir, f"{repo_name}_grype_image.json")
             grype_status = "Not run"
-            if os.path.exists(grype_repo_path) or os.path.exists(grype_image_path):
+            if f"{repo_name}_grype_repo.json" in present or f"{repo_name}_grype_image.json" in present:
                 grype_status = "✅ Generated"
                 if getattr(config, 'VEX_FILES', []):
                     grype_status += " (VEX applied)"
@@ -2528,8 +3878,7 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
             
             # Detailed Reports Section
             f.write("## Detailed Reports\n\n")
-            f.write("| Report | Link |\n")
-            f.write("|--------|------|\n")
+            f.write(_REPORTS_TABLE_HEADER)
             report_map = {
                 "Safety": f"{repo_name}_safety.txt",
                 "pip-audit": f"{repo_name}_pip_audit.md",
@@ -2555,8 +3904,7 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
             report_map["Bandit (Python)"] = f"{repo_name}_bandit.md"
             report_map["Trivy (fs)"] = f"{repo_name}_trivy_fs.md"
             for label, filename in report_map.items():
-                path = os.path.join(report_dir, filename)
-                if os.path.exists(path):
+                if filename in present:
                     f.write(f"| {label} | [{filename}](./{filename}) |\n")
                 else:
                     f.write(f"| {label} | Not generated |\n")
@@ -2570,26 +3918,9 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
 
             # Threat Intel summary (KEV/EPSS mapping coverage)
             try:
-                grype_repo_json = os.path.join(report_dir, f"{repo_name}_grype_repo.json")
-                if os.path.exists(grype_repo_json):
-                    with open(grype_repo_json, 'r') as gf:
-                        grype_data = json.load(gf)
-                    # Ensure enrichment so _threat is present
-                    grype_data = enrich_grype_with_threat_intel(grype_data)
-                    matches = grype_data.get('matches', []) if isinstance(grype_data, dict) else []
-                    kev_mapped = 0
-                    epss_mapped = 0
-                    unmapped = 0
-                    for m in matches:
-                        thr = m.get('_threat') or {}
-                        if thr.get('kev'):
-                            kev_mapped += 1
-                        if isinstance(thr.get('epss'), (int, float)) and thr.get('epss') > 0:
-                            epss_mapped += 1
-                        # Consider unmapped where no CVE id or missing _threat entirely
-                        vul_id = (m.get('vulnerability', {}) or {}).get('id') or ''
-                        if not thr or not vul_id.startswith('CVE-'):
-                            unmapped += 1
+                counts = threat_intel_counts()
+                if counts is not None:
+                    kev_mapped, epss_mapped, unmapped = counts
                     f.write("## Threat Intel\n\n")
                     f.write(f"- KEV mapped: {kev_mapped}\n")
                     f.write(f"- EPSS mapped: {epss_mapped}\n")
@@ -2608,7 +3939,6 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
 
             # Policy Gate details
             try:
-                passed, violations = evaluate_policy(report_dir, repo_name)
                 f.write("## Policy Gate\n\n")
                 f.write(f"Status: {'PASS' if passed else 'FAIL'}\n\n")
                 if violations:
@@ -2623,16 +3953,13 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
 
             # Secrets Findings (from Gitleaks)
             try:
-                gitleaks_json = os.path.join(report_dir, f"{repo_name}_gitleaks.json")
-                if os.path.exists(gitleaks_json):
-                    with open(gitleaks_json, 'r') as gf:
-                        leaks_data = json.load(gf)
+                leaks_data = load_report('gitleaks')
+                if leaks_data is not None:
                     findings = leaks_data if isinstance(leaks_data, list) else []
                     f.write("## Secrets Findings (Gitleaks)\n\n")
                     f.write(f"Total findings: {len(findings)}\n\n")
                     if findings:
-                        f.write("| Rule | File:Line | Description |\n")
-                        f.write("|------|-----------|-------------|\n")
+                        f.write(_SECRETS_TABLE_HEADER)
                         for item in findings[:10]:
                             rule = item.get('rule','')
                             file = item.get('file','')
@@ -2646,10 +3973,8 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
             
             # Exploitable Flows (from Semgrep taint)
             try:
-                semgrep_taint_json = os.path.join(report_dir, f"{repo_name}_semgrep_taint.json")
-                if os.path.exists(semgrep_taint_json):
-                    with open(semgrep_taint_json, 'r') as sf:
-                        taint = json.load(sf)
+                taint = load_report('semgrep_taint')
+                if taint is not None:
                     flows = taint.get('results', []) if isinstance(taint, dict) else []
                     f.write("## Exploitable Flows (Semgrep Taint)\n\n")
                     if not flows:
@@ -2670,39 +3995,29 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
                 try:
                     session = make_session()
                     
-                    # 1. Get top contributors
-                    contributors = get_repo_contributors(session, repo_full_name)
-                    
-                    # 2. Get top languages
-                    languages = get_repo_languages(session, repo_full_name)
-                    
-                    # 3. Get commit analysis
-                    commit_analysis = analyze_commit_messages(session, repo_full_name)
+                    # 1-3. Top contributors, top languages and commit analysis, fetched
+                    # concurrently on the shared GitHub read pool
+                    contributors, languages, commit_analysis = fetch_repo_metadata(session, repo_full_name, languages)
                     
                     # 4. Get top vulnerabilities
                     scan_results = {
-                        'safety': safety_result,
-                        'npm_audit': npm_audit_result,
-                        'pip_audit': pip_audit_result
+                        'safety': results.safety,
+                        'npm_audit': results.npm_audit,
+                        'npm_audit_json': os.path.join(report_dir, f"{repo_name}_npm_audit.json"),
+                        'pip_audit': results.pip_audit
                     }
                     # Optionally include Grype (repo) results if present
                     try:
-                        grype_repo_json = os.path.join(report_dir, f"{repo_name}_grype_repo.json")
-                        if os.path.exists(grype_repo_json):
-                            with open(grype_repo_json, 'r') as gf:
-                                grype_data = json.load(gf)
-                                # Enrich with KEV/EPSS and store
-                                grype_data = enrich_grype_with_threat_intel(grype_data)
-                                scan_results['grype'] = grype_data
+                        grype_data = load_grype()
+                        if grype_data is not None:
+                            scan_results['grype'] = grype_data
                     except Exception as _e:
                         logging.debug(f"Could not load/enrich Grype results for top vulnerabilities: {_e}")
                     # Include Trivy FS results if present
                     try:
-                        trivy_fs_json = os.path.join(report_dir, f"{repo_name}_trivy_fs.json")
-                        if os.path.exists(trivy_fs_json):
-                            with open(trivy_fs_json, 'r') as tf:
-                                trivy_data = json.load(tf)
-                                scan_results['trivy_fs'] = trivy_data
+                        trivy_data = load_report('trivy_fs')
+                        if trivy_data is not None:
+                            scan_results['trivy_fs'] = trivy_data
                     except Exception as _e:
                         logging.debug(f"Could not load Trivy fs results for top vulnerabilities: {_e}")
                     top_vulnerabilities = get_top_vulnerabilities(scan_results)
@@ -2719,13 +4034,11 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
                             repo_full_name=repo_full_name,
                             repo_local_path=repo_local_path,
                             report_dir=report_dir,
-                            repo_name=repo_name
+                            repo_name=repo_name,
+                            contributors=contributors
                         )
-                        f.write("| Contributor | Total Number of Commits | Timestamp of Last Commit | Number of Exploitable Vulnerabilities Introduced by Contributor | Exploitable Code Location |\n")
-                        f.write("|---|---:|---|---:|---|\n")
-                        for row in contributor_rows:
-                            f.write("| " + " | ".join(row) + " |\n")
-                        f.write("\n")
+                        f.write(_CONTRIBUTOR_TABLE_HEADER)
+                        f.write("".join(f"| {' | '.join(row)} |\n" for row in contributor_rows) + "\n")
                         # Collapsible details by contributor
                         for login, details_md in contributor_details.items():
                             f.write(f"<details><summary>Details for {login}</summary>\n\n")
@@ -2740,8 +4053,7 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
                     # Top Languages
                     f.write("### Top 5 Languages\n\n")
                     if languages:
-                        for lang, bytes_count in languages:
-                            f.write(f"- {lang}: {bytes_count:,} bytes\n")
+                        f.write("".join(f"- {lang}: {bytes_count:,} bytes\n" for lang, bytes_count in languages))
                     else:
                         f.write("No language data available\n")
                     f.write("\n")
@@ -2761,54 +4073,45 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
                     # Top Vulnerabilities
                     f.write("### Top 5 Vulnerabilities\n\n")
                     if top_vulnerabilities:
-                        f.write("| Type | Package | Severity | Exploitability | Affected | Fixed In | Remediation |\n")
-                        f.write("|------|---------|----------|----------------|-----------|-----------|-------------|\n")
+                        f.write(_VULN_TABLE_HEADER)
+                        # Both tables below show the same KEV/EPSS facts: derive them once per
+                        # vulnerability and build the diagnostics rows alongside the main ones
+                        vuln_rows = []
+                        diag_rows = []
                         for vuln in top_vulnerabilities:
-                            # Visible badges in package name (kept) and a dedicated column
-                            name_badged = vuln['name']
-                            kev = vuln.get('kev')
+                            kev = bool(vuln.get('kev'))
                             epss = vuln.get('epss')
-                            badges = []
-                            if kev:
-                                badges.append("[KEV]")
-                            if isinstance(epss, (int, float)) and epss > 0:
-                                badges.append(f"(EPSS: {epss:.2f})")
-                            if badges:
-                                name_badged = f"{name_badged} {' '.join(badges)}"
+                            epss_num = epss if type(epss) in (int, float) else None
+                            epss_str = f"{epss_num:.2f}" if epss_num is not None and epss_num > 0 else None
 
-                            # Exploitability column value
+                            # Visible badges in package name (kept) and a dedicated column
+                            badges = []
                             expl_parts = []
                             if kev:
+                                badges.append("[KEV]")
                                 expl_parts.append("[KEV]")
-                            if isinstance(epss, (int, float)) and epss > 0:
-                                expl_parts.append(f"EPSS: {epss:.2f}")
+                            if epss_str:
+                                badges.append(f"(EPSS: {epss_str})")
+                                expl_parts.append(f"EPSS: {epss_str}")
+                            name_badged = f"{vuln['name']} {' '.join(badges)}" if badges else vuln['name']
                             expl_col = " ".join(expl_parts) if expl_parts else "—"
 
-                            f.write(
+                            vuln_rows.append(
                                 f"| {vuln['type']} | {name_badged} | {vuln['severity']} | {expl_col} | "
                                 f"{vuln['affected_versions']} | {vuln['fixed_in']} | {vuln['remediation']} |\n"
                             )
+                            kev_cell = "✅" if kev else "—"
+                            epss_cell = "—" if epss_num is None else (epss_str or "0.00")
+                            notes = ""  # Reserved for future mapping notes
+                            diag_rows.append(f"| {vuln['name']} | {kev_cell} | {epss_cell} | {notes} |\n")
+                        f.write("".join(vuln_rows))
                         # Legend for badges
-                        f.write("\n> Legend: [KEV] = Known Exploited Vulnerability; EPSS = Exploit Prediction Scoring System probability.\n\n")
+                        f.write(_VULN_LEGEND)
 
                         # Threat Intel Diagnostics for Top 5
-                        try:
-                            f.write("#### Threat Intel Diagnostics\n\n")
-                            f.write("| Package | KEV | EPSS | Notes |\n")
-                            f.write("|---------|-----|------|-------|\n")
-                            for vuln in top_vulnerabilities:
-                                kev = vuln.get('kev')
-                                epss = vuln.get('epss')
-                                kev_cell = "✅" if kev else "—"
-                                if isinstance(epss, (int, float)):
-                                    epss_cell = f"{epss:.2f}" if epss > 0 else "0.00"
-                                else:
-                                    epss_cell = "—"
-                                notes = ""  # Reserved for future mapping notes
-                                f.write(f"| {vuln['name']} | {kev_cell} | {epss_cell} | {notes} |\n")
-                            f.write("\n")
-                        except Exception as _e:
-                            logging.debug(f"Threat Intel Diagnostics skipped: {_e}")
+                        f.write(_TI_TABLE_HEADER)
+                        f.write("".join(diag_rows))
+                        f.write("\n")
                     else:
                         f.write("No critical vulnerabilities found.\n")
                     f.write("\n")
@@ -2827,6 +4130,9 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
             f.write("## Repository\n\n")
             f.write(f"**URL:** {repo_url}\n")
             
+            with open(summary_path, 'w') as out:
+                out.write(f.getvalue())
+            
             # Only attempt cleanup if we have a valid file path
             if requirements_path and isinstance(requirements_path, str):
                 try:
@@ -2836,14 +4142,6 @@ def generate_summary_report(repo_name: str, repo_url: str, requirements_path: st
                     logging.debug(f"Cleanup skipped for requirements file '{requirements_path}': {e}")
     except Exception as e:
         logging.error(f"Error processing {repo_name or repo.get('name', 'unknown')}: {e}", exc_info=True)
-    finally:
-        # Clean up temporary directory if it exists
-        if config.CLONE_DIR and os.path.exists(config.CLONE_DIR):
-            try:
-                shutil.rmtree(config.CLONE_DIR, ignore_errors=True)
-                logging.info(f"Cleaned up temporary directory: {config.CLONE_DIR}")
-            except Exception as e:
-                logging.warning(f"Failed to clean up temporary directory {config.CLONE_DIR}: {e}")
 
 def main():
     """Main function to orchestrate the repository scanning process."""
@@ -2867,12 +4165,16 @@ def main():
                       help="Docker image name to generate an SBOM for using Syft (e.g., repo/image:tag).")
     parser.add_argument("--syft-format", type=str, default=config.SYFT_FORMAT,
                       help="Syft SBOM output format (e.g., cyclonedx-json, spdx-json). Default: cyclonedx-json")
+    parser.add_argument("--mirror-dir", type=str, default=config.MIRROR_DIR,
+                      help="Directory for persistent bare mirrors reused across runs (empty string disables). Default: ~/.cache/auditgh/mirrors")
     parser.add_argument("--control-dir", type=str, default=config.CONTROL_DIR,
                       help="Directory for control flags (pause.flag, stop.flag) and scan_state.json. Default: .auditgh_control")
     parser.add_argument("--vex", action="append", default=None,
                       help="Path to a VEX document (repeatable). Passed to Grype to refine vulnerability results.")
     parser.add_argument("--semgrep-taint", type=str, default=None,
                       help="Path to a Semgrep taint-mode ruleset (e.g., p/ci or a local .yaml). If provided, runs a second Semgrep pass.")
+    parser.add_argument("--gitleaks-history", action="store_true", default=config.GITLEAKS_HISTORY,
+                      help="Scan the full git history with Gitleaks instead of only the checked-out files; clones and mirrors then fetch full history instead of depth 1 (slow on long histories; env AUDITGH_GITLEAKS_HISTORY)")
     parser.add_argument("--policy", type=str, default=None,
                       help="Path to policy.yaml if not in repo root.")
     parser.add_argument("--token", type=str, default=config.GITHUB_TOKEN,
@@ -2881,8 +4183,12 @@ def main():
                       help="Include forked repositories")
     parser.add_argument("--include-archived", action="store_true",
                       help="Include archived repositories")
-    parser.add_argument("--max-workers", type=int, default=4,
-                      help="Max concurrent workers (default: 4)")
+    parser.add_argument("--max-workers", type=int, default=min(8, (os.cpu_count() or 1) * 2),
+                      help="Max concurrent repository workers (default: min(8, 2 x CPUs))")
+    parser.add_argument("--scan-workers", type=int, default=SCAN_WORKERS,
+                      help=f"Max scanner subprocesses running at once across all repositories (default: {SCAN_WORKERS}, env AUDITGH_SCAN_WORKERS)")
+    parser.add_argument("--clone-concurrency", type=int, default=CLONE_CONCURRENCY,
+                      help=f"Max simultaneous git clones across workers (default: {CLONE_CONCURRENCY})")
     parser.add_argument("--loglevel", type=str, default="INFO",
                       choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
                       help="Set the logging level (default: INFO)")
@@ -2898,7 +4204,7 @@ def main():
         numeric_level = getattr(logging, args.loglevel.upper(), None)
         if not isinstance(numeric_level, int):
             raise ValueError(f"Invalid log level: {args.loglevel}")
-        logging.basicConfig(level=numeric_level)
+        configure_logging(level=numeric_level)
     
     # Update config with command line args
     config.ORG_NAME = args.org
@@ -2908,10 +4214,17 @@ def main():
     config.DOCKER_IMAGE = args.docker_image
     config.SYFT_FORMAT = args.syft_format
     config.CONTROL_DIR = args.control_dir
+    _init_control_paths()
+    config.MIRROR_DIR = args.mirror_dir
     ensure_control_dir()
     config.VEX_FILES = [p for p in (args.vex or []) if p]
     config.SEMGREP_TAINT_CONFIG = args.semgrep_taint
     config.POLICY_PATH = args.policy or 'policy.yaml'
+    config.GITLEAKS_HISTORY = args.gitleaks_history
+    global _CLONE_SEMAPHORE
+    _CLONE_SEMAPHORE = threading.BoundedSemaphore(max(1, int(args.clone_concurrency)))
+    if args.scan_workers != SCAN_WORKERS:
+        set_scan_workers(int(args.scan_workers))
     # Print control convenience commands once at startup
     print_control_instructions()
     # Start hotkey listener if interactive
@@ -2920,6 +4233,11 @@ def main():
         hk.start()
     except Exception:
         pass
+    # Watch the control directory so checkpoints need no filesystem calls
+    try:
+        start_flag_watcher()
+    except Exception:
+        pass
     
     # Update headers if token is available
     if config.GITHUB_TOKEN:
@@ -2935,6 +4253,11 @@ def main():
 
     # Ensure report directory exists
     os.makedirs(config.REPORT_DIR, exist_ok=True)
+    # Start a fresh missing-tools list; _tool_available() appends to it during the scan
+    try:
+        os.remove(os.path.join(config.REPORT_DIR, "tools_missing.md"))
+    except FileNotFoundError:
+        pass
     
     # Set up the temporary directory for cloning
     try:
@@ -2946,6 +4269,9 @@ def main():
         sys.exit(1)
     
     logging.info(f"Reports will be saved to: {os.path.abspath(config.REPORT_DIR)}")
+    if not args.dry_run:
+        # Refresh the shared vulnerability databases once before any repository is scanned
+        warm_vuln_dbs()
     if args.repo:
         logging.info(f"Single repository mode: {args.repo}")
     else:
@@ -2967,30 +4293,43 @@ def main():
                 return
             process_repo(repo, config.REPORT_DIR)
         else:
-            # Get all repositories
-            repos = get_all_repos(
+            # Stream repositories page by page: scanning starts on the first page while
+            # later pages are still being listed, and each page is released once submitted
+            pages = _fetch_repo_pages(
                 session=session,
                 include_forks=args.include_forks,
                 include_archived=args.include_archived
             )
             
-            if not repos:
-                logging.warning("No repositories found matching the criteria.")
-                return
-                
-            logging.info(f"Found {len(repos)} repositories to scan")
             if args.dry_run:
-                for r in repos:
-                    logging.info(f"[DRY-RUN] Would scan: {r.get('full_name', r.get('name','unknown'))}")
+                total = 0
+                for batch in pages:
+                    for r in batch:
+                        logging.info(f"[DRY-RUN] Would scan: {r.get('full_name', r.get('name','unknown'))}")
+                    total += len(batch)
+                if not total:
+                    logging.warning("No repositories found matching the criteria.")
+                    return
+                logging.info(f"Found {total} repositories to scan")
                 logging.info("[DRY-RUN] Exiting without running any scanners.")
                 return
             
-            # Process repositories in parallel
+            # Process repositories in parallel; clones are additionally gated by _CLONE_SEMAPHORE
             max_workers = max(1, int(args.max_workers))
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Repository workers are threads, not processes: they share _SCAN_POOL (the
+            # global cap on scanner subprocesses), the ETag-cached GitHub session, the
+            # threat-intel maps and the log/progress queues. Their own time is mostly
+            # spent waiting on those subprocesses and HTTP calls, which release the GIL.
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="repo") as executor:
                 futures = []
-                for repo in repos:
-                    futures.append(executor.submit(process_repo, repo, config.REPORT_DIR))
+                for batch in pages:
+                    for repo in batch:
+                        futures.append(executor.submit(process_repo, repo, config.REPORT_DIR))
+                
+                if not futures:
+                    logging.warning("No repositories found matching the criteria.")
+                    return
+                logging.info(f"Found {len(futures)} repositories to scan")
                 
                 for future in as_completed(futures):
                     try:
@@ -2999,7 +4338,13 @@ def main():
                         logging.error(f"Error processing a repository: {e}")
         
         logging.info("Scan completed successfully!")
-        # Ensure a final console line for users
+        cache = getattr(session, 'cache', None)
+        if cache is not None:
+            logging.getLogger('auditgh.cache').info(
+                f"GitHub API cache: {cache.hits} hits, {cache.misses} misses ({cache.hit_rate():.0%} hit rate)"
+            )
+        # Ensure a final console line for users, after any queued per-repo lines
+        flush_progress()
         print(f"[auditgh] Scan completed. Reports saved to: {os.path.abspath(config.REPORT_DIR)}")
         
     except KeyboardInterrupt:
@@ -3009,10 +4354,13 @@ def main():
         logging.error(f"An error occurred: {e}", exc_info=True)
         sys.exit(1)
     finally:
-        # Clean up temporary directory if it exists
+        # Clean up temporary directory if it exists. It joins the per-repo deletions
+        # already queued on _CLEANUP_POOL, so the pool's workers share the remaining
+        # unlink work instead of this thread deleting the whole tree serially.
         if config.CLONE_DIR and os.path.exists(config.CLONE_DIR):
             try:
-                shutil.rmtree(config.CLONE_DIR, ignore_errors=True)
+                discard_tree(config.CLONE_DIR)
+                _CLEANUP_POOL.shutdown(wait=True)
                 logging.info(f"Cleaned up temporary directory: {config.CLONE_DIR}")
             except Exception as e:
                 logging.warning(f"Failed to clean up temporary directory {config.CLONE_DIR}: {e}")
@@ -3025,7 +4373,7 @@ def run_syft(target: str, repo_name: str, report_dir: str, target_type: str = "r
     sbom_format: syft output format (e.g., cyclonedx-json, spdx-json)
     """
     os.makedirs(report_dir, exist_ok=True)
-    syft_bin = shutil.which("syft")
+    syft_bin = _which("syft")
     output_json = os.path.join(report_dir, f"{repo_name}_syft_{'repo' if target_type=='repo' else 'image'}.json")
     output_md = os.path.join(report_dir, f"{repo_name}_syft_{'repo' if target_type=='repo' else 'image'}.md")
     if not syft_bin:
@@ -3035,17 +4383,15 @@ def run_syft(target: str, repo_name: str, report_dir: str, target_type: str = "r
     try:
         # Build syft command
         cmd = [syft_bin, target, f"-o", sbom_format]
-        logging.debug(f"Running Syft: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=report_dir)
-        # Write JSON output
-        with open(output_json, 'w') as f:
-            f.write(result.stdout or "")
+        logging.debug("Running Syft: %s", cmd)
+        # SBOMs can run to hundreds of MB: stream them straight into the JSON file
+        result = _run_to_file(cmd, output_json, cwd=report_dir)
         # Minimal MD summary
         with open(output_md, 'w') as f:
             f.write(f"# Syft SBOM ({target_type})\n\n")
             f.write(f"**Target:** {target}\n\n")
             try:
-                data = json.loads(result.stdout)
+                data = _read_json_file(output_json)
                 # Heuristic summaries for common formats
                 if isinstance(data, dict):
                     pkgs = []
@@ -3071,7 +4417,7 @@ def run_grype(target: str, repo_name: str, report_dir: str, target_type: str = "
     target: filesystem path (repo) or image reference (image)
     """
     os.makedirs(report_dir, exist_ok=True)
-    grype_bin = shutil.which("grype")
+    grype_bin = _which("grype")
     output_json = os.path.join(report_dir, f"{repo_name}_grype_{'repo' if target_type=='repo' else 'image'}.json")
     output_md = os.path.join(report_dir, f"{repo_name}_grype_{'repo' if target_type=='repo' else 'image'}.md")
     if not grype_bin:
@@ -3083,26 +4429,25 @@ def run_grype(target: str, repo_name: str, report_dir: str, target_type: str = "
         # Append VEX documents if provided
         for vf in (vex_files or []):
             cmd += ["--vex", vf]
-        logging.debug(f"Running Grype: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=report_dir)
-        # Write JSON output
-        with open(output_json, 'w') as f:
-            f.write(result.stdout or "")
+        logging.debug("Running Grype: %s", cmd)
+        env = {**os.environ, "GRYPE_DB_CACHE_DIR": GRYPE_DB_CACHE_DIR}
+        if _GRYPE_DB_READY:
+            env["GRYPE_DB_AUTO_UPDATE"] = "false"
+        result = _run_to_file(cmd, output_json, cwd=report_dir, env=env)
         # Minimal MD summary
         with open(output_md, 'w') as f:
             f.write(f"# Grype Vulnerability Scan ({target_type})\n\n")
             f.write(f"**Target:** {target}\n\n")
             try:
-                data = json.loads(result.stdout)
-                matches = data.get("matches", []) if isinstance(data, dict) else []
-                sev_counts = {"Critical":0, "High":0, "Medium":0, "Low":0, "Negligible":0, "Unknown":0}
-                for m in matches:
-                    sev = (m.get('vulnerability', {}).get('severity') or 'Unknown').title()
-                    if sev not in sev_counts:
-                        sev = 'Unknown'
-                    sev_counts[sev] += 1
+                matches = _report_items(output_json, ("matches",))
+                # Tally raw severities in C, then normalise each distinct value once
+                raw = Counter(m.get('vulnerability', _EMPTY).get('severity') for m in matches)
+                sev_counts = dict.fromkeys(_GRYPE_SEVERITY_LEVELS, 0)
+                for sev, n in raw.items():
+                    sev = (sev or 'Unknown').title()
+                    sev_counts[sev if sev in sev_counts else 'Unknown'] += n
                 f.write("## Summary\n\n")
-                for k in ["Critical","High","Medium","Low","Negligible","Unknown"]:
+                for k in _GRYPE_SEVERITY_LEVELS:
                     f.write(f"- {k}: {sev_counts[k]}\n")
             except Exception:
                 f.write("Scan completed. See JSON for details.\n")
@@ -3113,23 +4458,14 @@ def run_grype(target: str, repo_name: str, report_dir: str, target_type: str = "
         return subprocess.CompletedProcess(args=["grype", target], returncode=1, stdout="", stderr=str(e))
 
 def run_checkov(repo_path: str, repo_name: str, report_dir: str) -> Optional[subprocess.CompletedProcess]:
-    """Run Checkov to scan Terraform if .tf files are present in repo_path.
+    """Run Checkov to scan Terraform in repo_path (caller checks for .tf files).
 
-    Writes JSON and Markdown summaries. Returns the CompletedProcess on run, or None if not applicable.
+    Writes JSON and Markdown summaries. Returns the CompletedProcess on run.
     """
-    # Detect Terraform files
-    has_tf = False
-    for root, _dirs, files in os.walk(repo_path):
-        if any(fn.endswith('.tf') for fn in files):
-            has_tf = True
-            break
-    if not has_tf:
-        return None
-
     os.makedirs(report_dir, exist_ok=True)
     output_json = os.path.join(report_dir, f"{repo_name}_checkov.json")
     output_md = os.path.join(report_dir, f"{repo_name}_checkov.md")
-    checkov_bin = shutil.which('checkov')
+    checkov_bin = _which('checkov')
     if not checkov_bin:
         with open(output_md, 'w') as f:
             f.write("Checkov is not installed. Install via: pip install checkov or see https://github.com/bridgecrewio/checkov\n")
@@ -3137,31 +4473,29 @@ def run_checkov(repo_path: str, repo_name: str, report_dir: str) -> Optional[sub
 
     try:
         cmd = [checkov_bin, '-d', repo_path, '-o', 'json']
-        logging.debug(f"Running Checkov: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        # Write JSON
-        with open(output_json, 'w') as f:
-            f.write(result.stdout or "")
+        logging.debug("Running Checkov: %s", cmd)
+        result = _run_to_file(cmd, output_json)
         # Write MD summary
         with open(output_md, 'w') as f:
             f.write("# Checkov Terraform Scan\n\n")
             f.write(f"**Target:** {repo_path}\n\n")
             try:
-                data = json.loads(result.stdout or '{}')
-                failed = data.get('results', {}).get('failed_checks', [])
-                # Summarize by severity if present
-                sev_counts = {"CRITICAL":0, "HIGH":0, "MEDIUM":0, "LOW":0, "UNKNOWN":0}
-                for item in failed:
+                # Summarize by severity if present, keeping the first few checks as samples
+                sample: List[Dict[str, Any]] = []
+                sev_counts = dict.fromkeys(_SEVERITY_LEVELS, 0)
+                for item in _report_items(output_json, ('results', 'failed_checks'), b'{}'):
+                    if len(sample) < 10:
+                        sample.append(item)
                     sev = (item.get('severity') or 'UNKNOWN').upper()
                     if sev not in sev_counts:
                         sev = 'UNKNOWN'
                     sev_counts[sev] += 1
                 f.write("## Summary\n\n")
-                for k in ["CRITICAL","HIGH","MEDIUM","LOW","UNKNOWN"]:
+                for k in _SEVERITY_LEVELS:
                     f.write(f"- {k.title()}: {sev_counts[k]}\n")
                 # List a few failed checks
                 f.write("\n## Sample Findings (up to 10)\n\n")
-                for chk in failed[:10]:
+                for chk in sample:
                     rid = chk.get('check_id', 'UNKNOWN')
                     res = chk.get('resource', 'resource')
                     file_path = chk.get('file_path', 'unknown')
@@ -3175,13 +4509,16 @@ def run_checkov(repo_path: str, repo_name: str, report_dir: str) -> Optional[sub
             f.write(f"Error running Checkov: {e}\n")
         return subprocess.CompletedProcess(args=['checkov', '-d', repo_path], returncode=1, stdout="", stderr=str(e))
 
-def run_gitleaks(repo_path: str, repo_name: str, report_dir: str) -> Optional[subprocess.CompletedProcess]:
-    """Run Gitleaks secret scan against the working tree and history.
+def run_gitleaks(repo_path: str, repo_name: str, report_dir: str,
+                 history: Optional[bool] = None) -> Optional[subprocess.CompletedProcess]:
+    """Run Gitleaks secret scan against the working tree (and history if requested).
 
+    history defaults to config.GITLEAKS_HISTORY; walking every commit of a long
+    history can take minutes, while the checkout alone is scanned in seconds.
     Writes JSON and Markdown summaries. Returns CompletedProcess or None if tool missing.
     """
     os.makedirs(report_dir, exist_ok=True)
-    gl_bin = shutil.which('gitleaks')
+    gl_bin = _which('gitleaks')
     output_json = os.path.join(report_dir, f"{repo_name}_gitleaks.json")
     output_md = os.path.join(report_dir, f"{repo_name}_gitleaks.md")
     if not gl_bin:
@@ -3189,21 +4526,30 @@ def run_gitleaks(repo_path: str, repo_name: str, report_dir: str) -> Optional[su
             f.write("Gitleaks is not installed. Install via: brew install gitleaks or see https://github.com/gitleaks/gitleaks\n")
         return subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="gitleaks not installed")
     try:
-        # Detect in working tree and history
-        cmd = [gl_bin, 'detect', '-s', repo_path, '-f', 'json']
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        with open(output_json, 'w') as f:
-            f.write(result.stdout or "")
+        if history is None:
+            history = config.GITLEAKS_HISTORY
+        # --redact keeps the matched secrets out of the JSON report and summary
+        cmd = [gl_bin, 'detect', '-s', repo_path, '-f', 'json', '--redact']
+        if os.path.isfile(GITLEAKS_CONFIG):
+            cmd += ['--config', GITLEAKS_CONFIG]
+        # History scanning needs a git checkout; otherwise scan the files only
+        if not history or not os.path.exists(os.path.join(repo_path, '.git')):
+            cmd.append('--no-git')
+        result = _run_to_file(cmd, output_json)
         # MD summary
         with open(output_md, 'w') as f:
             f.write("# Gitleaks Secrets Scan\n\n")
             try:
-                data = json.loads(result.stdout or '[]')
-                findings = data if isinstance(data, list) else []
-                f.write(f"Total findings: {len(findings)}\n\n")
-                if findings:
+                total = 0
+                sample: List[Dict[str, Any]] = []
+                for item in _report_items(output_json, (), b'[]'):
+                    total += 1
+                    if len(sample) < 10:
+                        sample.append(item)
+                f.write(f"Total findings: {total}\n\n")
+                if sample:
                     f.write("## Sample Findings (up to 10)\n\n")
-                    for item in findings[:10]:
+                    for item in sample:
                         rule = item.get('rule','')
                         file = item.get('file','')
                         line = item.get('line','')
@@ -3218,18 +4564,9 @@ def run_gitleaks(repo_path: str, repo_name: str, report_dir: str) -> Optional[su
         return subprocess.CompletedProcess(args=['gitleaks','detect','-s',repo_path], returncode=1, stdout="", stderr=str(e))
 
 def run_bandit(repo_path: str, repo_name: str, report_dir: str) -> Optional[subprocess.CompletedProcess]:
-    """Run Bandit SAST for Python projects if any .py files exist."""
-    # Detect Python files
-    has_py = False
-    for root, _dirs, files in os.walk(repo_path):
-        if any(fn.endswith('.py') for fn in files):
-            has_py = True
-            break
-    if not has_py:
-        return None
-
+    """Run Bandit SAST for Python projects (caller checks for .py files)."""
     os.makedirs(report_dir, exist_ok=True)
-    bandit_bin = shutil.which('bandit')
+    bandit_bin = _which('bandit')
     output_json = os.path.join(report_dir, f"{repo_name}_bandit.json")
     output_md = os.path.join(report_dir, f"{repo_name}_bandit.md")
     if not bandit_bin:
@@ -3237,27 +4574,28 @@ def run_bandit(repo_path: str, repo_name: str, report_dir: str) -> Optional[subp
             f.write("Bandit is not installed. Install via: pip install bandit or brew install bandit\n")
         return subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="bandit not installed")
     try:
-        cmd = [bandit_bin, "-r", repo_path, "-f", "json", "-q"]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        with open(output_json, 'w') as f:
-            f.write(result.stdout or "")
+        # -x replaces Bandit's default excludes, so keep those alongside SCAN_EXCLUDE_DIRS
+        excludes = ",".join(f"*/{d}/*" for d in (".git", ".tox", "__pycache__", ".eggs") + SCAN_EXCLUDE_DIRS)
+        cmd = [bandit_bin, "-r", repo_path, "-f", "json", "-q", "-x", excludes]
+        result = _run_to_file(cmd, output_json)
         # MD summary
         with open(output_md, 'w') as f:
             f.write("# Bandit Python Security Scan\n\n")
             try:
-                data = json.loads(result.stdout or '{}')
-                results = data.get('results', []) if isinstance(data, dict) else []
+                sample: List[Dict[str, Any]] = []
                 counts = {"HIGH":0, "MEDIUM":0, "LOW":0}
-                for r in results:
+                for r in _report_items(output_json, ('results',), b'{}'):
+                    if len(sample) < 10:
+                        sample.append(r)
                     sev = (r.get('issue_severity') or '').upper()
                     if sev in counts:
                         counts[sev] += 1
                 f.write("## Summary\n\n")
                 for k in ["HIGH","MEDIUM","LOW"]:
                     f.write(f"- {k.title()}: {counts[k]}\n")
-                if results:
+                if sample:
                     f.write("\n## Sample Findings (up to 10)\n\n")
-                    for r in results[:10]:
+                    for r in sample:
                         test_id = r.get('test_id','')
                         issue = r.get('issue_text','')
                         path = r.get('filename','')
@@ -3272,10 +4610,16 @@ def run_bandit(repo_path: str, repo_name: str, report_dir: str) -> Optional[subp
             f.write(f"Error running Bandit: {e}\n")
         return subprocess.CompletedProcess(args=['bandit','-r',repo_path], returncode=1, stdout="", stderr=str(e))
 
-def run_trivy_fs(repo_path: str, repo_name: str, report_dir: str) -> Optional[subprocess.CompletedProcess]:
-    """Run Trivy filesystem scan for vulnerabilities/misconfigs."""
+def run_trivy_fs(repo_path: str, repo_name: str, report_dir: str,
+                 write_summary: bool = True) -> Optional[subprocess.CompletedProcess]:
+    """Run Trivy filesystem scan for vulnerabilities/misconfigs.
+
+    With write_summary=False only the JSON report is produced: the Markdown summary,
+    and the report parse behind it, are skipped for callers that only keep the JSON
+    or summarise later with write_trivy_fs_summary.
+    """
     os.makedirs(report_dir, exist_ok=True)
-    trivy_bin = shutil.which('trivy')
+    trivy_bin = _which('trivy')
     output_json = os.path.join(report_dir, f"{repo_name}_trivy_fs.json")
     output_md = os.path.join(report_dir, f"{repo_name}_trivy_fs.md")
     if not trivy_bin:
@@ -3284,32 +4628,50 @@ def run_trivy_fs(repo_path: str, repo_name: str, report_dir: str) -> Optional[su
         return subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="trivy not installed")
     try:
         # Run with vulnerability and config checks; quiet + JSON
-        cmd = [trivy_bin, "fs", "-q", "-f", "json", repo_path]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        with open(output_json, 'w') as f:
-            f.write(result.stdout or "")
-        # MD summary
-        with open(output_md, 'w') as f:
-            f.write("# Trivy Filesystem Scan\n\n")
-            try:
-                data = json.loads(result.stdout or '{}')
-                results = data.get('Results', []) if isinstance(data, dict) else []
-                counts = {"CRITICAL":0, "HIGH":0, "MEDIUM":0, "LOW":0, "UNKNOWN":0}
-                for res in results:
-                    for v in res.get('Vulnerabilities', []) or []:
-                        sev = (v.get('Severity') or 'UNKNOWN').upper()
-                        if sev not in counts: sev = 'UNKNOWN'
-                        counts[sev] += 1
-                f.write("## Summary\n\n")
-                for k in ["CRITICAL","HIGH","MEDIUM","LOW","UNKNOWN"]:
-                    f.write(f"- {k.title()}: {counts[k]}\n")
-            except Exception:
-                f.write("Scan completed. See JSON for details.\n")
+        cmd = [trivy_bin, "fs", "-q", "-f", "json", "--cache-dir", TRIVY_CACHE_DIR]
+        standalone = cmd + (["--skip-db-update"] if _TRIVY_DB_READY else []) + [repo_path]
+        if _TRIVY_SERVER_URL:
+            # Client of the shared server: the vulnerability DB is not loaded per scan
+            result = _run_to_file(cmd + ["--server", _TRIVY_SERVER_URL, repo_path], output_json)
+            if result.returncode != 0:
+                logging.warning(f"trivy client scan of {repo_name} failed ({result.stderr.strip()}); retrying standalone")
+                result = _run_to_file(standalone, output_json)
+        else:
+            result = _run_to_file(standalone, output_json)
+        if write_summary:
+            write_trivy_fs_summary(result, output_json, output_md)
         return result
     except Exception as e:
         with open(output_md, 'w') as f:
             f.write(f"Error running Trivy fs: {e}\n")
         return subprocess.CompletedProcess(args=['trivy','fs',repo_path], returncode=1, stdout="", stderr=str(e))
 
+def write_trivy_fs_summary(result: subprocess.CompletedProcess, output_json: str, output_md: str) -> None:
+    """Write the Markdown severity summary of a finished Trivy fs scan.
+
+    Separate from run_trivy_fs so a caller that scanned with write_summary=False can
+    summarise later, off the scanning thread.
+    """
+    # Assembled first and written in one call
+    parts = ["# Trivy Filesystem Scan\n\n"]
+    if result.returncode != 0:
+        # Trivy exits 0 whether or not it finds anything (no --exit-code), so a
+        # failure leaves no report worth parsing
+        parts.append(f"## Scan Failed\n\nTrivy exited with code {result.returncode}.\n\n```\n"
+                     f"{result.stderr.strip() or 'No error details available'}\n```\n")
+    else:
+        try:
+            # Normalise per distinct severity value, not per vulnerability
+            counts = dict.fromkeys(_SEVERITY_LEVELS, 0)
+            for sev, n in _trivy_severity_counts(output_json).items():
+                sev = (sev or 'UNKNOWN').upper()
+                counts[sev if sev in _SEVERITY_SET else 'UNKNOWN'] += n
+            parts.append("## Summary\n\n")
+            parts.extend(f"- {k.title()}: {counts[k]}\n" for k in _SEVERITY_LEVELS)
+        except Exception:
+            parts.append("Scan completed. See JSON for details.\n")
+    with open(output_md, 'w') as f:
+        f.write("".join(parts))
+
 if __name__ == "__main__":
     main()